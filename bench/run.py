@@ -0,0 +1,315 @@
+"""
+OverrideAudit benchmark suite.
+
+This generates a synthetic package tree (see tree.py) and times the core
+package scanning, override detection, diffing and report generation code paths
+against it. Results are appended to a JSON history file so that timings can be
+compared across commits; each run reports the change relative to the most
+recent prior run that used the same tree parameters.
+
+This runs outside of Sublime Text using a regular Python 3.8+ interpreter; the
+shim/ folder provides a minimal stand-in for the Sublime API:
+
+    python bench/run.py
+    python bench/run.py --shipped 100 --installed 300 --repeat 3
+    python bench/run.py --only package_list override_report
+"""
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+from datetime import datetime
+
+
+_BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+_ROOT_DIR = os.path.dirname(_BENCH_DIR)
+
+sys.path.insert(0, _BENCH_DIR)
+from tree import generate_tree
+
+
+###----------------------------------------------------------------------------
+
+
+def _load_plugin():
+    """
+    Import the OverrideAudit modules that are needed for the benchmark under
+    their package name, without executing the plugin entry point (which would
+    try to interact with a running Sublime). Returns the sublime module in use
+    along with a namespace of the loaded modules.
+    """
+    sys.path.insert(0, os.path.join(_BENCH_DIR, "shim"))
+    import sublime
+
+    for name, path in (("OverrideAudit", ""),
+                       ("OverrideAudit.lib", "lib"),
+                       ("OverrideAudit.src", "src"),
+                       ("OverrideAudit.src.commands", os.path.join("src", "commands"))):
+        if name not in sys.modules:
+            module = types.ModuleType(name)
+            module.__path__ = [os.path.join(_ROOT_DIR, path)]
+            sys.modules[name] = module
+
+    modules = types.SimpleNamespace(
+        packages=importlib.import_module("OverrideAudit.lib.packages"),
+        core=importlib.import_module("OverrideAudit.src.core"),
+        override_report=importlib.import_module("OverrideAudit.src.commands.override_report"),
+        diff_report=importlib.import_module("OverrideAudit.src.commands.diff_report"),
+        package_report=importlib.import_module("OverrideAudit.src.commands.package_report"))
+
+    return sublime, modules
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=_ROOT_DIR,
+            stderr=subprocess.DEVNULL).decode("utf-8").strip()
+    except Exception:
+        return None
+
+
+###----------------------------------------------------------------------------
+
+
+def _each_package(mod, callback):
+    """
+    Return a benchmark body that invokes the callback for each package in a
+    freshly created package list; the list creation is setup, not timed.
+    """
+    def setup():
+        return mod.packages.PackageList()
+
+    def body(pkg_list):
+        for _, pkg_info in pkg_list:
+            callback(pkg_info)
+
+    return setup, body
+
+
+def _diff_all(mod):
+    def setup():
+        pkg_list = mod.packages.PackageList()
+        return [(pkg_info, list(pkg_info.override_files()))
+                for _, pkg_info in pkg_list]
+
+    def body(items):
+        for pkg_info, overrides in items:
+            for override in overrides:
+                pkg_info.override_diff(override, 3)
+
+    return setup, body
+
+
+def _report(thread_class, **kwargs):
+    def body(_):
+        thread = thread_class(None, "Benchmark", None, **kwargs)
+        thread._process()
+
+    return None, body
+
+
+def _benchmarks(mod):
+    """
+    Return the ordered dictionary of named benchmarks; each is a tuple of a
+    setup function (or None) and the function to time, which is given the
+    result of the setup.
+    """
+    return {
+        "package_list": (None, lambda _: mod.packages.PackageList()),
+        "override_files": _each_package(mod, lambda p: p.override_files()),
+        "expired_override_files": _each_package(mod, lambda p: p.expired_override_files()),
+        "unknown_override_files": _each_package(mod, lambda p: p.unknown_override_files()),
+        "override_diff": _diff_all(mod),
+        "override_report": _report(mod.override_report.OverrideReportThread,
+                                   force_reuse=False, only_expired=False,
+                                   ignore_empty=False, exclude_unchanged=False),
+        "diff_report": _report(mod.diff_report.BulkDiffReportThread,
+                               package=None, force_reuse=False,
+                               exclude_unchanged=False),
+        "package_report": _report(mod.package_report.PackageReportThread,
+                                  force_reuse=False),
+    }
+
+
+def _time(setup, body, repeat):
+    samples = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            arg = setup() if setup is not None else None
+            start = time.perf_counter()
+            body(arg)
+            samples.append(time.perf_counter() - start)
+
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.mean(samples),
+        "repeat": repeat
+    }
+
+
+def _memory(mod):
+    """
+    Measure the memory retained by a fully populated package list (with
+    package contents and overrides collected) along with the peak memory
+    used while creating it.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        tracemalloc.start()
+        pkg_list = mod.packages.PackageList()
+        for _, pkg_info in pkg_list:
+            pkg_info.override_files()
+            pkg_info.expired_override_files()
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    del pkg_list
+    return {"retained_kb": retained // 1024, "peak_kb": peak // 1024}
+
+
+###----------------------------------------------------------------------------
+
+
+def _load_history(filename):
+    try:
+        with open(filename, "r", encoding="utf-8") as handle:
+            history = json.load(handle)
+        return history if isinstance(history, list) else []
+    except (FileNotFoundError, ValueError):
+        return []
+
+
+def _save_history(filename, history):
+    with open(filename, "w", encoding="utf-8") as handle:
+        json.dump(history, handle, indent=2)
+        handle.write("\n")
+
+
+def _previous_run(history, params):
+    for record in reversed(history):
+        if record.get("params") == params:
+            return record
+    return None
+
+
+def _report_results(results, memory, previous):
+    print("%-26s %12s %12s %10s" % ("benchmark", "min (ms)", "median (ms)", "change"))
+    for name, result in results.items():
+        change = ""
+        if previous is not None and name in previous["results"]:
+            before = previous["results"][name]["median"]
+            if before:
+                change = "%+.1f%%" % ((result["median"] - before) / before * 100)
+
+        print("%-26s %12.2f %12.2f %10s" % (name, result["min"] * 1000,
+                                            result["median"] * 1000, change))
+
+    if memory is not None:
+        print("\nPackage list memory: %d KB retained, %d KB peak" % (
+              memory["retained_kb"], memory["peak_kb"]))
+
+    if previous is not None:
+        print("\nCompared against %s (%s)" % (previous.get("commit"),
+                                              previous.get("timestamp")))
+
+
+###----------------------------------------------------------------------------
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="OverrideAudit benchmarks")
+    parser.add_argument("--root", help="folder to generate the tree in; a temporary folder is used and removed if not given")
+    parser.add_argument("--history", default=os.path.join(_BENCH_DIR, "history.json"))
+    parser.add_argument("--no-save", action="store_true", help="do not record results in the history file")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", nargs="*", help="names of the benchmarks to run")
+    parser.add_argument("--label", help="free form label stored with the results")
+    parser.add_argument("--no-memory", action="store_true", help="skip measuring package list memory use")
+
+    tree = parser.add_argument_group("tree generation")
+    tree.add_argument("--shipped", type=int, default=40)
+    tree.add_argument("--installed", type=int, default=40)
+    tree.add_argument("--complete", type=int, default=4)
+    tree.add_argument("--unpacked-only", type=int, default=10)
+    tree.add_argument("--entries", type=int, default=100)
+    tree.add_argument("--lines", type=int, default=60)
+    tree.add_argument("--unpacked", type=float, default=0.25)
+    tree.add_argument("--overrides", type=float, default=0.1)
+    tree.add_argument("--identical", type=float, default=0.4)
+    tree.add_argument("--modified", type=float, default=0.4)
+    tree.add_argument("--unknown", type=int, default=3)
+    tree.add_argument("--large", type=int, default=2)
+    tree.add_argument("--large-kb", type=int, default=256)
+    tree.add_argument("--seed", type=int, default=0)
+
+    args = parser.parse_args(argv)
+    params = {action.dest: getattr(args, action.dest)
+              for action in tree._group_actions}
+
+    root = args.root or tempfile.mkdtemp(prefix="oa_bench_")
+    try:
+        print("Generating tree in %s" % root)
+        data_dir, exe_dir, stats = generate_tree(root, **params)
+        print("Tree: %s\n" % ", ".join("%d %s" % (v, k) for k, v in stats.items()))
+
+        sublime, mod = _load_plugin()
+        sublime.set_paths(data_dir, exe_dir)
+        sublime.load_settings("Preferences.sublime-settings").set(
+            "binary_file_patterns", ["*.png"])
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            mod.core.loaded()
+            mod.core.unloaded()
+
+        benchmarks = _benchmarks(mod)
+        names = args.only or list(benchmarks)
+        unknown = [name for name in names if name not in benchmarks]
+        if unknown:
+            parser.error("unknown benchmarks: %s" % ", ".join(unknown))
+
+        results = {}
+        for name in names:
+            setup, body = benchmarks[name]
+            results[name] = _time(setup, body, args.repeat)
+
+        memory = None if args.no_memory else _memory(mod)
+
+    finally:
+        if args.root is None:
+            shutil.rmtree(root, ignore_errors=True)
+
+    history = _load_history(args.history)
+    _report_results(results, memory, _previous_run(history, params))
+
+    if not args.no_save:
+        history.append({
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "label": args.label,
+            "python": platform.python_version(),
+            "platform": sys.platform,
+            "params": params,
+            "stats": stats,
+            "results": results,
+            "memory": memory
+        })
+        _save_history(args.history, history)
+
+
+###----------------------------------------------------------------------------
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+A minimal stand-in for the Sublime Text API, used only by the benchmark suite
+so that the OverrideAudit internals can be timed against a synthetic package
+tree from a regular Python interpreter.
+
+Only the portions of the API that the package scanning and report generation
+code paths touch are implemented; everything that would interact with the UI
+is a no-op. The benchmark runner points the path functions at the generated
+tree by setting the module level _paths dictionary before use.
+"""
+import json
+import os
+import re
+import sys
+
+
+###----------------------------------------------------------------------------
+
+
+DIALOG_CANCEL = 0
+DIALOG_YES = 1
+DIALOG_NO = 2
+
+OP_EQUAL = 0
+OP_NOT_EQUAL = 1
+
+HOVER_TEXT = 1
+HIDE_ON_MOUSE_MOVE_AWAY = 2
+
+# Configured by the benchmark runner; see set_paths().
+_paths = {
+    "executable": "",
+    "packages": "",
+    "installed": "",
+    "cache": "",
+}
+
+# Settings objects, keyed by settings file name; the runner can pre-populate
+# these to control the settings the code under test sees.
+_settings = {}
+
+
+###----------------------------------------------------------------------------
+
+
+def set_paths(data_dir, exe_dir):
+    """
+    Point the path API endpoints at the given synthetic data directory (which
+    contains Packages/ and Installed Packages/) and executable directory
+    (which contains the shipped Packages/ folder).
+    """
+    _paths["executable"] = os.path.join(exe_dir, "sublime_text")
+    _paths["packages"] = os.path.join(data_dir, "Packages")
+    _paths["installed"] = os.path.join(data_dir, "Installed Packages")
+    _paths["cache"] = os.path.join(data_dir, "Cache")
+
+
+def platform():
+    return {"win32": "windows", "darwin": "osx"}.get(sys.platform, "linux")
+
+
+def arch():
+    return "x64"
+
+
+def version():
+    return "4200"
+
+
+def executable_path():
+    return _paths["executable"]
+
+
+def packages_path():
+    return _paths["packages"]
+
+
+def installed_packages_path():
+    return _paths["installed"]
+
+
+def cache_path():
+    return _paths["cache"]
+
+
+def set_timeout(callback, delay=0):
+    pass
+
+
+def set_timeout_async(callback, delay=0):
+    pass
+
+
+def active_window():
+    return None
+
+
+def windows():
+    return []
+
+
+def run_command(cmd, args=None):
+    pass
+
+
+def message_dialog(msg):
+    pass
+
+
+def yes_no_cancel_dialog(msg, yes_title="", no_title=""):
+    return DIALOG_YES
+
+
+def status_message(msg):
+    pass
+
+
+def find_resources(pattern):
+    return []
+
+
+def expand_variables(value, variables):
+    return value
+
+
+def decode_value(data):
+    # Sublime allows comments and trailing commas; the synthetic tree only
+    # generates strict JSON, so just strip line comments to be safe.
+    return json.loads(re.sub(r'^\s*//.*$', '', data, flags=re.MULTILINE))
+
+
+def encode_value(value, pretty=False):
+    return json.dumps(value, indent=4 if pretty else None)
+
+
+def load_settings(name):
+    if name not in _settings:
+        _settings[name] = Settings()
+    return _settings[name]
+
+
+def save_settings(name):
+    pass
+
+
+###----------------------------------------------------------------------------
+
+
+class Settings():
+    def __init__(self, values=None):
+        self._values = dict(values or {})
+        self._callbacks = {}
+
+    def get(self, key, default=None):
+        return self._values.get(key, default)
+
+    def has(self, key):
+        return key in self._values
+
+    def set(self, key, value):
+        self._values[key] = value
+        for callback in list(self._callbacks.values()):
+            callback()
+
+    def erase(self, key):
+        self._values.pop(key, None)
+
+    def to_dict(self):
+        return dict(self._values)
+
+    def add_on_change(self, tag, callback):
+        self._callbacks[tag] = callback
+
+    def clear_on_change(self, tag):
+        self._callbacks.pop(tag, None)
+
+
+class Region():
+    def __init__(self, a, b=None):
+        self.a = a
+        self.b = a if b is None else b
+
+    def begin(self):
+        return min(self.a, self.b)
+
+    def end(self):
+        return max(self.a, self.b)
+
+    def contains(self, other):
+        if isinstance(other, Region):
+            return self.begin() <= other.begin() and other.end() <= self.end()
+        return self.begin() <= other <= self.end()
+
+
+class View():
+    pass
+
+
+class Window():
+    pass
+
+
+###----------------------------------------------------------------------------
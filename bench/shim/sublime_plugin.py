@@ -0,0 +1,33 @@
+"""
+A minimal stand-in for the sublime_plugin module; see sublime.py in this
+folder for details.
+"""
+
+
+###----------------------------------------------------------------------------
+
+
+class EventListener():
+    pass
+
+
+class ViewEventListener():
+    def __init__(self, view):
+        self.view = view
+
+
+class TextCommand():
+    def __init__(self, view):
+        self.view = view
+
+
+class WindowCommand():
+    def __init__(self, window):
+        self.window = window
+
+
+class ApplicationCommand():
+    pass
+
+
+###----------------------------------------------------------------------------
@@ -0,0 +1,236 @@
+"""
+Generate a synthetic Sublime Text package tree for benchmarking.
+
+The generated tree mimics the three places that packages can live:
+
+    <root>/exe/Packages/*.sublime-package            (shipped packages)
+    <root>/data/Installed Packages/*.sublime-package (installed packages)
+    <root>/data/Packages/<name>/                     (unpacked packages)
+
+A fraction of the packed packages also get an unpacked directory that holds
+overrides; those overrides are split between files that are identical to the
+packed version, files that are modified and files that are expired (older than
+the packed entry). Unknown files (files that don't exist in the packed package)
+and large syntax/JSON resources are also generated so that the diff paths see
+realistic input sizes.
+"""
+import json
+import os
+import random
+import time
+import zipfile
+
+
+###----------------------------------------------------------------------------
+
+
+# The timestamp used for all entries inside of generated sublime-package files;
+# overrides that should be expired are given a modification time before this,
+# all others get a time after it.
+_ZIP_DATE = (2024, 1, 1, 12, 0, 0)
+_ZIP_TIME = time.mktime(_ZIP_DATE + (0, 0, -1))
+_EXPIRED_TIME = _ZIP_TIME - 86400 * 30
+_FRESH_TIME = _ZIP_TIME + 86400 * 30
+
+# File extensions used for generated package entries, in rotation.
+_EXTENSIONS = [
+    ".sublime-syntax", ".sublime-settings", ".sublime-keymap",
+    ".sublime-commands", ".tmPreferences", ".sublime-completions",
+    ".md", ".png"
+]
+
+
+###----------------------------------------------------------------------------
+
+
+def _text(rng, lines):
+    """
+    Generate some number of lines of pseudo random text that looks vaguely
+    like a syntax definition.
+    """
+    words = ["match", "scope", "push", "pop", "captures", "include",
+             "meta_scope", "keyword", "string", "comment", "constant"]
+    result = []
+    for index in range(lines):
+        indent = "  " * (index % 4)
+        result.append("%s%s: '%s.%d'\n" % (indent, rng.choice(words),
+                                           rng.choice(words), rng.randrange(1000)))
+    return "".join(result)
+
+
+def _json(rng, size_kb):
+    """
+    Generate a JSON document of roughly the given size in kilobytes.
+    """
+    data = {}
+    size = 0
+    while size < size_kb * 1024:
+        value = [rng.randrange(100000) for _ in range(16)]
+        data["key_%d" % len(data)] = value
+        size += len(json.dumps(value)) + 16
+    return json.dumps(data, indent=4)
+
+
+def _entry_content(rng, name, lines):
+    if name.endswith(".png"):
+        return bytes(rng.getrandbits(8) for _ in range(512))
+    return _text(rng, lines).encode("utf-8")
+
+
+def _modify(content):
+    """
+    Return a modified version of the given text content; the modification is
+    a handful of changed lines spread throughout the file, so the diff has
+    several hunks.
+    """
+    lines = content.decode("utf-8").splitlines(True)
+    for index in range(0, len(lines), max(1, len(lines) // 4)):
+        lines[index] = "# modified\n" + lines[index]
+    return "".join(lines).encode("utf-8")
+
+
+def _write_package(filename, entries):
+    with zipfile.ZipFile(filename, "w", zipfile.ZIP_DEFLATED) as zFile:
+        for name, content in entries.items():
+            info = zipfile.ZipInfo(name, date_time=_ZIP_DATE)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            zFile.writestr(info, content)
+
+
+def _write_file(filename, content, mtime):
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    with open(filename, "wb") as handle:
+        handle.write(content)
+    os.utime(filename, (mtime, mtime))
+
+
+def _package_entries(rng, index, entries, lines, large, large_kb):
+    """
+    Generate the dictionary of entries for a single package, mapping the
+    entry name to its content.
+    """
+    result = {"plugin_%d.py" % index: _text(rng, lines).encode("utf-8")}
+    for entry in range(entries - 1 - large):
+        ext = _EXTENSIONS[entry % len(_EXTENSIONS)]
+        folder = "" if entry % 3 == 0 else "sub_%d/" % (entry % 5)
+        name = "%sfile_%d%s" % (folder, entry, ext)
+        result[name] = _entry_content(rng, name, lines)
+
+    for entry in range(large):
+        if entry % 2:
+            result["large/Large_%d.sublime-syntax" % entry] = _text(
+                rng, large_kb * 1024 // 32).encode("utf-8")
+        else:
+            result["large/Large_%d.json" % entry] = _json(rng, large_kb).encode("utf-8")
+
+    return result
+
+
+def _unpack_overrides(rng, pkg_dir, entries, overrides, identical, modified,
+                      unknown):
+    """
+    Create an unpacked package directory with overrides of some of the given
+    packed entries, split by the provided fractions. Anything not identical or
+    modified is expired. The number of each type created is returned.
+    """
+    counts = {"identical": 0, "modified": 0, "expired": 0, "unknown": 0}
+
+    names = sorted(entries)
+    rng.shuffle(names)
+    names = names[:max(1, int(len(names) * overrides))]
+
+    for position, name in enumerate(names):
+        content = entries[name]
+        fraction = position / len(names)
+        filename = os.path.join(pkg_dir, *name.split("/"))
+
+        if fraction < identical:
+            _write_file(filename, content, _FRESH_TIME)
+            counts["identical"] += 1
+        elif fraction < identical + modified and not name.endswith(".png"):
+            _write_file(filename, _modify(content), _FRESH_TIME)
+            counts["modified"] += 1
+        else:
+            _write_file(filename, content, _EXPIRED_TIME)
+            counts["expired"] += 1
+
+    for entry in range(unknown):
+        filename = os.path.join(pkg_dir, "unknown", "extra_%d.txt" % entry)
+        _write_file(filename, _text(rng, 10).encode("utf-8"), _FRESH_TIME)
+        counts["unknown"] += 1
+
+    return counts
+
+
+def generate_tree(root, shipped=40, installed=40, complete=4, unpacked_only=10,
+                  entries=100, lines=60, unpacked=0.25, overrides=0.1,
+                  identical=0.4, modified=0.4, unknown=3, large=2,
+                  large_kb=256, seed=0):
+    """
+    Generate a synthetic package tree under the given root folder and return a
+    tuple of (data_dir, exe_dir, stats).
+
+    shipped and installed are the number of packages of each type, complete is
+    how many of the installed packages share a name with a shipped package
+    (complete overrides) and unpacked_only is the number of packages that only
+    exist as a folder.
+
+    Each packed package has the given number of entries with roughly the
+    given number of lines each, plus a number of large syntax/JSON files of
+    the given size. The unpacked fraction of packed packages get an override
+    folder where the overrides fraction of entries are overridden and split
+    into identical, modified and expired (the remainder) overrides. Each of
+    those also gets a number of unknown files.
+    """
+    rng = random.Random(seed)
+
+    exe_dir = os.path.join(root, "exe")
+    data_dir = os.path.join(root, "data")
+    shipped_dir = os.path.join(exe_dir, "Packages")
+    installed_dir = os.path.join(data_dir, "Installed Packages")
+    packages_dir = os.path.join(data_dir, "Packages")
+
+    for path in (shipped_dir, installed_dir, packages_dir):
+        os.makedirs(path, exist_ok=True)
+
+    os.makedirs(os.path.join(packages_dir, "User"), exist_ok=True)
+
+    stats = {"identical": 0, "modified": 0, "expired": 0, "unknown": 0,
+             "packages": 0}
+
+    names = ["Shipped%03d" % n for n in range(shipped)]
+    names += ["Shipped%03d" % n for n in range(min(complete, shipped))]
+    names += ["Installed%03d" % n for n in range(installed - min(complete, shipped))]
+
+    for index, name in enumerate(names):
+        is_shipped = index < shipped
+        pkg_entries = _package_entries(rng, index, entries, lines, large, large_kb)
+        if not is_shipped:
+            pkg_entries["package-metadata.json"] = json.dumps({
+                "version": "1.0.%d" % index,
+                "description": "Synthetic package %s" % name,
+                "dependencies": []
+            }).encode("utf-8")
+
+        target = shipped_dir if is_shipped else installed_dir
+        _write_package(os.path.join(target, name + ".sublime-package"), pkg_entries)
+        stats["packages"] += 1
+
+        pkg_dir = os.path.join(packages_dir, name)
+        if rng.random() < unpacked and not os.path.isdir(pkg_dir):
+            counts = _unpack_overrides(rng, pkg_dir, pkg_entries, overrides,
+                                       identical, modified, unknown)
+            for key, value in counts.items():
+                stats[key] += value
+
+    for index in range(unpacked_only):
+        pkg_dir = os.path.join(packages_dir, "Unpacked%03d" % index)
+        for entry in range(10):
+            _write_file(os.path.join(pkg_dir, "file_%d.txt" % entry),
+                        _text(rng, lines).encode("utf-8"), _FRESH_TIME)
+        stats["packages"] += 1
+
+    return (data_dir, exe_dir, stats)
+
+
+###----------------------------------------------------------------------------
@@ -1,17 +1,33 @@
 from ..override_audit import reload
 
-reload("lib", ["output_view", "packages", "metadata", "threads", "utils"])
+# Modules are reloaded in dependency order, so that modules which import from
+# another module bind to the reloaded version of it.
+reload("lib", ["output_view", "utils", "diff", "metadata", "packages",
+               "scheduler", "threads", "export", "search", "snapshot",
+               "report_cache"])
 
 from . import output_view
 from . import packages
 from . import metadata
+from . import scheduler
 from . import threads
 from . import utils
+from . import export
+from . import search
+from . import snapshot
+from . import report_cache
+from . import diff
 
 __all__ = [
     "output_view",
     "packages",
     "metadata",
+    "scheduler",
     "threads",
-    "utils"
+    "utils",
+    "export",
+    "search",
+    "snapshot",
+    "report_cache",
+    "diff"
 ]
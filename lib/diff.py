@@ -0,0 +1,325 @@
+from collections import OrderedDict
+from threading import Lock
+import sys
+
+
+###----------------------------------------------------------------------------
+
+
+def _format_range(start, stop):
+    """
+    Format a range of lines in the way that a unified diff hunk header does;
+    start is 0 based and stop is exclusive.
+    """
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return "%d" % beginning
+
+    if not length:
+        beginning -= 1
+
+    return "%d,%d" % (beginning, length)
+
+
+def diff_opcodes(a, b, trim=False):
+    """
+    Return the list of opcodes (as returned by SequenceMatcher.get_opcodes())
+    that turn the list of lines in a into the list of lines in b.
+
+    When trim is True, the lines that the two lists have in common at the start
+    and end are excluded from the comparison; this makes the time taken depend
+    only on the size of the changed region rather than the whole file, but may
+    produce a slightly different (though still correct) set of changes.
+    """
+    # This is only imported when a diff is needed, to speed plugin loading.
+    from difflib import SequenceMatcher
+
+    if not trim:
+        return SequenceMatcher(None, a, b).get_opcodes()
+
+    limit = min(len(a), len(b))
+    head = 0
+    while head < limit and a[head] == b[head]:
+        head += 1
+
+    tail = 0
+    while tail < limit - head and a[-1 - tail] == b[-1 - tail]:
+        tail += 1
+
+    opcodes = []
+    if head:
+        opcodes.append(("equal", 0, head, 0, head))
+
+    middle = SequenceMatcher(None, a[head:len(a) - tail], b[head:len(b) - tail])
+    for tag, i1, i2, j1, j2 in middle.get_opcodes():
+        opcodes.append((tag, i1 + head, i2 + head, j1 + head, j2 + head))
+
+    if tail:
+        opcodes.append(("equal", len(a) - tail, len(a), len(b) - tail, len(b)))
+
+    return opcodes
+
+
+def group_opcodes(opcodes, context_lines=3):
+    """
+    Group the provided list of opcodes into hunks with up to context_lines
+    lines of context on either side, exactly as the unified diff output of
+    difflib does; returns a list of lists of opcodes.
+    """
+    codes = list(opcodes)
+    if not codes:
+        codes = [("equal", 0, 1, 0, 1)]
+
+    # Trim context from the start and end of the whole diff.
+    if codes[0][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - context_lines), i2, max(j1, j2 - context_lines), j2
+
+    if codes[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + context_lines), j1, min(j2, j1 + context_lines)
+
+    # Split the diff wherever there is a long enough run of unchanged lines.
+    span = context_lines + context_lines
+    groups = []
+    group = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == "equal" and i2 - i1 > span:
+            group.append((tag, i1, min(i2, i1 + context_lines),
+                          j1, min(j2, j1 + context_lines)))
+            groups.append(group)
+            group = []
+            i1, j1 = max(i1, i2 - context_lines), max(j1, j2 - context_lines)
+
+        group.append((tag, i1, i2, j1, j2))
+
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        groups.append(group)
+
+    return groups
+
+
+###----------------------------------------------------------------------------
+
+
+class DiffHunk():
+    """
+    A single hunk of a unified diff, represented by its group of opcodes. The
+    lines in the hunk are only generated when they are asked for.
+    """
+    __slots__ = ("group", "removed", "added")
+
+    def __init__(self, group):
+        self.group = group
+        self.removed = sum(i2 - i1 for tag, i1, i2, _, _ in group if tag != "equal")
+        self.added = sum(j2 - j1 for tag, _, _, j1, j2 in group if tag != "equal")
+
+    def header(self):
+        """
+        Return the unified diff range line for this hunk (without a newline).
+        """
+        first, last = self.group[0], self.group[-1]
+        return "@@ -%s +%s @@" % (_format_range(first[1], last[2]),
+                                  _format_range(first[3], last[4]))
+
+    def lines(self, a, b):
+        """
+        Return the lines in the body of this hunk as a list, given the lists
+        of lines that were compared to create it. The lines retain whatever
+        line endings they had in the original lists.
+        """
+        result = []
+        for tag, i1, i2, j1, j2 in self.group:
+            if tag == "equal":
+                result.extend(" " + line for line in a[i1:i2])
+                continue
+
+            if tag in ("replace", "delete"):
+                result.extend("-" + line for line in a[i1:i2])
+            if tag in ("replace", "insert"):
+                result.extend("+" + line for line in b[j1:j2])
+
+        return result
+
+
+###----------------------------------------------------------------------------
+
+
+# The approximate amount of memory used by each line of a file on top of its
+# characters (the string object and the list slot that refers to it), and by
+# each opcode (the tuple, its list slot and its indexes).
+_LINE_OVERHEAD = sys.getsizeof("") + 8
+_OPCODE_OVERHEAD = sys.getsizeof((None,) * 5) + 8 + 4 * sys.getsizeof(1 << 10)
+
+
+class DiffOpcodes():
+    """
+    The result of comparing the packed version of a file with its override,
+    held as the list of opcodes that turn one into the other along with the
+    lines of both files. Any number of unified diffs (with any amount of
+    context) as well as emptiness checks and change statistics can be
+    produced from it without reading or comparing the files again.
+
+    packed and unpacked are tuples of the lines, display name and modification
+    time of the two files that were compared; trimmed indicates that the lines
+    the files have in common at their start and end were not compared (see
+    diff_opcodes()).
+    """
+    __slots__ = ("packed", "unpacked", "opcodes", "trimmed", "size")
+
+    def __init__(self, packed, unpacked, trimmed=False):
+        self.packed = packed
+        self.unpacked = unpacked
+        self.opcodes = diff_opcodes(packed[0], unpacked[0], trimmed)
+        self.trimmed = trimmed
+
+        # The approximate amount of memory that the lines and opcodes take up.
+        self.size = (sum(len(line) for line in packed[0]) +
+                     sum(len(line) for line in unpacked[0]) +
+                     (len(packed[0]) + len(unpacked[0])) * _LINE_OVERHEAD +
+                     len(self.opcodes) * _OPCODE_OVERHEAD)
+
+    @property
+    def is_empty(self):
+        return all(code[0] == "equal" for code in self.opcodes)
+
+    def stats(self):
+        """
+        Return a tuple of the number of lines removed and added.
+        """
+        removed = sum(i2 - i1 for tag, i1, i2, _, _ in self.opcodes if tag != "equal")
+        added = sum(j2 - j1 for tag, _, _, j1, j2 in self.opcodes if tag != "equal")
+
+        return (removed, added)
+
+    def hunks(self, context_lines):
+        """
+        Return a list of the hunks in the diff with the given number of lines
+        of context.
+        """
+        return [DiffHunk(group) for group in group_opcodes(self.opcodes, context_lines)]
+
+    def unified(self, context_lines, indent=""):
+        """
+        Return a unified diff with the given number of lines of context, with
+        every line prefixed by indent; this is the same as the output of the
+        unified diff of difflib. The result is empty if there are no changes.
+        """
+        if self.is_empty:
+            return ""
+
+        result = ["--- %s\t%s\n" % self.packed[1:], "+++ %s\t%s\n" % self.unpacked[1:]]
+        for hunk in self.hunks(context_lines):
+            result.append(hunk.header() + "\n")
+            result.extend(hunk.lines(self.packed[0], self.unpacked[0]))
+
+        return "".join(indent + line for line in result)
+
+
+###----------------------------------------------------------------------------
+
+
+class OverrideDiffHunks():
+    """
+    The result of diffing an override that is too large to display as a
+    single diff; the diff is broken into a list of hunks whose bodies can be
+    generated individually as they are needed.
+
+    The diff is generated from the provided DiffOpcodes instance. Like
+    OverrideDiffResult, hdr is the header of the diff, result is the diff as
+    text and is_empty indicates if there are no changes.
+    """
+    is_binary = False
+
+    def __init__(self, opcodes, context_lines):
+        self.opcodes = opcodes
+        self.context_lines = context_lines
+
+        self.hdr =  "--- %s    %s\n" % opcodes.packed[1:]
+        self.hdr += "+++ %s    %s\n" % opcodes.unpacked[1:]
+
+        self.hunks = opcodes.hunks(context_lines)
+        self.is_empty = not self.hunks
+        self.removed, self.added = opcodes.stats()
+
+    @property
+    def result(self):
+        """
+        The complete diff as text, in the same form as a unified diff.
+        """
+        return self.opcodes.unified(self.context_lines)
+
+    def hunk_lines(self, index):
+        """
+        Return the lines in the body of the hunk with the given index.
+        """
+        return self.hunks[index].lines(self.opcodes.packed[0],
+                                       self.opcodes.unpacked[0])
+
+
+###----------------------------------------------------------------------------
+
+
+class DiffCache():
+    """
+    A cache of the DiffOpcodes for recently diffed overrides, keyed by package
+    and override name and whether the comparison was trimmed. Each entry is
+    stored along with a fingerprint of the two files that were compared, and
+    is only returned when the fingerprint still matches.
+
+    The least recently used entries are discarded when there are more than
+    max_entries of them or the approximate memory used by their lines and
+    opcodes exceeds max_size.
+    """
+    def __init__(self, max_entries=256, max_size=32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_size = max_size
+
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+
+    def get(self, key, fingerprint):
+        """
+        Return the cached DiffOpcodes for the given key if its fingerprint
+        matches, or None otherwise.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != fingerprint:
+                return None
+
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key, fingerprint, opcodes):
+        """
+        Add the DiffOpcodes for the given key and fingerprint to the cache,
+        replacing any existing entry.
+        """
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (fingerprint, opcodes)
+            self._size += opcodes.size
+
+            while self._entries and (len(self._entries) > self.max_entries or
+                                     self._size > self.max_size):
+                self._discard(next(iter(self._entries)))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[1].size
+
+
+# The cache used for all override diffs; see PackageInfo.override_opcodes().
+diff_cache = DiffCache()
+
+
+###----------------------------------------------------------------------------
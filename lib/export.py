@@ -0,0 +1,80 @@
+import os
+import json
+from datetime import datetime
+
+
+###----------------------------------------------------------------------------
+
+
+def diff_hunks(diff_text):
+    """
+    Given the text of a unified diff (as generated by PackageInfo's
+    override_diff() with no indent), return back a list of the hunks in the
+    diff. Each hunk is a dictionary with the hunk header and a list of the
+    lines in the hunk, without line endings.
+
+    The file header lines at the top of the diff are not included.
+    """
+    hunks = []
+    for line in diff_text.splitlines():
+        if line.startswith("@@"):
+            hunks.append({"header": line, "lines": []})
+        elif hunks:
+            hunks[-1]["lines"].append(line)
+
+    return hunks
+
+
+###----------------------------------------------------------------------------
+
+
+class ReportExporter():
+    """
+    Stream the records that make up a report to a file in NDJSON format (one
+    JSON object per line) as they are produced, rather than collecting the
+    whole report in memory first.
+
+    Every record is a dictionary with a "type" key that says what it is; the
+    first record is always of type "report" and the last is always of type
+    "end", which carries the number of records written in between. Each
+    record is flushed as it is written so that external tools can consume the
+    file while the report is still being generated.
+    """
+    def __init__(self, filename):
+        self.filename = filename
+        self.records = 0
+        self.handle = None
+
+    def __enter__(self):
+        os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+        self.handle = open(self.filename, "w", encoding="utf-8", newline="\n")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.handle.write(json.dumps({"type": "end", "records": self.records}) + "\n")
+
+        self.handle.close()
+        self.handle = None
+
+    def start(self, report, **fields):
+        """
+        Write the record that starts the report, which says what kind of report
+        this is and when it was generated.
+        """
+        generated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._write(dict(type="report", report=report, generated=generated, **fields))
+
+    def write(self, record_type, **fields):
+        """
+        Write a single record of the given type with the provided fields.
+        """
+        self.records += 1
+        self._write(dict(type=record_type, **fields))
+
+    def _write(self, record):
+        self.handle.write(json.dumps(record) + "\n")
+        self.handle.flush()
+
+
+###----------------------------------------------------------------------------
@@ -2,18 +2,25 @@ import sublime
 import io
 import os
 import re
+import sys
+import json
+import threading
 import zipfile
+import zlib
 import codecs
 from datetime import datetime
-import difflib
-from collections import OrderedDict
+from array import array
+from collections import OrderedDict, namedtuple
 from collections.abc import MutableSet
+from functools import lru_cache
 from glob import glob, iglob
 import fnmatch
 
 from sys import version_info as host_version
 
 from .metadata import default_metadata
+from .utils import settings_snapshot
+from .diff import DiffOpcodes, OverrideDiffHunks, diff_cache
 
 
 ###----------------------------------------------------------------------------
@@ -76,7 +83,8 @@ def _python_host_versions():
 
     The first time this is called, the full information is gathered; after
     this point, the data from the cached data from the initial call is
-    returned back.
+    returned back. Which plugin hosts are disabled is determined from the
+    preferences frozen by freeze_python_host_versions(), if it was called.
     """
     if not hasattr(_python_host_versions, 'versions'):
         versions = [f"{host_version.major}.{host_version.minor}"]
@@ -97,7 +105,9 @@ def _python_host_versions():
             except:
                 pass
 
-        settings = sublime.load_settings("Preferences.sublime-settings").to_dict()
+        settings = _python_host_versions.prefs
+        if settings is None:
+            settings = settings_snapshot().prefs
 
         for key in [k for k in settings if k.startswith("disable_plugin_host_")]:
             version = key[len("disable_plugin_host_"):]
@@ -109,6 +119,26 @@ def _python_host_versions():
 
     return _python_host_versions.versions
 
+_python_host_versions.prefs = None
+
+
+def freeze_python_host_versions(snapshot=None):
+    """
+    Freeze the preferences that determine which plugin hosts are active, so
+    that the versions reported by _python_host_versions() are based on the
+    preferences as they were when this was called (at package load time),
+    using the provided settings snapshot or the current one.
+
+    This way we don't need to worry about someone changing settings before the
+    first call to anything OverrideAudit related without restarting Sublime
+    first, which might make us report an incorrect version. Only the settings
+    are captured here; scanning for the plugin hosts is deferred until the
+    versions are first needed.
+    """
+    snapshot = snapshot or settings_snapshot()
+    _python_host_versions.prefs = {key: value for key, value in snapshot.prefs.items()
+                                   if key.startswith("disable_plugin_host_")}
+
 
 def _shipped_packages_path():
     """
@@ -142,6 +172,56 @@ def _pkg_scan(path, filename, recurse=False):
     return None
 
 
+@lru_cache(maxsize=32)
+def glob_matcher(patterns):
+    """
+    Given a tuple of file glob patterns, return a single compiled regular
+    expression that matches a file name (via match()) when any one of the
+    patterns would match it with fnmatch.fnmatch(); names to be matched must
+    be passed through os.path.normcase() first. None is returned if there are
+    no patterns.
+
+    The result is cached, so each distinct set of patterns is only compiled
+    once no matter how many packages or reports use it.
+    """
+    if not patterns:
+        return None
+
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(pattern))
+                               for pattern in patterns))
+
+
+# The number of bytes at the start of a file that are examined to determine if
+# it contains binary data; see _is_binary_data().
+_SNIFF_SIZE = 4096
+
+# The verdicts of previous checks of packed resources for binary content, keyed
+# by the package file and the CRC of the entry in it; only the most recently
+# used verdicts are kept. See _packed_is_binary().
+_binary_verdicts = OrderedDict()
+_binary_verdicts_lock = threading.Lock()
+_MAX_BINARY_VERDICTS = 4096
+
+
+def _is_binary_data(data):
+    """
+    Given the bytes at the start of a file, return an indication of whether
+    the file contains binary data, which is the case if there are any NUL
+    bytes or if the data is not valid UTF-8. Since the data may stop part way
+    through a multi-byte character, an incomplete character at the end is not
+    considered to be invalid.
+    """
+    if b"\0" in data:
+        return True
+
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(data, final=False)
+    except UnicodeDecodeError:
+        return True
+
+    return False
+
+
 def _is_compatible_version(version_range):
     """
     This code is taken from Package Control and is used to match a version
@@ -282,6 +362,406 @@ def check_potential_override(filename, deep=False, get_content=False):
 ###----------------------------------------------------------------------------
 
 
+def _package_names(location, packed=True, recurse=False):
+    """
+    Return a set of the names of the packages that exist in the given location,
+    gathered only from the directory listing; packed controls if the listing
+    is of sublime-package files or of unpacked package folders. On case
+    insensitive systems the names are lower cased.
+    """
+    names = set()
+    for (path, dirs, files) in os.walk(location, followlinks=True):
+        if packed:
+            names.update(_wrap(os.path.splitext(name)[0]) for name in files
+                         if name.endswith(".sublime-package"))
+        else:
+            names.update(_wrap(name) for name in dirs)
+
+        if not recurse:
+            break
+
+    return names
+
+
+def override_candidates(complete=True):
+    """
+    Return the set of names of packages that could possibly contain overrides,
+    determined from the listings of the package folders without examining any
+    of the packages themselves; this is generally a small fraction of all
+    packages, and can be given to PackageList to only collect those.
+
+    Simple overrides require that a package be both packed and unpacked. When
+    complete is True, packages that are both shipped and installed (complete
+    overrides) are also included.
+    """
+    shipped = _package_names(_shipped_packages_path())
+    installed = _package_names(sublime.installed_packages_path(), recurse=True)
+    unpacked = _package_names(sublime.packages_path(), packed=False)
+
+    result = unpacked & (shipped | installed)
+    if complete:
+        result |= shipped & installed
+
+    return result
+
+
+# The packed layers of each package that has been examined, keyed by package
+# name. Each entry is a tuple of the stamp of the package files (see
+# _package_stamp()) and a dictionary that maps the (wrapped) name of every
+# resource in the shipped or installed package to a tuple of the resource
+# name and its installed and shipped ResourceLayer (either of which may be
+# None); see PackageInfo.packed_layers().
+_provenance_index = {}
+
+
+# Where the shipped and installed sublime-package file of each package lives,
+# keyed by the (wrapped) package name, and the modification time of every
+# folder that was scanned to find them; see _package_files().
+_package_locations = None
+_package_locations_lock = threading.Lock()
+
+
+def _scan_package_files():
+    """
+    Find the shipped and installed sublime-package files of all packages the
+    same way that PackageInfo finds them, so that installed packages in
+    subfolders of Installed Packages are seen. Returns a tuple of the folder
+    modification times and the package locations.
+    """
+    folders = {}
+    locations = {}
+    for index, location in enumerate((_shipped_packages_path(),
+                                      sublime.installed_packages_path())):
+        folders[location] = _folder_mtime(location)
+        for (path, _, files) in os.walk(location, followlinks=True):
+            folders[path] = _folder_mtime(path)
+            for name in files:
+                if name.endswith(".sublime-package"):
+                    entry = locations.setdefault(_wrap(name[:-16]), [None, None])
+                    if entry[index] is None:
+                        entry[index] = os.path.join(path, name)
+
+            # Only installed packages can be in subfolders.
+            if index == 0:
+                break
+
+    return (folders, locations)
+
+
+def _folder_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _package_files(pkg_name):
+    """
+    Return a list of the shipped and installed sublime-package files of the
+    given package, either of which may be None. The locations of all package
+    files are cached, and only found again when one of the folders that they
+    were found in changes, which takes a stat of each folder.
+    """
+    global _package_locations
+
+    with _package_locations_lock:
+        if _package_locations is None or any(
+                _folder_mtime(path) != mtime
+                for path, mtime in _package_locations[0].items()):
+            _package_locations = _scan_package_files()
+
+        return _package_locations[1].get(_wrap(pkg_name), [None, None])
+
+
+def _package_stamp(pkg_name):
+    """
+    Return a tuple that describes the state of the shipped and installed
+    sublime-package files for the given package; the tuple changes whenever
+    either file is added, removed or modified.
+    """
+    stamp = []
+    for filename in _package_files(pkg_name):
+        try:
+            stamp.append(None if filename is None else os.path.getmtime(filename))
+        except OSError:
+            stamp.append(None)
+
+    return tuple(stamp)
+
+
+def file_crc(filename):
+    """
+    Return the CRC-32 of the content of the given file, using the same
+    algorithm that zip files use for their entries so that the two can be
+    compared directly. Returns None if the file cannot be read.
+    """
+    crc = 0
+    try:
+        with open(filename, "rb") as handle:
+            for chunk in iter(lambda: handle.read(65536), b""):
+                crc = zlib.crc32(chunk, crc)
+
+        return crc
+
+    except OSError:
+        return None
+
+
+def _packed_layers(pkg_name, pkg_info=None):
+    """
+    Return the dictionary of the packed layers of the given package from the
+    provenance index, gathering them if they're not known or the package files
+    have changed. The stamp of the package is returned as well.
+    """
+    if pkg_info is not None:
+        stamp = (pkg_info.shipped_mtime, pkg_info.installed_mtime)
+    else:
+        stamp = _package_stamp(pkg_name)
+
+    entry = _provenance_index.get(pkg_name)
+    if entry is None or entry[0] != stamp:
+        pkg_info = pkg_info or PackageInfo(pkg_name)
+        entry = _provenance_index[pkg_name] = (stamp, pkg_info.packed_layers())
+
+    return entry
+
+
+# The CRC of the unpacked files that have been compared against their packed
+# layers, keyed by path. Each entry is a tuple of the size and modification
+# time of the file when its CRC was calculated, and the CRC; only the most
+# recently used entries are kept.
+_unpacked_crcs = OrderedDict()
+_unpacked_crcs_lock = threading.Lock()
+_MAX_UNPACKED_CRCS = 4096
+
+
+def _unpacked_crc(path, stat):
+    """
+    Return the CRC of the unpacked file at the given path, whose os.stat()
+    result is provided. The file is only read if its size or modification
+    time is not the same as the last time its CRC was calculated.
+    """
+    key = (stat.st_size, stat.st_mtime_ns)
+    with _unpacked_crcs_lock:
+        entry = _unpacked_crcs.get(path)
+        if entry is not None and entry[0] == key:
+            _unpacked_crcs.move_to_end(path)
+            return entry[1]
+
+    crc = file_crc(path)
+    with _unpacked_crcs_lock:
+        _unpacked_crcs[path] = (key, crc)
+        while len(_unpacked_crcs) > _MAX_UNPACKED_CRCS:
+            _unpacked_crcs.popitem(last=False)
+
+    return crc
+
+
+def _resolve_provenance(pkg_name, packed, stamp, name, unpacked_path):
+    """
+    Given the packed layers of a resource (which may be None) and the path to
+    where its unpacked copy would be, return the ResourceProvenance for it, or
+    None if no layer provides it.
+    """
+    name, installed, shipped = packed or (name, None, None)
+
+    unpacked = None
+    try:
+        stat = os.stat(unpacked_path)
+        crc = None if packed is None else _unpacked_crc(unpacked_path, stat)
+        unpacked = ResourceLayer("unpacked", stat.st_size, crc)
+    except OSError:
+        pass
+
+    layers = [layer for layer in (unpacked, installed, shipped) if layer is not None]
+    if not layers:
+        return None
+
+    # An installed package completely replaces a shipped package of the same
+    # name, so resources only in the shipped package are never used.
+    if unpacked is not None:
+        winner = unpacked
+    elif stamp[1] is not None:
+        winner = installed
+    else:
+        winner = shipped
+
+    return ResourceProvenance("Packages/%s/%s" % (pkg_name, name), layers, winner)
+
+
+def resource_provenance(resource):
+    """
+    Given a resource name in the form Packages/<pkg>/<path>, return back a
+    ResourceProvenance that says which layers provide that resource and which
+    one of them Sublime uses, or None if the resource doesn't exist.
+
+    The packed layers of a package are gathered the first time the package is
+    looked at and only gathered again when its package files change, and the
+    CRC of an unpacked copy is only calculated again when the file changes, so
+    each lookup is a dictionary lookup and a few file stats.
+    """
+    parts = resource.split("/", 2)
+    if len(parts) != 3 or parts[0] != "Packages":
+        return None
+
+    pkg_name, name = parts[1], parts[2]
+    stamp, layers = _packed_layers(pkg_name)
+
+    return _resolve_provenance(pkg_name, layers.get(_wrap(name)), stamp, name,
+                               os.path.join(sublime.packages_path(), pkg_name, name))
+
+
+def packed_resource_exists(resource):
+    """
+    Given a resource name in the form Packages/<pkg>/<path>, determine if that
+    resource is contained in the sublime-package file that Sublime uses for
+    the package. Like resource_provenance(), this is backed by the provenance
+    index, so each check is a dictionary lookup and a couple of file stats.
+    """
+    parts = resource.split("/", 2)
+    if len(parts) != 3 or parts[0] != "Packages":
+        return False
+
+    stamp, layers = _packed_layers(parts[1])
+    packed = layers.get(_wrap(parts[2]))
+    if packed is None:
+        return False
+
+    return (packed[1] if stamp[1] is not None else packed[2]) is not None
+
+
+def provenance_map(pkg_list):
+    """
+    Build a provenance map for all of the packages in the given PackageList in
+    a single pass, returning a dictionary that maps every resource in any
+    layer of any of the packages (in the form Packages/<pkg>/<path>) to its
+    ResourceProvenance.
+    """
+    result = {}
+    for pkg_name, pkg_info in pkg_list:
+        stamp, layers = _packed_layers(pkg_name, pkg_info)
+
+        names = {key: packed[0] for key, packed in layers.items()}
+        for name in (pkg_info.unpacked_contents() or []):
+            names.setdefault(_wrap(name), name)
+
+        for key, name in names.items():
+            unpacked_path = None
+            if pkg_info.unpacked_path is not None:
+                unpacked_path = os.path.join(pkg_info.unpacked_path, name)
+
+            provenance = _resolve_provenance(pkg_name, layers.get(key), stamp,
+                                             name, unpacked_path or "")
+            if provenance is not None:
+                result[provenance.resource] = provenance
+
+    return result
+
+
+###----------------------------------------------------------------------------
+
+
+class OverrideManifest():
+    """
+    A persistent record of the baseline of each override, which is the CRC and
+    size of the packed entry that the override was created from or was last
+    freshened or reverted against. The manifest is stored as JSON in the
+    Sublime cache folder, and is loaded the first time it is needed.
+
+    An override with a baseline is expired when the entry in the package file
+    no longer matches it, which only needs the central directory of the
+    package file and is not affected by changes to file modification times.
+    """
+    def __init__(self):
+        self._baselines = None
+        self._lock = threading.Lock()
+
+    def _filename(self):
+        return os.path.join(sublime.cache_path(), "OverrideAudit", "baselines.json")
+
+    def _load(self):
+        if self._baselines is None:
+            try:
+                with open(self._filename(), "r", encoding="utf-8") as handle:
+                    self._baselines = json.load(handle)
+            except (OSError, ValueError):
+                self._baselines = {}
+
+        return self._baselines
+
+    def _save(self):
+        filename = self._filename()
+        try:
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            with open(filename + ".tmp", "w", encoding="utf-8") as handle:
+                json.dump(self._baselines, handle, separators=(",", ":"))
+            os.replace(filename + ".tmp", filename)
+        except OSError as err:
+            print("Error saving override baselines: %s" % str(err))
+
+    def baseline(self, pkg_name, override):
+        """
+        Return the baseline of the given override as a tuple of the CRC and
+        size of its packed entry, or None if there is no baseline for it.
+        """
+        with self._lock:
+            baseline = self._load().get(pkg_name, {}).get(_wrap(override))
+
+        return None if baseline is None else tuple(baseline)
+
+    def update(self, pkg_name, baselines=None, removed=None):
+        """
+        Set the baselines of overrides in the given package from a dictionary
+        of override names and (crc, size) tuples, and remove the baselines of
+        the list of removed overrides, then save the manifest.
+        """
+        with self._lock:
+            package = self._load().setdefault(pkg_name, {})
+            for override, baseline in (baselines or {}).items():
+                package[_wrap(override)] = list(baseline)
+
+            for override in (removed or []):
+                package.pop(_wrap(override), None)
+
+            if not package:
+                del self._baselines[pkg_name]
+
+            self._save()
+
+
+# The manifest of override baselines; see record_override_baselines().
+override_manifest = OverrideManifest()
+
+
+def record_override_baselines(pkg_name, overrides):
+    """
+    Record the entries in the package file that Sublime uses for the given
+    package as the baselines of the given overrides, using the provenance
+    index; overrides that aren't in the package file are skipped. This should
+    be called whenever an override is created, freshened or reverted.
+    """
+    stamp, layers = _packed_layers(pkg_name)
+
+    baselines = {}
+    for override in overrides:
+        packed = layers.get(_wrap(override))
+        if packed is not None:
+            layer = packed[1] if stamp[1] is not None else packed[2]
+            if layer is not None:
+                baselines[override] = (layer.crc, layer.size)
+
+    if baselines:
+        override_manifest.update(pkg_name, baselines)
+
+
+def forget_override_baselines(pkg_name, overrides):
+    """
+    Remove the recorded baselines of the given overrides, such as when the
+    overrides are deleted.
+    """
+    override_manifest.update(pkg_name, removed=overrides)
+
+
 class PackageFileSet(MutableSet):
     """
     This is an implementation of a set that is meant to store the names and
@@ -322,6 +802,151 @@ class PackageFileSet(MutableSet):
 ###----------------------------------------------------------------------------
 
 
+# A single entry from a ZipEntryTable; the field names match the equivalent
+# attributes of zipfile.ZipInfo where there is one.
+ZipEntry = namedtuple("ZipEntry", ["filename", "CRC", "file_size",
+                                   "compress_size", "header_offset",
+                                   "timestamp"])
+
+
+class ZipEntryTable():
+    """
+    A compact, read-only table of the entries in a sublime-package file.
+
+    Rather than holding on to a zipfile.ZipInfo object for every entry (each of
+    which carries extra data, comments and a dozen other attributes), the
+    entry names are interned and stored in a list, while the values that we
+    care about are stored in parallel typed arrays. The modification time of
+    each entry is precomputed as a timestamp so it can be compared directly
+    against file modification times.
+
+    Lookups by name are exact; on case insensitive file systems a lookup that
+    fails will fall back to a case insensitive lookup, in the same way that
+    Sublime itself finds package resources.
+    """
+    __slots__ = ("names", "crc", "file_size", "compress_size",
+                 "header_offset", "timestamp", "_index", "_case_index")
+
+    def __init__(self, pkg_filename):
+        with zipfile.ZipFile(pkg_filename) as zFile:
+            entries = zFile.infolist()
+
+        self.names = [sys.intern(entry.filename) for entry in entries]
+        self.crc = array("L", (entry.CRC for entry in entries))
+        self.file_size = array("Q", (entry.file_size for entry in entries))
+        self.compress_size = array("Q", (entry.compress_size for entry in entries))
+        self.header_offset = array("Q", (entry.header_offset for entry in entries))
+        self.timestamp = array("d", (self._timestamp(entry) for entry in entries))
+
+        self._index = {name: index for index, name in enumerate(self.names)}
+        self._case_index = None
+
+    @staticmethod
+    def _timestamp(entry):
+        try:
+            return datetime(*entry.date_time).timestamp()
+        except (ValueError, OverflowError):
+            return 0.0
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __contains__(self, name):
+        return self.find(name) is not None
+
+    def find(self, name):
+        """
+        Return the index of the entry with the given name, or None if there
+        is no such entry.
+        """
+        index = self._index.get(name)
+        if index is None and _wrap("ABC") == _wrap("abc"):
+            if self._case_index is None:
+                self._case_index = {_wrap(n): i for i, n in enumerate(self.names)}
+            index = self._case_index.get(_wrap(name))
+
+        return index
+
+    def entry(self, name):
+        """
+        Return a ZipEntry for the entry with the given name, or None if there
+        is no such entry.
+        """
+        index = self.find(name)
+        if index is None:
+            return None
+
+        return ZipEntry(self.names[index], self.crc[index],
+                        self.file_size[index], self.compress_size[index],
+                        self.header_offset[index], self.timestamp[index])
+
+
+###----------------------------------------------------------------------------
+
+
+# A single copy of a package resource; the layer is one of "unpacked",
+# "installed" or "shipped". The crc is None for an unpacked file that has no
+# packed counterpart to compare against.
+ResourceLayer = namedtuple("ResourceLayer", ["layer", "size", "crc"])
+
+
+class ResourceProvenance():
+    """
+    Describes where a single package resource comes from; layers is a list of
+    every ResourceLayer that provides a copy of the resource, in the order that
+    Sublime gives them precedence, and winner is the layer that Sublime uses.
+
+    winner is None when the resource is only in a shipped package that has
+    been completely overridden by an installed package, since in that case the
+    resource is never seen by Sublime.
+    """
+    __slots__ = ("resource", "layers", "winner")
+
+    def __init__(self, resource, layers, winner):
+        self.resource = resource
+        self.layers = layers
+        self.winner = winner
+
+    def __repr__(self):
+        return "<ResourceProvenance %s: %s>" % (self.resource, self.flags())
+
+    def layer(self, name):
+        """
+        Return the ResourceLayer for the named layer, or None if that layer
+        doesn't provide this resource.
+        """
+        for layer in self.layers:
+            if layer.layer == name:
+                return layer
+
+        return None
+
+    def flags(self):
+        """
+        Return a string of the first letters of the layers that provide this
+        resource, in the same style as the package report.
+        """
+        return "".join(name[0].upper() if self.layer(name) else " "
+                       for name in ("shipped", "installed", "unpacked"))
+
+    def is_modified(self):
+        """
+        Determine if the copy of this resource that Sublime uses has different
+        content than the copy that it hides (if any), based on their CRCs.
+        """
+        if self.winner is None or len(self.layers) < 2:
+            return False
+
+        hidden = self.layers[self.layers.index(self.winner) + 1]
+        return (self.winner.size != hidden.size or self.winner.crc != hidden.crc)
+
+
+###----------------------------------------------------------------------------
+
+
 class OverrideDiffResult():
     """
     Wraps the results of an override diff operation.
@@ -356,6 +981,31 @@ class OverrideDiffResult():
 ###----------------------------------------------------------------------------
 
 
+class PackagePreferences():
+    """
+    The subset of the user's Sublime preferences that PackageInfo instances
+    need to know about, captured once so that a PackageList can share a single
+    copy between all of the packages that it contains rather than having each
+    package fetch them from the settings individually.
+
+    The preferences are taken from the settings snapshot provided, or the
+    current settings snapshot if one is not given.
+    """
+    __slots__ = ("ignored_packages", "binary_matcher")
+
+    def __init__(self, snapshot=None):
+        snapshot = snapshot or settings_snapshot()
+
+        self.ignored_packages = frozenset(snapshot.pref("ignored_packages", []))
+
+        patterns = snapshot.pref("binary_file_patterns", [])
+        patterns = patterns if isinstance(patterns, list) else []
+        self.binary_matcher = glob_matcher(tuple(patterns))
+
+
+###----------------------------------------------------------------------------
+
+
 class PackageInfo():
     """
     Holds meta information on an installed Sublime Text Package
@@ -373,17 +1023,36 @@ class PackageInfo():
     of the installed version. This is a complete override and methods in this
     class know to look in the package file being used by Sublime in this case
     when looking up overriden file contents.
+
+    The preferences that the package consults can be provided; this allows a
+    PackageList to share a single copy between all packages. If not given, they
+    are read from the settings when the package is created.
+
+    The caches for package contents and overrides are only created the first
+    time that they're needed, since most packages in a large install are never
+    queried for them. Package contents are gathered under a lock, since the
+    I/O scheduler can read and diff several files of a package at once while
+    a report is using it. Similarly the package metadata (and the Python
+    version that the package uses, which is derived alongside it) is only
+    loaded the first time that it is accessed.
     """
-    def __init__(self, name, scan=True):
-        settings = sublime.load_settings("Preferences.sublime-settings")
-        ignored_list = settings.get("ignored_packages", [])
+    __slots__ = ("name", "_metadata", "_python_version",
+                 "is_dependency", "is_disabled",
+                 "shipped_path", "installed_path", "unpacked_path",
+                 "shipped_mtime", "installed_mtime",
+                 "pkg_content", "zip_tables", "_lock",
+                 "overrides", "expired_overrides", "unknown_overrides",
+                 "unknowns_filtered", "binary_matcher", "verify_name")
+
+    def __init__(self, name, scan=True, prefs=None):
+        prefs = prefs or PackagePreferences()
 
         self.name = name
-        self.metadata = {}
-        self.python_version = ""
+        self._metadata = None
+        self._python_version = None
 
         self.is_dependency = False
-        self.is_disabled = True if name in ignored_list else False
+        self.is_disabled = name in prefs.ignored_packages
 
         self.shipped_path = None
         self.installed_path = None
@@ -392,17 +1061,16 @@ class PackageInfo():
         self.shipped_mtime = None
         self.installed_mtime = None
 
-        self.pkg_content = dict()
-        self.zip_list = dict()
-        self.zip_dict = dict()
+        self.pkg_content = None
+        self.zip_tables = None
+        self._lock = threading.RLock()
 
-        self.overrides = dict()
-        self.expired_overrides = dict()
+        self.overrides = None
+        self.expired_overrides = None
         self.unknown_overrides = None
         self.unknowns_filtered = 0
 
-        patterns = settings.get("binary_file_patterns", [])
-        self.binary_patterns = patterns if isinstance(patterns, list) else []
+        self.binary_matcher = prefs.binary_matcher
 
         if scan:
             self.__scan()
@@ -476,36 +1144,38 @@ class PackageInfo():
         self._add_package(_pkg_scan(sublime.installed_packages_path(), pkg_filename, True))
         self._add_path(pkg_path)
 
-        # Now that package data is fully populated, check if we're a dep and
-        # then load our metadata.
+        # Now that package data is fully populated, check if we're a dep; the
+        # metadata is loaded on demand.
         self._check_if_depdendency()
-        self._load_metadata()
-
-    def __get_sublime_pkg_zip_list(self, pkg_filename):
-        if pkg_filename in self.zip_list:
-            return self.zip_list[pkg_filename]
-
-        if not zipfile.is_zipfile(pkg_filename):
-            raise zipfile.BadZipFile("Invalid sublime-package file '%s'" %
-                                     pkg_filename)
 
-        with zipfile.ZipFile(pkg_filename) as zFile:
-            self.zip_list[pkg_filename] = zFile.infolist()
+    def __get_sublime_pkg_zip_table(self, pkg_filename):
+        with self._lock:
+            if self.zip_tables is None:
+                self.zip_tables = dict()
+            elif pkg_filename in self.zip_tables:
+                return self.zip_tables[pkg_filename]
 
-        return self.zip_list[pkg_filename]
+            if not zipfile.is_zipfile(pkg_filename):
+                raise zipfile.BadZipFile("Invalid sublime-package file '%s'" %
+                                         pkg_filename)
 
-    def __get_sublime_pkg_zip_dict(self, pkg_filename):
-        if pkg_filename in self.zip_dict:
-            return self.zip_dict[pkg_filename]
+            self.zip_tables[pkg_filename] = ZipEntryTable(pkg_filename)
+            return self.zip_tables[pkg_filename]
 
-        zip_list = self.__get_sublime_pkg_zip_list(pkg_filename)
-        self.zip_dict[pkg_filename] = dict((e.filename, e) for e in zip_list)
+    def __get_sublime_pkg_contents(self, pkg_filename):
+        return PackageFileSet(self.__get_sublime_pkg_zip_table(pkg_filename))
 
-        return self.zip_dict[pkg_filename]
+    def _packed_entry(self, resource):
+        """
+        Look up the entry for the given resource in the package file that
+        Sublime is using for this package; returns None if there is no package
+        file or the resource is not in it.
+        """
+        package_file = self.package_file()
+        if package_file is None:
+            return None
 
-    def __get_sublime_pkg_contents(self, pkg_filename):
-        zip_list = self.__get_sublime_pkg_zip_list(pkg_filename)
-        return PackageFileSet([entry.filename for entry in zip_list])
+        return self.__get_sublime_pkg_zip_table(package_file).entry(resource)
 
     def __get_pkg_dir_contents(self, pkg_path):
         results = PackageFileSet()
@@ -519,15 +1189,18 @@ class PackageInfo():
     def __get_pkg_contents(self, filename):
         result = None
         if filename is not None:
-            if filename in self.pkg_content:
-                return self.pkg_content[filename]
-
-            if os.path.isdir(filename):
-                result = self.__get_pkg_dir_contents(filename)
-            else:
-                result = self.__get_sublime_pkg_contents(filename)
+            with self._lock:
+                if self.pkg_content is None:
+                    self.pkg_content = dict()
+                elif filename in self.pkg_content:
+                    return self.pkg_content[filename]
+
+                if os.path.isdir(filename):
+                    result = self.__get_pkg_dir_contents(filename)
+                else:
+                    result = self.__get_sublime_pkg_contents(filename)
 
-            self.pkg_content[filename] = result
+                self.pkg_content[filename] = result
 
         return result
 
@@ -624,7 +1297,7 @@ class PackageInfo():
         if self.is_dependency:
             res_name = "dependency-metadata.json"
 
-        self.metadata = default_metadata(self)
+        self._metadata = default_metadata(self)
 
         try:
             data = self.__get_meta_file(res_name)
@@ -634,14 +1307,14 @@ class PackageInfo():
             if not isinstance(meta_dict, dict):
                 raise ValueError(f'{res_name} does not contain an object')
 
-            self.metadata = meta_dict
+            self._metadata = meta_dict
 
             if not self.is_dependency:
-                self.metadata["dependencies"] = self.__get_dependencies()
+                self._metadata["dependencies"] = self.__get_dependencies()
         except:
             pass
 
-        self.python_version = self._get_package_python_version()
+        self._python_version = self._get_package_python_version()
 
 
     def _get_packed_pkg_file_contents(self, override_file, as_list=True):
@@ -650,9 +1323,12 @@ class PackageInfo():
             if package_file is None:
                 raise NoSuchSublimePackageException(f'package {self.name} has no sublime-package file')
 
+            entry = self._packed_entry(override_file)
+            if entry is None:
+                raise KeyError(override_file)
+
             with zipfile.ZipFile(package_file) as zFile:
-                info = find_zip_entry(zFile, override_file)
-                file = codecs.EncodedFile(zFile.open(info, mode="r"), "utf-8")
+                file = codecs.EncodedFile(zFile.open(entry.filename, mode="r"), "utf-8")
                 if as_list:
                     content = io.TextIOWrapper(file, encoding="utf-8").readlines()
                 else:
@@ -663,7 +1339,7 @@ class PackageInfo():
                     source = "Installed Packages"
 
                 source = os.path.join(source, self.name, override_file)
-                mtime = datetime(*info.date_time).strftime("%Y-%m-%d %H:%M:%S")
+                mtime = datetime.fromtimestamp(entry.timestamp).strftime("%Y-%m-%d %H:%M:%S")
 
                 return (content, _fixPath(source), mtime)
 
@@ -738,11 +1414,10 @@ class PackageInfo():
                 pass
 
         try:
-            package = self.package_file()
-            if package is not None:
-                with zipfile.ZipFile(package) as zFile:
-                    info = find_zip_entry(zFile, resource)
-                    file = codecs.EncodedFile(zFile.open(info, mode="r"), "utf-8")
+            entry = self._packed_entry(resource)
+            if entry is not None:
+                with zipfile.ZipFile(self.package_file()) as zFile:
+                    file = codecs.EncodedFile(zFile.open(entry.filename, mode="r"), "utf-8")
                     if as_binary:
                         return file.read()
 
@@ -756,12 +1431,81 @@ class PackageInfo():
                   (self.package_file(), resource))
             return None
 
+    def _packed_is_binary(self, override_file):
+        """
+        Sniff the start of the packed version of the given override to see if
+        it's binary. The verdict is cached based on the package file and the
+        CRC of the entry, so each version of a file is only examined once.
+        """
+        entry = self._packed_entry(override_file)
+        if entry is None:
+            return False
+
+        key = (self.package_file(), entry.CRC)
+        with _binary_verdicts_lock:
+            if key in _binary_verdicts:
+                _binary_verdicts.move_to_end(key)
+                return _binary_verdicts[key]
+
+        try:
+            with zipfile.ZipFile(key[0]) as zFile:
+                with zFile.open(entry.filename) as handle:
+                    verdict = _is_binary_data(handle.read(_SNIFF_SIZE))
+        except (OSError, KeyError, zipfile.BadZipFile):
+            return False
+
+        with _binary_verdicts_lock:
+            _binary_verdicts[key] = verdict
+            while len(_binary_verdicts) > _MAX_BINARY_VERDICTS:
+                _binary_verdicts.popitem(last=False)
+
+        return verdict
+
+    def _unpacked_is_binary(self, override_file):
+        """
+        Sniff the start of the unpacked version of the given override to see if
+        it's binary.
+        """
+        if self.unpacked_path is None:
+            return False
+
+        try:
+            with open(os.path.join(self.unpacked_path, override_file), "rb") as handle:
+                return _is_binary_data(handle.read(_SNIFF_SIZE))
+        except OSError:
+            return False
+
     def _override_is_binary(self, override_file):
-        pattern_list = self.binary_patterns or []
-        for pattern in pattern_list:
-            if fnmatch.fnmatch(override_file, pattern):
-                return True
-        return False
+        """
+        Determine if the given override represents a binary file, either
+        because its name matches one of the binary file patterns or because
+        the content of either the packed or unpacked version looks binary.
+        """
+        if (self.binary_matcher is not None and
+                self.binary_matcher.match(os.path.normcase(override_file))):
+            return True
+
+        return (self._unpacked_is_binary(override_file) or
+                self._packed_is_binary(override_file))
+
+    @property
+    def metadata(self):
+        """
+        The metadata for this package, loaded from disk on first access.
+        """
+        if self._metadata is None:
+            self._load_metadata()
+        return self._metadata
+
+    @property
+    def python_version(self):
+        """
+        The version of Python that plugins in this package run under, or an
+        empty string if there are no plugins; determined on first access.
+        """
+        if self._python_version is None:
+            self._load_metadata()
+        return self._python_version
 
     def exists(self):
         return bool(self.shipped_path or self.installed_path or self.unpacked_path)
@@ -804,7 +1548,7 @@ class PackageInfo():
 
     def override_file_zipinfo(self, override_file, simple=True):
         """
-        Given the name of an override file, return the zipinfo structure from
+        Given the name of an override file, return the ZipEntry structure from
         the containing package, where the package queried is based on the state
         of the simple flag.
 
@@ -817,19 +1561,7 @@ class PackageInfo():
             return None
 
         source_pkg = self.package_file() if simple else self.shipped_path
-        zip_dict = self.__get_sublime_pkg_zip_dict(source_pkg)
-
-        zipinfo = zip_dict.get(override_file, None)
-        if zipinfo is not None:
-            return zipinfo
-
-        if _wrap("AbC") == _wrap("abc"):
-            zip_list = self.__get_sublime_pkg_zip_list(source_pkg)
-            for entry in zip_list:
-                if _wrap(entry.filename) == override_file:
-                    return entry
-
-        return None
+        return self.__get_sublime_pkg_zip_table(source_pkg).entry(override_file)
 
     def override_files(self, simple=True):
         """
@@ -839,7 +1571,9 @@ class PackageInfo():
         if not self.has_possible_overrides(simple):
             return PackageFileSet()
 
-        if simple in self.overrides:
+        if self.overrides is None:
+            self.overrides = dict()
+        elif simple in self.overrides:
             return self.overrides[simple]
 
         if not simple:
@@ -889,8 +1623,10 @@ class PackageInfo():
         unknown_overrides = self.unknown_override_files()
 
         # use re.match to do an implicit anchor at the start of the file name
-        filtered = {r for r in unknown_overrides
-                     if any(p.match(r) for p in patterns)}
+        filtered = set()
+        if patterns:
+            filtered = {r for r in unknown_overrides
+                        if any(p.match(r) for p in patterns)}
 
         self.unknowns_filtered = len(filtered)
 
@@ -903,15 +1639,20 @@ class PackageInfo():
         sublime; the list of files may be empty.
 
         Note that this currently compares timestamps of the two package files
-        when simple is False. When simple is True, we compare the local file
-        timestamp to the record that comes out of the package file being used
-        by Sublime and fall back to the timestamp of the package itself if the
-        file entry can't be found.
+        when simple is False. When simple is True, an override that has a
+        recorded baseline (see record_override_baselines()) is expired when
+        the CRC or size of the entry in the package file no longer matches the
+        baseline. For other overrides, we compare the local file timestamp to
+        the record that comes out of the package file being used by Sublime
+        and fall back to the timestamp of the package itself if the file entry
+        can't be found.
         """
         if not self.has_possible_overrides(simple):
             return PackageFileSet()
 
-        if simple in self.expired_overrides:
+        if self.expired_overrides is None:
+            self.expired_overrides = dict()
+        elif simple in self.expired_overrides:
             return self.expired_overrides[simple]
 
         result = PackageFileSet()
@@ -928,8 +1669,17 @@ class PackageInfo():
 
             for name in overrides:
                 zipinfo = self.override_file_zipinfo(name, simple)
-                base_time = (pkg_time if zipinfo is None else
-                             datetime(*zipinfo.date_time).timestamp())
+
+                baseline = None
+                if zipinfo is not None:
+                    baseline = override_manifest.baseline(self.name, name)
+
+                if baseline is not None:
+                    if baseline != (zipinfo.CRC, zipinfo.file_size):
+                        result.add(name)
+                    continue
+
+                base_time = pkg_time if zipinfo is None else zipinfo.timestamp
                 file_time = os.path.getmtime(os.path.join(base_path, name))
 
                 if file_time is not None and base_time > file_time:
@@ -962,6 +1712,19 @@ class PackageInfo():
 
         return content[0]
 
+    def unpacked_override_crc(self, override_file):
+        """
+        Given the name of an override file, return back the CRC-32 of the
+        content of the unpacked override, using the same algorithm that zip
+        files use for their entries so that the two can be compared directly.
+
+        Returns None if the file cannot be read.
+        """
+        if self.unpacked_path is None:
+            return None
+
+        return file_crc(os.path.join(self.unpacked_path, override_file))
+
     def contains_file(self, resource):
         """
         Checks to see if the resource provided exists in this package or not
@@ -971,11 +1734,8 @@ class PackageInfo():
         comes from.
         """
         try:
-            package = self.package_file()
-            if package is not None:
-                with zipfile.ZipFile(package) as zFile:
-                    if find_zip_entry(zFile, resource) is not None:
-                        return True
+            if self._packed_entry(resource) is not None:
+                return True
 
         except (KeyError, FileNotFoundError):
             pass
@@ -1000,10 +1760,8 @@ class PackageInfo():
         try:
             package = self.package_file()
             if package is not None:
-                with zipfile.ZipFile(package) as zFile:
-                    for info in zFile.infolist():
-                        if is_plugin(info.filename):
-                            return True
+                if any(is_plugin(name) for name in self.__get_sublime_pkg_zip_table(package)):
+                    return True
 
         except (FileNotFoundError):
             pass
@@ -1035,6 +1793,67 @@ class PackageInfo():
         """
         return self._get_file_internal(resource, as_binary=True)
 
+    def packed_layers(self):
+        """
+        Return a dictionary that maps the (wrapped) name of every resource in
+        the installed or shipped package files of this package to a tuple of
+        the resource name and its installed and shipped ResourceLayer, either
+        of which will be None if that package file does not contain it.
+        """
+        result = {}
+        for index, path in ((1, self.installed_path), (2, self.shipped_path)):
+            if path is None:
+                continue
+
+            layer = "installed" if index == 1 else "shipped"
+            try:
+                table = self.__get_sublime_pkg_zip_table(path)
+            except (OSError, zipfile.BadZipFile):
+                continue
+
+            for entry, name in enumerate(table.names):
+                if name.endswith("/"):
+                    continue
+
+                packed = result.setdefault(_wrap(name), [name, None, None])
+                packed[index] = ResourceLayer(layer, table.file_size[entry],
+                                              table.crc[entry])
+
+        return {key: tuple(packed) for key, packed in result.items()}
+
+    def packed_text_files(self, max_size=None):
+        """
+        Generate a tuple of the name and content of each text resource in the
+        package file that Sublime is using for this package, opening the
+        package file only once. Resources that are binary or not UTF-8 are
+        skipped, as are resources larger than max_size bytes, if given.
+        """
+        package_file = self.package_file()
+        if package_file is None:
+            return
+
+        try:
+            table = self.__get_sublime_pkg_zip_table(package_file)
+            with zipfile.ZipFile(package_file) as zFile:
+                for index, name in enumerate(table.names):
+                    if name.endswith("/"):
+                        continue
+
+                    if max_size is not None and table.file_size[index] > max_size:
+                        continue
+
+                    data = zFile.read(name)
+                    if b"\0" in data:
+                        continue
+
+                    try:
+                        yield (name, data.decode("utf-8"))
+                    except UnicodeDecodeError:
+                        pass
+
+        except (OSError, KeyError, zipfile.BadZipFile):
+            print("Error loading %s; unable to read package file" % package_file)
+
     def set_binary_pattern(self, pattern_list):
         """
         Set the list of file patterns that should be considered to be binary
@@ -1045,14 +1864,86 @@ class PackageInfo():
         Preferences.sublime-settings file, so you only need to change this if
         you want to alter that default.
         """
-        self.binary_patterns = pattern_list
+        self.binary_matcher = glob_matcher(tuple(pattern_list))
+
+    def override_opcodes(self, override_file, max_lines=None):
+        """
+        Return the DiffOpcodes that represent the differences between the
+        packed version of the given override file and the override, or None if
+        either can't be loaded.
+
+        The result is cached, keyed by a fingerprint of the packed entry and
+        the override file, so unless one of them changes the files are only
+        read and compared once no matter how many times they are diffed. If
+        max_lines is given and either file has more lines than that, lines
+        that both files have in common at their start and end are not
+        compared (see diff_opcodes()); trimmed and complete comparisons are
+        cached separately, but share the lines of the files.
+        """
+        fingerprint = None
+        entry = self._packed_entry(override_file)
+        if entry is not None and self.unpacked_path is not None:
+            try:
+                stat = os.stat(os.path.join(self.unpacked_path, override_file))
+                fingerprint = (self.package_file(), entry.CRC, entry.file_size,
+                               stat.st_size, stat.st_mtime_ns)
+            except OSError:
+                pass
+
+        key = (self.name, _wrap(override_file))
+        cached = {}
+        if fingerprint is not None:
+            for trimmed in (False, True):
+                opcodes = diff_cache.get(key + (trimmed,), fingerprint)
+                if opcodes is not None:
+                    cached[trimmed] = opcodes
+
+        if cached:
+            opcodes = next(iter(cached.values()))
+            packed, unpacked = opcodes.packed, opcodes.unpacked
+        else:
+            packed = self._get_packed_pkg_file_contents(override_file, as_list=True)
+            unpacked = self._get_unpacked_override_contents(override_file)
+
+            if not packed or not unpacked:
+                return None
+
+        trim = max_lines is not None and max(len(packed[0]), len(unpacked[0])) > max_lines
+        opcodes = cached.get(trim)
+        if opcodes is None:
+            opcodes = DiffOpcodes(packed, unpacked, trim)
+            if fingerprint is not None:
+                diff_cache.put(key + (trim,), fingerprint, opcodes)
+
+        return opcodes
+
+    def override_diff_stats(self, override_file):
+        """
+        Return a tuple of the number of lines removed and added by the given
+        override file relative to its packed version, or None if the override
+        is binary or either file can't be loaded.
+        """
+        if self._override_is_binary(override_file):
+            return None
+
+        opcodes = self.override_opcodes(override_file)
+        return None if opcodes is None else opcodes.stats()
 
     def override_diff(self, override_file, context_lines, empty_result=None,
-                      binary_result=None, indent=None):
+                      binary_result=None, indent=None, max_lines=None):
         """
         Calculate and return a unified diff of the override file provided. In
         the diff, the first file is the packed version of the file being used
         by sublime and the second is the unpacked override file.
+
+        If max_lines is given and either file has more lines than that, the
+        result is an OverrideDiffHunks instance instead, which allows the diff
+        to be displayed one hunk at a time. For such a diff, lines that both
+        files have in common at their start and end are not compared.
+
+        The diff is generated from the cached result of override_opcodes(), so
+        diffing the same override again with a different amount of context
+        does not compare the files again.
         """
         indent = "" if indent is None else " " * indent
 
@@ -1060,22 +1951,18 @@ class PackageInfo():
             return OverrideDiffResult(None, None, binary_result,
                                       is_binary=True, indent=indent)
 
-        packed = self._get_packed_pkg_file_contents(override_file, as_list=True)
-        unpacked = self._get_unpacked_override_contents(override_file)
-
-        if not packed or not unpacked:
+        opcodes = self.override_opcodes(override_file, max_lines)
+        if opcodes is None:
             return None
 
-        diff = difflib.unified_diff(packed[0], unpacked[0],
-                                    packed[1], unpacked[1],
-                                    packed[2], unpacked[2],
-                                    context_lines)
+        if opcodes.trimmed:
+            return OverrideDiffHunks(opcodes, context_lines)
 
-        result = u"".join(indent + line for line in diff)
-        return OverrideDiffResult(packed, unpacked, result,
+        return OverrideDiffResult(opcodes.packed, opcodes.unpacked,
+                                  opcodes.unified(context_lines, indent),
                                   empty_msg=empty_result, indent=indent)
 
-    def status(self, detailed=False):
+    def status(self, detailed=False, metadata=True):
         """
         Return a status dictionary for the status of this package. When
         detailed is True, the resulting dictionary will contain complete
@@ -1087,6 +1974,10 @@ class PackageInfo():
 
         This detail requires gathering package contents and thus is a more
         heavy-weight call.
+
+        When metadata is False, the metadata and python_version keys are left
+        out of the result, so that the package metadata does not need to be
+        loaded.
         """
         if detailed:
             overrides         = len(self.override_files(simple=True))
@@ -1095,11 +1986,9 @@ class PackageInfo():
         else:
             overrides = expired_overrides = unknown_overrides = overrides = -1
 
-        return {
+        result = {
             # Core info
             "name": self.name,
-            "metadata": self.metadata,
-            "python_version": self.python_version,
 
             # Installation Status
             "is_shipped":   bool(self.shipped_path),
@@ -1123,6 +2012,12 @@ class PackageInfo():
             "unknowns_filtered":      self.unknowns_filtered
         }
 
+        if metadata:
+            result["metadata"] = self.metadata
+            result["python_version"] = self.python_version
+
+        return result
+
 
 ###----------------------------------------------------------------------------
 
@@ -1140,11 +2035,15 @@ class PackageList():
     sensitive. In the event that different packages provide different cases of
     package name, the first name seen (i.e. either shipped or installed) will
     be the "de facto" case for that package.
+
+    The preferences that the packages consult are taken from the provided
+    settings snapshot, or the current settings snapshot if none is given.
     """
-    def __init__(self, name_list=None):
+    def __init__(self, name_list=None, snapshot=None):
         self._list = dict()
         self._disabled = 0
         self._dependencies = 0
+        self._prefs = PackagePreferences(snapshot)
 
         # Maps lower cased package names to listed packages on case insensitive
         # systems.
@@ -1154,17 +2053,16 @@ class PackageList():
             if isinstance(name_list, str):
                 name_list = [name_list]
 
-            if _wrap("Abc") == _wrap("abc"):
-                name_list = [_wrap(name) for name in name_list]
+            name_list = {_wrap(name) for name in name_list}
 
         self._shipped = self.__find_pkgs(_shipped_packages_path(), name_list, shipped=True)
         self._installed = self.__find_pkgs(sublime.installed_packages_path(), name_list)
         self._unpacked = self.__find_pkgs(sublime.packages_path(), name_list, packed=False)
 
         for pkg in self._list.values():
-            # Check if the package is a dependency and then load it's metadata.
+            # Check if the package is a dependency; the metadata is loaded on
+            # demand.
             pkg._check_if_depdendency()
-            pkg._load_metadata()
 
             # Count it as a dependency
             if pkg.is_dependency:
@@ -1220,7 +2118,7 @@ class PackageList():
         """
         name = self.__key(name)
         if name not in self._list:
-            self._list[name] = PackageInfo(name, scan=False)
+            self._list[name] = PackageInfo(name, scan=False, prefs=self._prefs)
             if self._case_list is not None:
                 self._case_list[name.lower()] = name
 
@@ -1246,14 +2144,14 @@ class PackageList():
         # in there?
         for (path, dirs, files) in os.walk(location, followlinks=True):
             if packed:
-                if name_list:
+                if name_list is not None:
                     files = [f for f in files if os.path.splitext(_wrap(f))[0] in name_list]
 
                 for name in [f for f in files if f.endswith(".sublime-package")]:
                     self.__packed_package(path, name, shipped)
                     count += 1
             else:
-                if name_list:
+                if name_list is not None:
                     dirs = [d for d in dirs if _wrap(d) in name_list]
 
                 for name in dirs:
@@ -1267,13 +2165,3 @@ class PackageList():
 
 
 ###----------------------------------------------------------------------------
-
-
-# invoke the function that will gather the plugin hosts, so that this happens
-# at package load time and freezes the interpreter list with the versions that
-# would be active based on the current preferences.
-#
-# This way we don't need to worry about someone changing settings before the
-# first call to anything OverrideAudit related without restarting Sublime first
-# which might make us report an incorrect version.
-_python_host_versions()
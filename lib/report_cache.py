@@ -0,0 +1,350 @@
+import sublime
+
+import os
+import re
+import json
+import zlib
+import base64
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+from .packages import PackageList
+from .snapshot import package_fingerprint
+
+
+###----------------------------------------------------------------------------
+
+
+# The maximum number of generated reports that are kept in the cache; when a
+# new report is stored, the oldest report is dropped.
+_MAX_CACHED_REPORTS = 20
+
+# The maximum number of paged reports whose pages are held in memory.
+_MAX_PAGED_REPORTS = 4
+
+
+###----------------------------------------------------------------------------
+
+
+def report_fingerprints(pkg_names, pkg_list=None):
+    """
+    Return a dictionary of the fingerprint of each of the packages named in the
+    given list (see package_fingerprint()); packages that don't exist have a
+    fingerprint of None.
+
+    When given, the packages are taken from pkg_list (such as the list that a
+    report was generated from), and only packages that are not in it need to
+    be scanned.
+    """
+    missing = [name for name in pkg_names if pkg_list is None or name not in pkg_list]
+    scanned = PackageList(missing) if missing else {}
+
+    result = {}
+    for pkg_name in pkg_names:
+        if pkg_list is not None and pkg_name in pkg_list:
+            pkg_info = pkg_list[pkg_name]
+        else:
+            pkg_info = scanned[pkg_name] if pkg_name in scanned else None
+
+        result[pkg_name] = None if pkg_info is None else package_fingerprint(pkg_info)
+
+    return result
+
+
+def stale_packages(fingerprints):
+    """
+    Given a dictionary of package fingerprints as returned by
+    report_fingerprints(), return a sorted list of the names of the packages
+    whose fingerprint is no longer the same.
+    """
+    current = report_fingerprints(list(fingerprints))
+    return sorted(name for name, value in fingerprints.items()
+                  if current[name] != value)
+
+
+###----------------------------------------------------------------------------
+
+
+class ReportPages():
+    """
+    The content of a report that is displayed one page at a time. A report is
+    made up of a header (everything prior to the first package) followed by a
+    section for each package in it; the index page lists each package along
+    with a summary of its section, and the page for a package displays just
+    the section for that package. Both are preceded by the report header.
+
+    layout is a dictionary that gives the number of lines in the header and,
+    for each section, a list of the package name, the summary and the first
+    and last (exclusive) lines of the section in the content.
+    """
+    def __init__(self, content, layout):
+        lines = content.split("\n")
+
+        self.header = "\n".join(lines[:layout["header"]])
+        self.sections = OrderedDict()
+        for pkg_name, summary, first, last in layout["sections"]:
+            self.sections[pkg_name] = [summary, "\n".join(lines[first:last])]
+
+    def index(self):
+        """
+        Return the text of the index page.
+        """
+        result = [self.header,
+                  "Report Index: %d packages; open the page for a package to see its details" %
+                  len(self.sections), ""]
+
+        for summary, text in self.sections.values():
+            result.extend([text.split("\n", 1)[0], "    <%s>" % summary, ""])
+
+        return "\n".join(result)
+
+    def page_prefix(self, pkg_name):
+        """
+        Return the text that precedes the section on the page for the given
+        package.
+        """
+        number = list(self.sections).index(pkg_name) + 1
+        return "%s\nReport Page: %s (%d of %d); open the report index to see all packages\n\n" % (
+            self.header, pkg_name, number, len(self.sections))
+
+    def text(self, page):
+        """
+        Return the text of the given page, which is the name of a package in
+        the report; the index is returned for any other value.
+        """
+        if page not in self.sections:
+            return self.index()
+
+        return self.page_prefix(page) + self.sections[page][1]
+
+    def update(self, pkg_name, text):
+        """
+        Replace the section for the given package, so that changes made to the
+        page while it was displayed are retained.
+        """
+        self.sections[pkg_name][1] = text
+
+    def modify_mark(self, pkg_name, override, mark):
+        """
+        Modify the mark of an override in the section of the given package in
+        the same manner as the override_audit_modify_mark command, for pages
+        that are not currently displayed.
+        """
+        section = self.sections.get(pkg_name)
+        if section is None:
+            return
+
+        new_mark = "" if mark is None else "[%s] " % mark[0]
+        regex = re.compile(r"^(  `- |    )(?:\[.] )?%s$" % re.escape(override), re.MULTILINE)
+        section[1] = regex.sub(lambda m: m.group(1) + new_mark + override,
+                               section[1], count=1)
+
+    def serialize(self):
+        """
+        Return a tuple of the content and the layout of the report as it
+        currently stands, from which the pages can be created again.
+        """
+        lines = self.header.split("\n")
+        layout = {"header": len(lines), "sections": []}
+        for pkg_name, (summary, text) in self.sections.items():
+            first = len(lines)
+            lines.extend(text.split("\n"))
+            layout["sections"].append([pkg_name, summary, first, len(lines)])
+
+        return ("\n".join(lines), layout)
+
+
+###----------------------------------------------------------------------------
+
+
+class ReportCache():
+    """
+    A persistent cache of the most recently generated reports, so that report
+    views restored in a new session can have their settings reattached without
+    having to generate the report again.
+
+    Each report is stored with its caption, type, syntax, view settings and
+    (compressed) content, along with the fingerprints of the packages that it
+    covers at the time it was generated so that it can be checked for being
+    out of date. The cache is stored as JSON in the Sublime cache folder; it is
+    loaded the first time it is needed and saved in the background whenever
+    it changes.
+
+    Reports that are displayed one page at a time are also stored with the
+    layout of their pages; the ReportPages of the most recently used of them
+    are held in memory. Changes made to the pages are written back to the
+    cached report when the cache is saved (see pages_changed()).
+    """
+    def __init__(self):
+        self._reports = None
+        self._dirty = False
+        self._pages = OrderedDict()
+        self._changed_pages = {}
+        self._lock = threading.Lock()
+
+    def _filename(self):
+        return os.path.join(sublime.cache_path(), "OverrideAudit", "reports.json")
+
+    def _load(self):
+        if self._reports is None:
+            try:
+                with open(self._filename(), "r", encoding="utf-8") as handle:
+                    self._reports = json.load(handle)
+            except (OSError, ValueError):
+                self._reports = {}
+
+        return self._reports
+
+    def _schedule_save(self):
+        """
+        Arrange for the cache to be saved in the background; any number of
+        changes made before the save happens are written together. This must
+        be called with the lock held.
+        """
+        if not self._dirty:
+            self._dirty = True
+            sublime.set_timeout_async(self._save, 250)
+
+    def _save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+
+            self._dirty = False
+            changed, self._changed_pages = self._changed_pages, {}
+
+        updates = {}
+        for report_id, pages in changed.items():
+            content, layout = pages.serialize()
+            updates[report_id] = (self._encode(content), layout)
+
+        with self._lock:
+            for report_id, (content, layout) in updates.items():
+                report = self._reports.get(report_id)
+                if report is not None:
+                    report.update(content=content, pages=layout)
+
+            data = json.dumps(self._reports, separators=(",", ":"))
+
+        filename = self._filename()
+        try:
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            with open(filename + ".tmp", "w", encoding="utf-8") as handle:
+                handle.write(data)
+            os.replace(filename + ".tmp", filename)
+        except OSError as err:
+            print("Error saving report cache: %s" % str(err))
+
+    def store(self, caption, content, report_type, syntax, settings,
+              fingerprints, pages=None):
+        """
+        Add a generated report to the cache and return the unique ID that it
+        is stored under. When given, pages is the layout of the pages of the
+        report (see ReportPages).
+        """
+        report_id = os.urandom(16).hex()
+        if pages is not None:
+            self._add_pages(report_id, ReportPages(content, pages))
+
+        content = self._encode(content)
+
+        with self._lock:
+            reports = self._load()
+            reports[report_id] = {
+                "caption": caption,
+                "report_type": report_type,
+                "syntax": syntax,
+                "settings": settings or {},
+                "content": content,
+                "fingerprints": fingerprints,
+                "pages": pages,
+                "generated": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            }
+
+            # Dictionaries retain insertion order, so the oldest are first.
+            for old_id in list(reports)[:-_MAX_CACHED_REPORTS]:
+                del reports[old_id]
+
+            self._schedule_save()
+
+        return report_id
+
+    def _encode(self, content):
+        """
+        Return the given report content compressed and encoded for storage.
+        """
+        content = zlib.compress(content.encode("utf-8"), 6)
+        return base64.b64encode(content).decode("ascii")
+
+    def pages_changed(self, report_id):
+        """
+        Note that the ReportPages of the cached report with the given ID have
+        been modified, so that the changes are stored with the report when the
+        cache is next saved in the background.
+        """
+        with self._lock:
+            pages = self._pages.get(report_id)
+            if pages is not None:
+                self._changed_pages[report_id] = pages
+                self._schedule_save()
+
+    def fetch(self, report_id):
+        """
+        Return the cached report with the given ID as a dictionary, or None if
+        there is no such report. The content of the report is decompressed.
+        """
+        with self._lock:
+            report = self._load().get(report_id)
+
+        if report is None:
+            return None
+
+        try:
+            content = zlib.decompress(base64.b64decode(report["content"]))
+        except (ValueError, zlib.error):
+            return None
+
+        return dict(report, content=content.decode("utf-8"))
+
+    def find(self, caption):
+        """
+        Return the ID of the most recently cached report that has the given
+        caption, or None if there isn't one.
+        """
+        with self._lock:
+            for report_id, report in reversed(list(self._load().items())):
+                if report["caption"] == caption:
+                    return report_id
+
+    def pages(self, report_id):
+        """
+        Return the ReportPages for the cached report with the given ID, or None
+        if there is no such report or it is not displayed in pages.
+        """
+        with self._lock:
+            pages = self._pages.get(report_id)
+            if pages is not None:
+                self._pages.move_to_end(report_id)
+                return pages
+
+        report = self.fetch(report_id)
+        if report is None or not report.get("pages"):
+            return None
+
+        return self._add_pages(report_id, ReportPages(report["content"], report["pages"]))
+
+    def _add_pages(self, report_id, pages):
+        with self._lock:
+            self._pages[report_id] = pages
+            while len(self._pages) > _MAX_PAGED_REPORTS:
+                self._pages.popitem(last=False)
+
+        return pages
+
+
+# The cache of generated reports; see ReportGenerationThread.
+report_cache = ReportCache()
+
+
+###----------------------------------------------------------------------------
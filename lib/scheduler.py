@@ -0,0 +1,209 @@
+import sublime
+
+import threading
+from functools import partial
+
+from .diff import diff_cache
+
+
+###----------------------------------------------------------------------------
+
+
+class IOScheduler():
+    """
+    An asyncio event loop hosted on a single dedicated worker thread, which
+    runs I/O jobs as coroutines. Any number of reports and mini diff lookups
+    can share the scheduler, so that their I/O overlaps instead of each job
+    waiting for the ones before it to finish.
+
+    Coroutines offload blocking work (reading package files and overrides and
+    diffing them) to a pool of at most max_workers threads. The loop and its
+    threads only exist while the scheduler is started, and asyncio is only
+    imported at that point.
+    """
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+
+        self._loop = None
+        self._thread = None
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self):
+        return self._loop is not None
+
+    def start(self):
+        """
+        Start the event loop thread, if it's not already running.
+        """
+        # These are only imported when needed, to speed plugin loading.
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+
+        with self._lock:
+            if self._loop is not None:
+                return
+
+            self._loop = asyncio.new_event_loop()
+            self._executor = ThreadPoolExecutor(self.max_workers,
+                                                thread_name_prefix="OverrideAudit-io")
+            self._thread = threading.Thread(target=self._run, args=(self._loop,),
+                                            name="OverrideAudit-scheduler",
+                                            daemon=True)
+            self._thread.start()
+
+    def _run(self, loop):
+        import asyncio
+
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def stop(self):
+        """
+        Stop the event loop thread, if it's running. Jobs that are still in
+        progress are cancelled.
+        """
+        with self._lock:
+            loop, thread, executor = self._loop, self._thread, self._executor
+            self._loop = self._thread = self._executor = None
+
+        if loop is None:
+            return
+
+        import asyncio
+
+        asyncio.run_coroutine_threadsafe(self._shutdown(loop), loop)
+        thread.join(5)
+        executor.shutdown(wait=False)
+
+    async def _shutdown(self, loop):
+        """
+        Cancel all jobs and stop the loop once they have seen the cancellation,
+        so that nothing is left waiting on them.
+        """
+        import asyncio
+
+        tasks = [task for task in asyncio.all_tasks(loop)
+                 if task is not asyncio.current_task(loop)]
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        loop.stop()
+
+    async def run_blocking(self, func, *args):
+        """
+        Run the given blocking function with the provided arguments in the
+        thread pool and return its result.
+        """
+        import asyncio
+
+        # While stopping there is no pool, so the default executor is used.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args))
+
+    async def map_blocking(self, func, items, limit=None):
+        """
+        Run the given blocking function once for each of the items provided in
+        the thread pool, returning a list of the results (or the exceptions
+        raised) in the order of the items.
+
+        No more than limit calls (max_workers by default) are in progress at
+        once, so a single large job doesn't hold up all others.
+        """
+        import asyncio
+
+        semaphore = asyncio.Semaphore(limit or self.max_workers)
+
+        async def job(item):
+            async with semaphore:
+                return await self.run_blocking(func, item)
+
+        return await asyncio.gather(*(job(item) for item in items),
+                                    return_exceptions=True)
+
+    def submit(self, coroutine, callback=None):
+        """
+        Schedule the given coroutine to run in the event loop; this can be
+        called from any thread. If a callback is given, it is invoked in the
+        main thread with the result once the coroutine completes.
+
+        Returns a concurrent Future for the result, or None if the scheduler
+        is not running, in which case the coroutine is not run.
+        """
+        import asyncio
+
+        loop = self._loop
+        if loop is None:
+            coroutine.close()
+            return None
+
+        future = asyncio.run_coroutine_threadsafe(coroutine, loop)
+
+        def done(future):
+            if future.cancelled():
+                return
+
+            error = future.exception()
+            if error is not None:
+                return print("OverrideAudit: scheduled job failed: %s" % error)
+
+            if callback is not None:
+                result = future.result()
+                sublime.set_timeout(lambda: callback(result), 1)
+
+        future.add_done_callback(done)
+        return future
+
+    def wait(self, coroutine):
+        """
+        Run the given coroutine in the event loop and wait for its result; this
+        must not be called from the event loop thread. Returns None if the
+        scheduler is not running or the coroutine fails.
+        """
+        future = self.submit(coroutine)
+        if future is None:
+            return None
+
+        try:
+            return future.result()
+        except Exception:
+            return None
+
+
+# The scheduler shared by all I/O jobs; it is only started when the async_io
+# setting is enabled.
+io_scheduler = IOScheduler()
+
+
+###----------------------------------------------------------------------------
+
+
+def _probe_package(pkg_info):
+    pkg_info.package_contents()
+    pkg_info.unpacked_contents()
+
+
+async def probe_packages(scheduler, packages):
+    """
+    Read the index of the package file and the list of unpacked files of each
+    of the given packages, so that they are cached in each PackageInfo.
+    """
+    await scheduler.map_blocking(_probe_package, packages)
+
+
+async def prefetch_diffs(scheduler, pkg_info, overrides):
+    """
+    Read and diff each of the given overrides in the provided package, so that
+    the results are in the diff cache when the overrides are diffed. Only as
+    many overrides as can comfortably fit in the cache are prefetched.
+    """
+    overrides = list(overrides)[:diff_cache.max_entries // 2]
+    await scheduler.map_blocking(pkg_info.override_diff_stats, overrides)
+
+
+###----------------------------------------------------------------------------
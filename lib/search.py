@@ -0,0 +1,278 @@
+import os
+import re
+import zlib
+from threading import Lock
+
+
+###----------------------------------------------------------------------------
+
+
+# Resources larger than this are not indexed; these are generally generated
+# data files that are not useful to search.
+_MAX_INDEX_SIZE = 2 * 1024 * 1024
+
+# The tokens that the index is built from.
+_token_re = re.compile(r"\w+")
+
+
+###----------------------------------------------------------------------------
+
+
+class SearchMatch():
+    """
+    A single resource that matched a search; the lines are a list of tuples
+    of the line number and text of each matching line. unpacked indicates if
+    the match is in the unpacked copy of the resource or the packed one.
+    """
+    __slots__ = ("package", "resource", "unpacked", "lines")
+
+    def __init__(self, package, resource, unpacked, lines):
+        self.package = package
+        self.resource = resource
+        self.unpacked = unpacked
+        self.lines = lines
+
+
+###----------------------------------------------------------------------------
+
+
+class ResourceIndex():
+    """
+    An inverted index of the words in the text resources of a set of packages,
+    covering both the content of sublime-package files and any unpacked files.
+
+    Each indexed resource is a document; the index maps every (lower cased)
+    word to the set of documents that contain it, and the text of each
+    document is held compressed so that candidate documents can be checked
+    for the actual search text without going back to disk.
+
+    The index is updated incrementally; the packed resources of a package are
+    only indexed again when its package file changes, and unpacked resources
+    are only indexed again when their modification time changes.
+    """
+    def __init__(self):
+        self.lock = Lock()
+
+        # Document ID to a tuple of package name, resource, unpacked state and
+        # compressed text, and word to a set of document IDs.
+        self._docs = {}
+        self._postings = {}
+        self._next_id = 0
+
+        # Package name to the stamp of the package file and the IDs of the
+        # packed documents, and to a dictionary of unpacked resource names to
+        # their modification time and document ID.
+        self._packed = {}
+        self._unpacked = {}
+
+    def __len__(self):
+        return len(self._docs)
+
+    def _add(self, pkg_name, resource, unpacked, text):
+        doc_id = self._next_id
+        self._next_id += 1
+
+        self._docs[doc_id] = (pkg_name, resource, unpacked,
+                              zlib.compress(text.encode("utf-8"), 1))
+        for word in set(_token_re.findall(text.lower())):
+            self._postings.setdefault(word, set()).add(doc_id)
+
+        return doc_id
+
+    def _remove(self, doc_id):
+        text = self._text(doc_id)
+        del self._docs[doc_id]
+
+        for word in set(_token_re.findall(text.lower())):
+            docs = self._postings[word]
+            docs.discard(doc_id)
+            if not docs:
+                del self._postings[word]
+
+    def _text(self, doc_id):
+        return zlib.decompress(self._docs[doc_id][3]).decode("utf-8")
+
+    def _update_packed(self, pkg_info):
+        """
+        Index the packed resources of the given package if the package file
+        has changed since it was last indexed; returns the number of newly
+        indexed documents.
+        """
+        package_file = pkg_info.package_file()
+        stamp = None if not package_file else (package_file, pkg_info.package_mtime())
+
+        prior_stamp, doc_ids = self._packed.get(pkg_info.name, (False, []))
+        if stamp == prior_stamp:
+            return 0
+
+        for doc_id in doc_ids:
+            self._remove(doc_id)
+
+        doc_ids = [self._add(pkg_info.name, name, False, text)
+                   for name, text in pkg_info.packed_text_files(_MAX_INDEX_SIZE)]
+        self._packed[pkg_info.name] = (stamp, doc_ids)
+
+        return len(doc_ids)
+
+    def _update_unpacked(self, pkg_info):
+        """
+        Index any unpacked resources of the given package which are new or
+        changed since they were last indexed, and drop those that have been
+        removed; returns the number of newly indexed documents.
+        """
+        prior = self._unpacked.get(pkg_info.name, {})
+        current = {}
+        added = 0
+
+        for resource in (pkg_info.unpacked_contents() or []):
+            name = os.path.join(pkg_info.unpacked_path, resource)
+            try:
+                stat = os.stat(name)
+            except OSError:
+                continue
+
+            mtime, doc_id = prior.pop(resource, (None, None))
+            if mtime == stat.st_mtime:
+                current[resource] = (mtime, doc_id)
+                continue
+
+            if doc_id is not None:
+                self._remove(doc_id)
+
+            # Skipped resources are remembered so they're not read again.
+            text = None
+            if stat.st_size <= _MAX_INDEX_SIZE:
+                data = pkg_info.get_binary_file(resource)
+                if data is not None and b"\0" not in data:
+                    try:
+                        text = data.decode("utf-8")
+                    except UnicodeDecodeError:
+                        pass
+
+            if text is not None:
+                doc_id = self._add(pkg_info.name, resource, True, text)
+                added += 1
+
+            current[resource] = (stat.st_mtime, None if text is None else doc_id)
+
+        for _, doc_id in prior.values():
+            if doc_id is not None:
+                self._remove(doc_id)
+
+        self._unpacked[pkg_info.name] = current
+        return added
+
+    def update(self, pkg_list):
+        """
+        Bring the index up to date with the packages in the provided package
+        list; packages that are no longer in the list are removed from the
+        index. Returns the number of newly indexed documents.
+        """
+        added = 0
+        for pkg_name, pkg_info in pkg_list:
+            added += self._update_packed(pkg_info)
+            added += self._update_unpacked(pkg_info)
+
+        for pkg_name in [name for name in self._packed if name not in pkg_list]:
+            for doc_id in self._packed.pop(pkg_name)[1]:
+                self._remove(doc_id)
+
+            for _, doc_id in self._unpacked.pop(pkg_name, {}).values():
+                if doc_id is not None:
+                    self._remove(doc_id)
+
+        return added
+
+    def _candidates(self, query):
+        """
+        Return the set of documents that might contain the given (lower cased)
+        query text. Words in the middle of the query must appear in full, but
+        the first and last words may be only a part of a word in a document.
+        """
+        words = _token_re.findall(query)
+        if not words:
+            return set(self._docs)
+
+        result = None
+        for index, word in enumerate(words):
+            # Only the ends of the query can be part of a larger word.
+            open_start = index == 0 and query.startswith(word)
+            open_end = index == len(words) - 1 and query.endswith(word)
+
+            if open_start and open_end:
+                matches = [w for w in self._postings if word in w]
+            elif open_start:
+                matches = [w for w in self._postings if w.endswith(word)]
+            elif open_end:
+                matches = [w for w in self._postings if w.startswith(word)]
+            else:
+                matches = [word] if word in self._postings else []
+
+            docs = set()
+            for match in matches:
+                docs.update(self._postings[match])
+
+            result = docs if result is None else result & docs
+            if not result:
+                break
+
+        return result
+
+    def search(self, query, max_lines=None):
+        """
+        Search the index for resources that contain the given text, ignoring
+        case. Returns a tuple of the list of SearchMatch instances (sorted by
+        package and resource) and a flag that indicates if the results were
+        truncated because there were more than max_lines matching lines.
+        """
+        query = query.lower()
+
+        docs = sorted(self._candidates(query), key=lambda d: (
+            self._docs[d][0].lower(), self._docs[d][1], self._docs[d][2]))
+
+        results = []
+        total = 0
+        for index, doc_id in enumerate(docs):
+            lines = self._matching_lines(doc_id, query)
+            if not lines:
+                continue
+
+            # Stop once the limit is reached, noting if there are more matching
+            # lines in this or any of the remaining resources.
+            if max_lines is not None and total + len(lines) >= max_lines:
+                truncated = total + len(lines) > max_lines or any(
+                    self._matching_lines(other, query) for other in docs[index + 1:])
+                lines = lines[:max_lines - total]
+
+                pkg_name, resource, unpacked, _ = self._docs[doc_id]
+                results.append(SearchMatch(pkg_name, resource, unpacked, lines))
+                return (results, truncated)
+
+            pkg_name, resource, unpacked, _ = self._docs[doc_id]
+            results.append(SearchMatch(pkg_name, resource, unpacked, lines))
+            total += len(lines)
+
+        return (results, False)
+
+    def _matching_lines(self, doc_id, query):
+        """
+        Return a list of (row, line) tuples for the lines of the given document
+        that contain the (lower cased) query.
+        """
+        text = self._text(doc_id)
+        if query not in text.lower():
+            return []
+
+        return [(row, line) for row, line in enumerate(text.splitlines(), 1)
+                if query in line.lower()]
+
+
+###----------------------------------------------------------------------------
+
+
+# The index used for all searches; it persists for the life of the plugin so
+# that it only needs to be updated with changes between searches.
+resource_index = ResourceIndex()
+
+
+###----------------------------------------------------------------------------
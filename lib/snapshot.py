@@ -0,0 +1,197 @@
+import sublime
+
+import os
+import json
+import zlib
+from datetime import datetime
+
+from .packages import file_crc
+
+
+###----------------------------------------------------------------------------
+
+
+def _snapshot_filename():
+    return os.path.join(sublime.cache_path(), "OverrideAudit", "snapshot.json")
+
+
+def _unpacked_stats(pkg_info):
+    """
+    Return a dictionary of the size and modification time of every unpacked
+    file in the given package, keyed by the name of the file.
+    """
+    result = {}
+    for name in (pkg_info.unpacked_contents() or []):
+        try:
+            stat = os.stat(os.path.join(pkg_info.unpacked_path, name))
+            result[name] = (stat.st_size, stat.st_mtime)
+        except OSError:
+            pass
+
+    return result
+
+
+def package_fingerprint(pkg_info, unpacked_stats=None):
+    """
+    Return the fingerprint of the given package, which changes whenever its
+    shipped or installed package file changes or any of its unpacked files are
+    added, removed or modified. This only requires file stats.
+    """
+    if unpacked_stats is None:
+        unpacked_stats = _unpacked_stats(pkg_info)
+
+    digest = 0
+    for name in sorted(unpacked_stats):
+        digest = zlib.crc32(("%s:%d:%r\n" % (name, *unpacked_stats[name])).encode("utf-8"), digest)
+
+    return [pkg_info.shipped_mtime, pkg_info.installed_mtime,
+            pkg_info.unpacked_path is not None, digest]
+
+
+###----------------------------------------------------------------------------
+
+
+class AuditSnapshot():
+    """
+    A compact record of the state of all packages at the time of an audit (a
+    full override report).
+
+    For each package, the snapshot holds the package fingerprint (see
+    package_fingerprint()) and, for each simple override, a list of the CRC of
+    the packed file, the CRC of the override, the size and modification time
+    of the override and whether it was expired.
+
+    The CRC of an override is only calculated when its size or modification
+    time differs from the prior snapshot, so taking a snapshot does not
+    normally need to read any override files.
+    """
+    def __init__(self, packages=None, generated=None):
+        self.packages = packages or {}
+        self.generated = generated
+
+    @classmethod
+    def load(cls):
+        """
+        Load the most recently saved snapshot, returning None if there is no
+        snapshot or it can't be loaded.
+        """
+        try:
+            with open(_snapshot_filename(), "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+            return cls(data["packages"], data["generated"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self):
+        filename = _snapshot_filename()
+        try:
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            with open(filename + ".tmp", "w", encoding="utf-8") as handle:
+                json.dump({"generated": self.generated, "packages": self.packages},
+                          handle, separators=(",", ":"))
+            os.replace(filename + ".tmp", filename)
+        except OSError as err:
+            print("Error saving audit snapshot: %s" % str(err))
+
+    @staticmethod
+    def capture_package(pkg_info, prior=None):
+        """
+        Capture and return the snapshot entry for a single package; prior is
+        the entry for the package in a previous snapshot (if any), which is
+        used to avoid reading overrides that have not changed.
+        """
+        prior = (prior or {}).get("overrides", {})
+        unpacked = _unpacked_stats(pkg_info)
+        expired = pkg_info.expired_override_files(simple=True)
+
+        overrides = {}
+        for name in pkg_info.override_files(simple=True):
+            size, mtime = unpacked.get(name, (None, None))
+            zipinfo = pkg_info.override_file_zipinfo(name)
+
+            known = prior.get(name)
+            if known is not None and known[2] == size and known[3] == mtime:
+                override_crc = known[1]
+            else:
+                override_crc = file_crc(os.path.join(pkg_info.unpacked_path, name))
+
+            overrides[name] = [None if zipinfo is None else zipinfo.CRC,
+                               override_crc, size, mtime, name in expired]
+
+        return {
+            "fingerprint": package_fingerprint(pkg_info, unpacked),
+            "overrides": overrides
+        }
+
+    @classmethod
+    def capture(cls, pkg_list, prior=None):
+        """
+        Capture and return a snapshot of the packages in the given list.
+        """
+        prior_packages = {} if prior is None else prior.packages
+        packages = {}
+        for pkg_name, pkg_info in pkg_list:
+            packages[pkg_name] = cls.capture_package(pkg_info, prior_packages.get(pkg_name))
+
+        return cls(packages, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+
+
+###----------------------------------------------------------------------------
+
+
+def snapshot_delta(snapshot, pkg_list):
+    """
+    Compare the state of the packages in the given list against the provided
+    snapshot. Only packages whose fingerprint differs from the snapshot are
+    examined further.
+
+    Returns a dictionary keyed by package name for each package that changed,
+    where the value is a tuple of a list of notes about the package as a whole
+    and a list of (mark, override) tuples for each override that changed. The
+    marks are "+" for new, "-" for removed, "X" for newly expired, "F" for no
+    longer expired, "B" for a changed underlying packed file and "*" for a
+    changed override.
+    """
+    result = {}
+    for pkg_name, pkg_info in pkg_list:
+        prior = snapshot.packages.get(pkg_name)
+        if prior is not None and prior["fingerprint"] == package_fingerprint(pkg_info):
+            continue
+
+        notes = []
+        changes = []
+        if prior is None:
+            prior = {"fingerprint": [None, None, False, 0], "overrides": {}}
+            notes.append("New package")
+        elif prior["fingerprint"][:2] != [pkg_info.shipped_mtime, pkg_info.installed_mtime]:
+            notes.append("Package file has been updated")
+
+        current = AuditSnapshot.capture_package(pkg_info, prior)
+        before = prior["overrides"]
+        after = current["overrides"]
+
+        for name in sorted(set(before) | set(after)):
+            old = before.get(name)
+            new = after.get(name)
+            if old is None:
+                changes.append(("X" if new[4] else "+", name))
+            elif new is None:
+                changes.append(("-", name))
+            elif new[4] != old[4]:
+                changes.append(("X" if new[4] else "F", name))
+            elif new[0] != old[0]:
+                changes.append(("B", name))
+            elif new[1] != old[1]:
+                changes.append(("*", name))
+
+        if notes or changes:
+            result[pkg_name] = (notes, changes)
+
+    for pkg_name in snapshot.packages:
+        if pkg_name not in pkg_list:
+            result[pkg_name] = (["Package has been removed"], [])
+
+    return result
+
+
+###----------------------------------------------------------------------------
@@ -1,6 +1,9 @@
 import sublime
 import threading
 
+from .utils import settings_snapshot
+from .scheduler import io_scheduler
+
 
 ###----------------------------------------------------------------------------
 
@@ -71,6 +74,13 @@ class BackgroundWorkerThread(threading.Thread):
     If given, the callback is invoked in the main thread after processing has
     completed, with the thread instance as a parameter so that results can be
     collected.
+
+    The settings snapshot that is current when the thread is created is made
+    available to it, so that the settings do not change while it is running.
+
+    When the async_io setting is enabled, the thread can hand I/O jobs to the
+    shared scheduler via _schedule(), so that the I/O of multiple threads can
+    overlap.
     """
     def __init__(self, window, spinner_text, callback, **kwargs):
         super().__init__()
@@ -79,10 +89,23 @@ class BackgroundWorkerThread(threading.Thread):
         self.spinner_text = spinner_text
         self.callback = callback
         self.args = kwargs
+        self.snapshot = settings_snapshot()
 
     def _process(self):
         pass
 
+    def _schedule(self, job, *args):
+        """
+        Run the given job coroutine function on the shared I/O scheduler with
+        the provided arguments and wait for it to complete, returning its
+        result. When the scheduler is not in use, this returns None without
+        running the job.
+        """
+        if not self.snapshot.get("async_io") or not io_scheduler.running:
+            return None
+
+        return io_scheduler.wait(job(io_scheduler, *args))
+
     def run(self):
         Spinner(self.window, self, self.spinner_text)
 
@@ -1,3 +1,6 @@
+import sublime
+
+from types import MappingProxyType
 
 
 ###----------------------------------------------------------------------------
@@ -54,3 +57,76 @@ class SettingsGroup():
 
 
 ###----------------------------------------------------------------------------
+
+
+class SettingsSnapshot():
+    """
+    An immutable copy of the OverrideAudit settings (with the defaults for any
+    settings that are not set applied) and the Sublime preferences, taken at a
+    single point in time.
+
+    Reading from a snapshot does not call into the Sublime API, and code that
+    holds on to a snapshot (such as a report thread) sees the same settings
+    throughout even if they change in the meantime.
+    """
+    __slots__ = ("settings", "prefs")
+
+    def __init__(self, settings=None, prefs=None):
+        object.__setattr__(self, "settings", MappingProxyType(dict(settings or {})))
+        object.__setattr__(self, "prefs", MappingProxyType(dict(prefs or {})))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("SettingsSnapshot is immutable")
+
+    @classmethod
+    def capture(cls, defaults=None):
+        """
+        Capture and return a snapshot of the current settings, using the
+        provided dictionary of defaults for OverrideAudit settings.
+        """
+        settings = dict(defaults or {})
+        settings.update(sublime.load_settings("OverrideAudit.sublime-settings").to_dict())
+
+        return cls(settings,
+                   sublime.load_settings("Preferences.sublime-settings").to_dict())
+
+    def get(self, key, default=None):
+        """
+        Get the value of an OverrideAudit setting.
+        """
+        return self.settings.get(key, default)
+
+    def pref(self, key, default=None):
+        """
+        Get the value of a Sublime preference.
+        """
+        return self.prefs.get(key, default)
+
+
+def settings_snapshot():
+    """
+    Return the current settings snapshot; this is captured the first time it
+    is needed and then again whenever refresh_settings_snapshot() is called.
+    """
+    if settings_snapshot.current is None:
+        refresh_settings_snapshot()
+
+    return settings_snapshot.current
+
+
+def refresh_settings_snapshot(defaults=None):
+    """
+    Capture a new settings snapshot to be returned by settings_snapshot(). If
+    defaults are given, they are used for this and all future snapshots. This
+    should be invoked whenever the OverrideAudit or Sublime preferences change.
+    """
+    if defaults is not None:
+        settings_snapshot.defaults = defaults
+
+    settings_snapshot.current = SettingsSnapshot.capture(settings_snapshot.defaults)
+
+settings_snapshot.current = None
+settings_snapshot.defaults = None
+
+
+###----------------------------------------------------------------------------
@@ -1,5 +1,6 @@
 import imp
 import sys
+from time import perf_counter
 
 
 ###----------------------------------------------------------------------------
@@ -17,19 +18,29 @@ def reload(prefix, modules=[""]):
 ###----------------------------------------------------------------------------
 
 
+_load_start = perf_counter()
+
 reload("lib")
 reload("src")
 
 from .lib import *
 from .src import *
 
+_import_time = perf_counter() - _load_start
+
 
 # ###----------------------------------------------------------------------------
 
 
 def plugin_loaded():
+    start = perf_counter()
     core.loaded()
 
+    init_time = perf_counter() - start
+    core.log("Plugin loaded in %.2fms (import %.2fms, initialization %.2fms)",
+             (_import_time + init_time) * 1000, _import_time * 1000,
+             init_time * 1000)
+
 
 def plugin_unloaded():
     core.unloaded()
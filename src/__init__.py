@@ -26,7 +26,11 @@ __all__ = [
     "OverrideAuditPackageReportCommand",
     "OverrideAuditOverrideReportCommand",
     "OverrideAuditDiffReportCommand",
+    "OverrideAuditProvenanceReportCommand",
+    "OverrideAuditDeltaReportCommand",
     "OverrideAuditRefreshReportCommand",
+    "OverrideAuditReportPageCommand",
+    "OverrideAuditSearchResourcesCommand",
     "OverrideAuditToggleOverrideCommand",
     "OverrideAuditCreateOverrideCommand",
     "OverrideAuditContextCreateOverrideCommand",
@@ -36,8 +40,11 @@ __all__ = [
     "OverrideAuditEditOverrideCommand",
     "OverrideAuditDeleteOverrideCommand",
     "OverrideAuditFreshenOverrideCommand",
+    "OverrideAuditToggleDiffHunkCommand",
     "OverrideAuditDiffPackageCommand",
     "OverrideAuditFreshenPackageCommand",
+    "OverrideAuditRevertPackageCommand",
+    "OverrideAuditFreshenAllCommand",
     "OverrideAuditDiffSingleCommand",
     "OverrideAuditModifyMarkCommand"
 ]
@@ -1,5 +1,4 @@
 import sublime
-from os.path import dirname, basename
 
 from .core import packages_with_overrides, log
 from .core import PackageListCollectionThread
@@ -12,6 +11,11 @@ from .core import PackageListCollectionThread
 # that is appended to the end of the resources that are currently overridden.
 _annotation = " [*Override*]"
 
+# The ResourceTree for the contents of each package that has been browsed,
+# keyed by package name. Each entry is a tuple of the package file and its
+# modification time along with the tree; see _package_tree().
+_tree_cache = {}
+
 
 ###---------------------------------------------------------------------------
 
@@ -76,6 +80,95 @@ class PackageBrowser():
 ###---------------------------------------------------------------------------
 
 
+class ResourceTree():
+    """
+    A prefix tree of the resources in a package, where each node represents a
+    folder. Folders are only broken down into their files and sub folders the
+    first time that they are looked at, so browsing into a single folder of a
+    large package does not require the whole tree to be built.
+
+    Folder names carry a trailing "/" so that they can be told apart from the
+    names of files.
+    """
+    __slots__ = ("count", "_paths", "_files", "_folders", "_children")
+
+    def __init__(self, paths):
+        self.count = len(paths)
+        self._paths = paths
+        self._files = None
+        self._folders = None
+        self._children = None
+
+    def _expand(self):
+        if self._paths is None:
+            return
+
+        files = []
+        children = {}
+        for path in self._paths:
+            head, sep, rest = path.partition("/")
+            if sep:
+                children.setdefault(head + sep, []).append(rest)
+            else:
+                files.append(head)
+
+        self._files = sorted(files)
+        self._folders = sorted(children)
+        self._children = {name: ResourceTree(paths) for name, paths in children.items()}
+        self._paths = None
+
+    def files(self):
+        self._expand()
+        return self._files
+
+    def folders(self):
+        self._expand()
+        return self._folders
+
+    def child(self, folder):
+        self._expand()
+        return self._children.get(folder)
+
+    def find(self, prefix):
+        """
+        Return the node for the folder with the given prefix (which is either
+        empty or ends with a "/"), or None if there is no such folder.
+        """
+        node = self
+        for folder in prefix.split("/")[:-1]:
+            node = node.child(folder + "/")
+            if node is None:
+                return None
+
+        return node
+
+
+###---------------------------------------------------------------------------
+
+
+def _package_tree(pkg_info):
+    """
+    Get the ResourceTree for the contents of the given package. For packages
+    with a sublime-package file, the tree is cached across browses until the
+    package file changes. Packages that are only unpacked are not cached,
+    since their content can change at any time.
+    """
+    package_file = pkg_info.package_file()
+    if not package_file:
+        return ResourceTree(list(pkg_info.unpacked_contents() or []))
+
+    key = (package_file, pkg_info.package_mtime())
+    cached = _tree_cache.get(pkg_info.name)
+    if cached is None or cached[0] != key:
+        cached = (key, ResourceTree(list(pkg_info.package_contents())))
+        _tree_cache[pkg_info.name] = cached
+
+    return cached[1]
+
+
+###---------------------------------------------------------------------------
+
+
 class ResourceBrowser():
     """
     Provide the ability to browse for a package file among the list of files
@@ -93,122 +186,103 @@ class ResourceBrowser():
     determine that they're overrides. This is only active when the resource
     browsing type is ALL.
 
-    The browse will use hierarchy if the package content has a structure.
+    The browse will use hierarchy if the package content has a structure. The
+    package content comes from a cached ResourceTree; overrides and unknown
+    files are applied to it as each folder is displayed.
     """
-
-    # These keys in the result dictionary tell us what files and folders exist
-    # at this particular nesting level in the resulting output dictionary.
-    FILES='files'
-    FOLDERS='folders'
-
-    # In addition to the above, while browsing package content this key is
-    # added to stack entries to indicate what the current item is at the
-    # stack entry chosen.
-    CURRENT='current'
-
     def __init__(self, window=None, file_type=ResourceType.ALL, unknown=True,
                  annotate_overrides=False):
         self.window = window or sublime.active_window()
         self.file_type = file_type
         self.unknown = unknown
-        self.cache = {}
         self.annotate = annotate_overrides
 
-    def _explode_files(self, files):
+    def _prepare(self, pkg_info):
         """
-        Explode a list of files that represent packge file contents into a dict
-        which describes their logical path layout.
-
-        The dict has keys that indicate the files and folders stored at this
-        level, with each folder also being represented as a key that points to
-        another similar dict for the content at that level.
+        Set up the trees and override information needed to browse the given
+        package based on the browse type.
         """
-        def handle_file(file_spec, branch):
-            parts = file_spec.split('/', 1)
-            if len(parts) == 1:
-                return branch[self.FILES].append(parts[0])
-
-            subdir, remaining_path = parts[0] + '/', parts[1]
-            if subdir not in branch:
-                branch[self.FOLDERS].append(subdir)
-                branch[subdir] = {self.FILES: [], self.FOLDERS: []}
+        self.overrides = pkg_info.override_files(simple=True)
+        if self.file_type == ResourceType.OVERRIDE:
+            self.tree = ResourceTree(list(self.overrides))
+        else:
+            self.tree = _package_tree(pkg_info)
 
-            handle_file(remaining_path, branch[subdir])
+        # Files of unknown status are not in the package tree; they're kept in
+        # a (usually small) tree of their own and merged in while browsing.
+        unknown = pkg_info.unknown_override_files() if self.unknown else []
+        self.unknown_tree = ResourceTree(list(unknown))
 
-        retVal = {self.FILES: [], self.FOLDERS: []}
-        for file in sorted(files, key=lambda fn: (dirname(fn), basename(fn))):
-            handle_file(file, retVal)
+    def _folder_visible(self, prefix, node):
+        if self.file_type != ResourceType.NONOVERRIDE:
+            return node.count > 0
 
-        return retVal
+        # Only show folders that contain something that's not an override
+        overridden = sum(1 for res in self.overrides if res.startswith(prefix))
+        return node.count > overridden
 
-    def _get_pkg_content(self, pkg_info):
+    def _listing(self, prefix):
         """
-        Get the browseable contents of the packge given, based on the browse
-        type. This caches the result in case the user goes out of a package and
-        then comes back in as part of a larger overall browse operation.
+        Return a tuple of the folders and the files to display for the folder
+        with the given prefix, filtered and annotated based on the browse type.
         """
-        if pkg_info.name not in self.cache:
-            # Collect all of the contents of the package; if there is a package
-            # file, that is the cannonical content; otherwise get the list of
-            # unpacked files.
-            if pkg_info.package_file():
-                contents = pkg_info.package_contents()
-            else:
-                contents = pkg_info.unpacked_contents()
-
-            overrides = pkg_info.override_files(simple=True)
-            if self.file_type == ResourceType.ALL:
-                if not self.annotate:
-                    res_list = contents
-                else:
-                    res_list = contents - overrides
-                    res_list |= {res + _annotation for res in overrides }
-            else:
-                if self.file_type == ResourceType.OVERRIDE:
-                    res_list = overrides
-                else:
-                    res_list = contents - overrides
+        folders = set()
+        files = set()
 
-            # Include files of unknown status if required.
-            if self.unknown:
-                res_list |= pkg_info.unknown_override_files()
+        node = self.tree.find(prefix)
+        if node is not None:
+            for folder in node.folders():
+                if self._folder_visible(prefix + folder, node.child(folder)):
+                    folders.add(folder)
 
-            self.cache[pkg_info.name] = self._explode_files(res_list)
+            annotate = self.annotate and self.file_type == ResourceType.ALL
+            for name in node.files():
+                is_override = self.file_type != ResourceType.OVERRIDE and prefix + name in self.overrides
+                if is_override and self.file_type == ResourceType.NONOVERRIDE:
+                    continue
 
-        return self.cache[pkg_info.name]
+                files.add(name + _annotation if is_override and annotate else name)
 
-    def select_item(self, captions, items, prior_text, stack, index):
-        if index >= 0:
-            if index == 0 and len(stack) > 0:
-                items = stack.pop()
-                return self._display_panel(items, prior_text, stack)
+        node = self.unknown_tree.find(prefix)
+        if node is not None:
+            folders.update(node.folders())
+            files.update(node.files())
+
+        return sorted(folders), sorted(files)
 
+    def select_item(self, captions, folder_count, prefix, stack, index):
+        if index >= 0:
+            has_prior = len(stack) > 0 or self.return_to_pkg
             selected = captions[index]
-            children = items.get(selected, None)
 
-            if children is not None:
-                items[self.CURRENT] = selected
-                stack.append(items)
-                return self._display_panel(children, prior_text, stack)
+            # At the top level, the prior item returns to the package list,
+            # which the caller handles.
+            if has_prior and index == 0:
+                if len(stack) > 0:
+                    return self._display_panel(stack.pop(), stack)
+
+                return self.on_done(selected)
+
+            if (index - has_prior) < folder_count:
+                stack.append(prefix)
+                return self._display_panel(prefix + selected, stack)
 
             if selected.endswith(_annotation):
                 selected = selected[:-len(_annotation)]
 
-            resource = [entry[self.CURRENT] for entry in stack]
-            resource.append(selected)
-
-            return self.on_done(''.join(resource))
+            return self.on_done(prefix + selected)
 
         return self.on_done(None)
 
-    def _display_panel(self, items, prior_text, stack):
-        captions = items[self.FOLDERS] + items[self.FILES]
+    def _display_panel(self, prefix, stack):
+        folders, files = self._listing(prefix)
+        captions = folders + files
         if len(stack) > 0 or self.return_to_pkg:
-            captions.insert(0, prior_text)
+            captions.insert(0, "..")
 
         self.window.show_quick_panel(
             items=captions,
-            on_select=lambda index: self.select_item(captions, items, prior_text, stack, index))
+            on_select=lambda index: self.select_item(captions, len(folders), prefix, stack, index))
 
     def browse(self, pkg_info, return_to_pkg, on_done):
         """
@@ -226,13 +300,13 @@ class ResourceBrowser():
         self.on_done = on_done
         self.return_to_pkg = return_to_pkg
 
-        items = self._get_pkg_content(pkg_info)
-        if not items:
+        self._prepare(pkg_info)
+        if self._listing("") == ([], []):
             log("Package '%s' has no resources of the selected type" % pkg_info.name,
                 status=True, dialog=True)
             return on_done(None)
 
-        self._display_panel(items, "..", [])
+        self._display_panel("", [])
 
 
 ###---------------------------------------------------------------------------
@@ -4,13 +4,19 @@ reload("src.commands", ["package_report", "override_report", "diff_report",
        "refresh_report", "diff_single", "toggle_override", "create_override",
        "diff_override", "edit_override", "delete_override", "freshen_override",
        "diff_package", "diff_externally", "revert_override", "freshen_package",
-       "modify_mark", "context_create_override"])
+       "modify_mark", "context_create_override", "revert_package",
+       "freshen_all", "search_resources", "provenance_report",
+       "delta_report", "toggle_diff_hunk", "report_page"])
 
 from .package_report import OverrideAuditPackageReportCommand
+from .search_resources import OverrideAuditSearchResourcesCommand
 from .override_report import OverrideAuditOverrideReportCommand
 from .diff_report import OverrideAuditDiffReportCommand
+from .provenance_report import OverrideAuditProvenanceReportCommand
+from .delta_report import OverrideAuditDeltaReportCommand
 from .diff_single import OverrideAuditDiffSingleCommand
 from .toggle_override import OverrideAuditToggleOverrideCommand
+from .toggle_diff_hunk import OverrideAuditToggleDiffHunkCommand
 from .create_override import OverrideAuditCreateOverrideCommand
 from .context_create_override import OverrideAuditContextCreateOverrideCommand
 from .diff_override import OverrideAuditDiffOverrideCommand
@@ -21,7 +27,10 @@ from .delete_override import OverrideAuditDeleteOverrideCommand
 from .freshen_override import OverrideAuditFreshenOverrideCommand
 from .diff_package import OverrideAuditDiffPackageCommand
 from .freshen_package import OverrideAuditFreshenPackageCommand
+from .revert_package import OverrideAuditRevertPackageCommand
+from .freshen_all import OverrideAuditFreshenAllCommand
 from .refresh_report import OverrideAuditRefreshReportCommand
+from .report_page import OverrideAuditReportPageCommand
 from .modify_mark import OverrideAuditModifyMarkCommand
 
 __all__ = [
@@ -29,7 +38,11 @@ __all__ = [
     "OverrideAuditPackageReportCommand",
     "OverrideAuditOverrideReportCommand",
     "OverrideAuditDiffReportCommand",
+    "OverrideAuditProvenanceReportCommand",
+    "OverrideAuditDeltaReportCommand",
     "OverrideAuditRefreshReportCommand",
+    "OverrideAuditReportPageCommand",
+    "OverrideAuditSearchResourcesCommand",
 
     # Override commands
     "OverrideAuditToggleOverrideCommand",
@@ -41,10 +54,15 @@ __all__ = [
     "OverrideAuditEditOverrideCommand",
     "OverrideAuditDeleteOverrideCommand",
     "OverrideAuditFreshenOverrideCommand",
+    "OverrideAuditToggleDiffHunkCommand",
 
     # Package commands
     "OverrideAuditDiffPackageCommand",
     "OverrideAuditFreshenPackageCommand",
+    "OverrideAuditRevertPackageCommand",
+
+    # Global commands
+    "OverrideAuditFreshenAllCommand",
 
     # General
     "OverrideAuditDiffSingleCommand",
@@ -2,7 +2,7 @@ import sublime
 import sublime_plugin
 from os.path import isfile
 
-from ..core import setup_new_override_view
+from ..core import setup_new_override_view, packed_resource_exists
 from ..core import ContextHelper
 
 
@@ -19,13 +19,18 @@ class OverrideAuditContextCreateOverrideCommand(ContextHelper,sublime_plugin.Tex
         target = self.view_target(self.view, **kwargs)
         window = target.window()
         if self.package is not None and window is not None:
-            window.run_command("override_audit_create_override", {
-                "package": self.package
-                })
+            args = {"package": self.package}
+            if self.resource is not None:
+                args["file"] = self.resource
+
+            window.run_command("override_audit_create_override", args)
         else:
             setup_new_override_view(target, reposition=False)
 
     def description(self, **kwargs):
+        if self.resource is not None:
+            return self.caption("Create Override '%s'" % (self.resource), **kwargs)
+
         if self.package is not None:
             return self.caption("Create Override in '%s'" % (self.package), **kwargs)
 
@@ -34,14 +39,24 @@ class OverrideAuditContextCreateOverrideCommand(ContextHelper,sublime_plugin.Tex
     def _ctx_package(self, **kwargs):
         """
         Check the context of the command to see if it's being triggered on the
-        name of a package (only) which can contain overrides. If so, store the
-        name in the tracking variable and return it. Otherwise, reset the
-        tracking variable and return None.
+        name of a package (only) which can contain overrides, or on the name of
+        a packed resource that is not overridden yet (such as in a search
+        report). If so, store the names in the tracking variables and return
+        the package name. Otherwise, reset the tracking variables and return
+        None.
         """
         target = self.view_target(self.view, **kwargs)
         ctx = self.view_context(target, False, **kwargs)
 
         self.package = ctx.package if self.package_overrides_possible(target, ctx) else None
+        self.resource = None
+
+        if (ctx.has_target() and ctx.source == "context" and
+                not self.override_exists(ctx) and
+                packed_resource_exists(f"Packages/{ctx.package}/{ctx.override}")):
+            self.package = ctx.package
+            self.resource = ctx.override
+
         return self.package
 
 
@@ -71,7 +86,7 @@ class OverrideAuditContextCreateOverrideCommand(ContextHelper,sublime_plugin.Tex
         # We can only enable the command if this file represents a resource
         # that actually exists in the package.
         res = name[len(spp) + 1:].replace("\\", "/")
-        if "Packages/" + res not in sublime.find_resources(res.split('/')[-1]):
+        if not packed_resource_exists("Packages/" + res):
             return False
 
         return True
@@ -4,7 +4,7 @@ import sublime_plugin
 import os
 
 from ..core import log
-from ..core import setup_new_override_view
+from ..core import setup_new_override_view, packed_resource_exists
 from ..browse import ResourceType, PackageResourceBrowser
 
 
@@ -44,7 +44,7 @@ class OverrideAuditCreateOverrideCommand(sublime_plugin.WindowCommand):
 
         # No unpacked file; verify the package contains the resource
         res = '/'.join([package, file])
-        if f"Packages/{res}" not in sublime.find_resources(res.split('/')[-1]):
+        if not packed_resource_exists(f"Packages/{res}"):
             return log(f"'{file}' not found; cannot create override", dialog=True)
 
         self.window.run_command("open_file", {"file": f"${{packages}}/{res}"})
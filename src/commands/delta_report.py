@@ -0,0 +1,75 @@
+import sublime_plugin
+
+from ..core import oa_syntax, decorate_pkg_name, log
+from ..core import ReportGenerationThread
+from ...lib.packages import PackageList
+from ...lib.snapshot import AuditSnapshot, snapshot_delta
+
+###----------------------------------------------------------------------------
+
+
+class DeltaReportThread(ReportGenerationThread):
+    """
+    Generate a report on what has changed in the installed packages since the
+    last override report was generated, based on the snapshot that it saved.
+    """
+    def _process(self):
+        snapshot = AuditSnapshot.load()
+        if snapshot is None:
+            return log("No prior audit to compare against; generate an Override Report first",
+                       status=True, dialog=True)
+
+        pkg_list = PackageList(snapshot=self.snapshot)
+        delta = snapshot_delta(snapshot, pkg_list)
+
+        title = "Changes since the audit of %s" % snapshot.generated
+        result = [title, "=" * len(title), "",
+                  "[+] New  [-] Removed  [X] Newly expired  [F] No longer expired",
+                  "[B] Packed file changed  [*] Override changed\n",
+                  self._generation_time()]
+
+        packages = {}
+        expired_pkgs = []
+        for pkg_name in sorted(delta, key=lambda name: name.lower()):
+            notes, changes = delta[pkg_name]
+            if pkg_name in pkg_list:
+                pkg_info = pkg_list[pkg_name]
+                packages[pkg_name] = pkg_info.status(detailed=True, metadata=False)
+                result.append(decorate_pkg_name(pkg_info))
+            else:
+                result.append("[   ] %s" % pkg_name)
+
+            result.extend("    <%s>" % note for note in notes)
+            for mark, override in changes:
+                result.append("  `- [%s] %s" % (mark, override))
+                if mark == "X" and pkg_name not in expired_pkgs:
+                    expired_pkgs.append(pkg_name)
+
+            result.append("")
+
+        if not delta:
+            result.append("No changes since the last audit")
+
+        self._set_content("OverrideAudit: Delta Report", result, ":delta",
+                          oa_syntax("OA-DeltaReport"), {
+                            "override_audit_report_packages": packages,
+                            "override_audit_expired_pkgs": expired_pkgs,
+                            "context_menu": "OverrideAuditReport.sublime-menu"
+                          }, pkg_list=pkg_list)
+
+
+###----------------------------------------------------------------------------
+
+
+class OverrideAuditDeltaReportCommand(sublime_plugin.WindowCommand):
+    """
+    Generate a report on the changes to packages and overrides since the last
+    time an override report was generated.
+    """
+    def run(self, force_reuse=False):
+        DeltaReportThread(self.window, "Generating Delta Report",
+                          self.window.active_view(),
+                          force_reuse=force_reuse).start()
+
+
+###----------------------------------------------------------------------------
@@ -1,9 +1,13 @@
 import sublime_plugin
 
-from ..core import oa_syntax, oa_setting, decorate_pkg_name, log
+from ..core import oa_syntax, decorate_pkg_name, log
 from ..core import get_ignore_unknown_patterns
 from ..core import packages_with_overrides, ReportGenerationThread
+from ..core import export_filename
 from ...lib.packages import PackageList, OverrideDiffResult
+from ...lib.packages import override_candidates
+from ...lib.export import diff_hunks
+from ...lib.scheduler import probe_packages, prefetch_diffs
 
 
 ###----------------------------------------------------------------------------
@@ -21,7 +25,11 @@ class BulkDiffReportThread(ReportGenerationThread):
         package = self.args["package"]
         exclude_unchanged = self.args["exclude_unchanged"]
 
-        pkg_list = PackageList(package)
+        # When diffing all packages, only those that can contain simple
+        # overrides need to be collected.
+        pkg_list = PackageList(package if package is not None
+                               else override_candidates(complete=False),
+                               self.snapshot)
 
         if package is not None:
             if package not in pkg_list:
@@ -34,13 +42,13 @@ class BulkDiffReportThread(ReportGenerationThread):
 
             items = [package]
         else:
-            items = packages_with_overrides(pkg_list)
+            items = packages_with_overrides(pkg_list, snapshot=self.snapshot)
 
         self._diff_packages(items, pkg_list, package is not None, exclude_unchanged)
 
     def _diff_packages(self, names, pkg_list, single_package, exclude_unchanged):
-        context_lines = oa_setting("diff_context_lines")
-        binary_patterns = oa_setting("binary_file_patterns")
+        context_lines = self.snapshot.get("diff_context_lines")
+        binary_patterns = self.snapshot.get("binary_file_patterns")
 
         ignore_patterns = get_ignore_unknown_patterns()
 
@@ -69,7 +77,14 @@ class BulkDiffReportThread(ReportGenerationThread):
 
         result.append(self._generation_time())
 
+        if self.exporter is not None:
+            self.exporter.start(report_type, packages=names,
+                                exclude_unchanged=exclude_unchanged)
+
+        self._schedule(probe_packages, [pkg_list[name] for name in names])
+
         pkg_count = 0
+        sections = []
         for name in names:
             pkg_result = []
             pkg_info = pkg_list[name]
@@ -82,11 +97,16 @@ class BulkDiffReportThread(ReportGenerationThread):
                                        expired_pkgs, unknown_files,
                                        ignore_patterns, exclude_unchanged)
 
-            if diff_count:
+            if diff_count and self.exporter is None:
                 pkg_count += 1
+                sections.append((name, self._section_summary(pkg_result),
+                                 len(result), len(result) + len(pkg_result)))
                 result.extend(pkg_result)
 
-                packages[name] = pkg_info.status(detailed=True)
+                packages[name] = pkg_info.status(detailed=True, metadata=False)
+
+        if self.exporter is not None:
+            return
 
         if not pkg_count and exclude_unchanged:
             if len(names) == 1 and single_package:
@@ -101,7 +121,17 @@ class BulkDiffReportThread(ReportGenerationThread):
                             "override_audit_unknown_overrides": unknown_files,
                             "override_audit_exclude_unchanged": exclude_unchanged,
                             "context_menu": "OverrideAuditReport.sublime-menu"
-                          })
+                          }, sections, pkg_list)
+
+    def _section_summary(self, lines):
+        """
+        Return the summary of the section of the report for a package, given
+        the lines in the section; diffs are indented past the override names.
+        """
+        items = [line for line in lines if line[:4] == "    " and line[4:5] not in (" ", "<", "")]
+        return self._page_summary(len(items),
+                                  sum(1 for item in items if item.startswith("    [X] ")),
+                                  sum(1 for item in items if item.startswith("    [?] ")))
 
     def _perform_diff(self, pkg_info, context_lines, result, expired_pkgs,
                       unknown_files, ignore_patterns, exclude_unchanged):
@@ -110,7 +140,7 @@ class BulkDiffReportThread(ReportGenerationThread):
         unknown_overrides = pkg_info.unknown_override_files()
         pkg_files = pkg_info.unpacked_contents_unknown_filtered(ignore_patterns) or []
 
-        empty_diff_hdr = oa_setting("diff_empty_hdr")
+        empty_diff_hdr = self.snapshot.get("diff_empty_hdr")
 
         if expired_list:
             expired_pkgs.append(pkg_info.name)
@@ -122,6 +152,18 @@ class BulkDiffReportThread(ReportGenerationThread):
         # the caller won't generate any output for this package at all.
         changes_reported = 0 if exclude_unchanged else 1
 
+        if self.exporter is not None:
+            self.exporter.write("package", package=pkg_info.name,
+                                status=pkg_info.status(detailed=True, metadata=False))
+
+        # Diffs are indented in the report but not when exporting.
+        indent = None if self.exporter is not None else 8
+
+        # Overrides are diffed in the order that they appear in the report;
+        # the scheduler can read and diff them all at once ahead of time.
+        self._schedule(prefetch_diffs, pkg_info,
+                       [file for file in pkg_files if file not in unknown_overrides])
+
         for file in pkg_files:
             excluded = False
             if file in unknown_overrides:
@@ -131,7 +173,7 @@ class BulkDiffReportThread(ReportGenerationThread):
                 diff = pkg_info.override_diff(file, context_lines,
                                               empty_result="No differences found",
                                               binary_result="<File is binary>",
-                                              indent=8)
+                                              indent=indent)
 
             if diff is None:
                 content = (" " * 8) + ("Error opening or decoding file;"
@@ -144,8 +186,14 @@ class BulkDiffReportThread(ReportGenerationThread):
                     log(f"Excluded from report: {pkg_info.name}/{file}")
                     excluded = True
 
-            if not excluded:
-                changes_reported += 1
+            if excluded:
+                continue
+
+            changes_reported += 1
+            if self.exporter is not None:
+                self._export_override(pkg_info, file, diff, file in expired_list,
+                                      file in unknown_overrides)
+            else:
                 if file in expired_list:
                     result.append(f"    [X] {file}")
                 elif file in unknown_overrides:
@@ -166,6 +214,24 @@ class BulkDiffReportThread(ReportGenerationThread):
 
         return changes_reported
 
+    def _export_override(self, pkg_info, override, diff, expired, unknown):
+        """
+        Export the record for a single override and its diff.
+        """
+        zipinfo = None if unknown else pkg_info.override_file_zipinfo(override)
+        is_diffable = diff is not None and not unknown and not diff.is_binary
+
+        self.exporter.write("override",
+                            package=pkg_info.name,
+                            override=override,
+                            expired=expired,
+                            unknown=unknown,
+                            binary=diff is not None and diff.is_binary,
+                            error=diff is None,
+                            base_crc=None if zipinfo is None else zipinfo.CRC,
+                            override_crc=pkg_info.unpacked_override_crc(override),
+                            hunks=diff_hunks(diff.result) if is_diffable else [])
+
 
 ###----------------------------------------------------------------------------
 
@@ -178,11 +244,14 @@ class OverrideAuditDiffReportCommand(sublime_plugin.WindowCommand):
     This is invoked from OverrideAuditDiffOverride when you invoke that command
     with the bulk argument set to true.
     """
-    def run(self, package=None, force_reuse=False, exclude_unchanged=False):
+    def run(self, package=None, force_reuse=False, exclude_unchanged=False,
+            export=None):
         BulkDiffReportThread(self.window, "Generating Bulk Diff",
                              self.window.active_view(),
                              package=package, force_reuse=force_reuse,
-                             exclude_unchanged=exclude_unchanged).start()
+                             exclude_unchanged=exclude_unchanged,
+                             export=export_filename(self.window, export,
+                                                    "diff_report")).start()
 
 
 ###----------------------------------------------------------------------------
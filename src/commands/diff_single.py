@@ -82,7 +82,9 @@ class OverrideAuditDiffSingleCommand(sublime_plugin.WindowCommand):
         callback = lambda thread: self._loaded(thread, package, override,
                                                bulk, exclude_unchanged)
         PackageListCollectionThread(self.window, "Collecting Package List",
-                                    callback, get_overrides=True).start()
+                                    callback, name_list=package,
+                                    candidates_only=True,
+                                    get_overrides=True).start()
 
 
 ###----------------------------------------------------------------------------
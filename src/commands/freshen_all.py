@@ -0,0 +1,37 @@
+import sublime_plugin
+
+from ..core import ContextHelper, freshen_override
+
+
+###----------------------------------------------------------------------------
+
+
+class OverrideAuditFreshenAllCommand(ContextHelper,sublime_plugin.TextCommand):
+    """
+    Freshen every expired override in every package on disk at once, such as
+    after an upgrade of Sublime updates all of the shipped packages. When
+    invoked from a report, the report is updated to remove all of the expired
+    marks.
+    """
+    def run(self, edit, **kwargs):
+        freshen_override(self.view_target(self.view, **kwargs))
+
+    def description(self, **kwargs):
+        return self.caption("Freshen All Expired Overrides", **kwargs)
+
+    def is_visible(self, **kwargs):
+        if self.always_visible(**kwargs):
+            return True
+
+        return self.is_enabled(**kwargs)
+
+    def is_enabled(self, **kwargs):
+        # In a report, only enable when the report has expired packages.
+        if self._report_type(**kwargs) is None:
+            return True
+
+        target = self.view_target(self.view, **kwargs)
+        return bool(self._setting(target, "override_audit_expired_pkgs", []))
+
+
+###----------------------------------------------------------------------------
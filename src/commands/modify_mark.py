@@ -1,7 +1,8 @@
 import sublime
 import sublime_plugin
 
-from ..core import find_override
+from ..core import find_overrides
+from ...lib.report_cache import report_cache
 
 
 ###----------------------------------------------------------------------------
@@ -11,12 +12,48 @@ class OverrideAuditModifyMarkCommand(sublime_plugin.TextCommand):
     """
     Modify the mark assigned to an override in a report. An override only
     supports a single mark, if any. Passing a mark of None removes any mark.
+
+    Instead of a single package and override, a list of [package, override]
+    pairs can be given in overrides to apply the same mark to all of them in
+    a single edit.
+
+    In a paged report, overrides in pages other than the one displayed are
+    modified in the stored pages instead.
     """
-    def run(self, edit, package, override, mark=None):
-        pos = find_override(self.view, package, override)
-        if pos is None:
+    def run(self, edit, package=None, override=None, mark=None, overrides=None):
+        if overrides is None:
+            overrides = [[package, override]]
+
+        positions = find_overrides(self.view)
+        regions = [positions[(pkg, name)] for pkg, name in overrides
+                   if (pkg, name) in positions]
+
+        # Modify from the end of the buffer back, so that the changes don't
+        # alter the positions of the remaining overrides.
+        regions.sort(key=lambda region: region.begin(), reverse=True)
+
+        self.view.set_read_only(False)
+        for pos in regions:
+            self._modify(edit, pos, mark)
+        self.view.set_read_only(True)
+
+        if self.view.settings().has("override_audit_report_page"):
+            self._modify_pages(overrides, positions, mark)
+
+    def _modify_pages(self, overrides, positions, mark):
+        settings = self.view.settings()
+        pages = report_cache.pages(settings.get("override_audit_report_id"))
+        if pages is None:
             return
 
+        current = settings.get("override_audit_report_page")
+        for pkg, name in overrides:
+            if pkg != current and (pkg, name) not in positions:
+                pages.modify_mark(pkg, name, mark)
+
+        report_cache.pages_changed(settings.get("override_audit_report_id"))
+
+    def _modify(self, edit, pos, mark):
         mark_pos = sublime.Region(pos.begin() - 4, pos.begin())
         current_mark = self.view.substr(mark_pos)
 
@@ -29,11 +66,9 @@ class OverrideAuditModifyMarkCommand(sublime_plugin.TextCommand):
             if current_mark[0] == " ":
                 mark_pos = sublime.Region(pos.begin(), pos.begin())
 
-        self.view.set_read_only(False)
         self.view.replace(edit, mark_pos, new_mark)
-        self.view.set_read_only(True)
 
-    def is_enabled(self, package, override, mark=None):
+    def is_enabled(self, package=None, override=None, mark=None, overrides=None):
         return self.view.settings().has("override_audit_report_type")
 
 
@@ -1,10 +1,12 @@
 import sublime
 import sublime_plugin
 
-from ..core import oa_syntax, oa_setting, decorate_pkg_name, log
+from ..core import oa_syntax, decorate_pkg_name, log
 from ..core import get_ignore_unknown_patterns, filter_unmodified_overrides
-from ..core import ReportGenerationThread
-from ...lib.packages import PackageList
+from ..core import ReportGenerationThread, export_filename
+from ...lib.packages import PackageList, override_candidates
+from ...lib.snapshot import AuditSnapshot
+from ...lib.scheduler import probe_packages
 
 ###----------------------------------------------------------------------------
 
@@ -16,9 +18,13 @@ class OverrideReportThread(ReportGenerationThread):
     optional parameter filters to only show expired results.
     """
     def _process(self):
-        pkg_list = PackageList()
+        # Only packages that can contain overrides appear in the report, so
+        # don't bother collecting any others.
+        pkg_list = PackageList(override_candidates(), self.snapshot)
 
-        ignored = oa_setting("ignore_overrides_in")
+        ignored = self.snapshot.get("ignore_overrides_in")
+        self._schedule(probe_packages, [pkg_info for pkg_name, pkg_info in pkg_list
+                                        if pkg_name not in ignored])
 
         only_expired = self.args["only_expired"]
         ignore_empty = self.args["ignore_empty"]
@@ -33,6 +39,10 @@ class OverrideReportThread(ReportGenerationThread):
 
         ignore_patterns = get_ignore_unknown_patterns()
 
+        if self.exporter is not None:
+            self.exporter.start(report_type, only_expired=only_expired,
+                                exclude_unchanged=exclude_unchanged)
+
         expired_pkgs = []
         unknown_files = {}
         packages = {}
@@ -47,15 +57,32 @@ class OverrideReportThread(ReportGenerationThread):
         result.append(self._generation_time())
 
         displayed = 0
+        sections = []
         for pkg_name, pkg_info in pkg_list:
             if pkg_name not in ignored:
+                start = len(result)
                 if self._output_package(result, pkg_info, only_expired,
                                         expired_pkgs, unknown_files,
                                         exclude_unchanged,
                                         ignore_patterns):
-                    packages[pkg_name] = pkg_info.status(detailed=True)
+                    if self.exporter is None:
+                        packages[pkg_name] = pkg_info.status(detailed=True, metadata=False)
+                        sections.append((pkg_name, self._section_summary(result[start:]),
+                                         start, len(result)))
                     displayed += 1
 
+        if self.exporter is not None:
+            return
+
+        # Record the state of all packages as of a full audit, for use by the
+        # delta report; reports of only expired overrides (such as those that
+        # are triggered automatically after an upgrade) leave the prior audit
+        # in place. This is done in the background so that it doesn't hold up
+        # the display of the report.
+        if not only_expired and not ignore_empty:
+            sublime.set_timeout_async(lambda: AuditSnapshot.capture(
+                PackageList(snapshot=self.snapshot), AuditSnapshot.load()).save())
+
         if displayed == 0:
             if ignore_empty:
                 return sublime.set_timeout(self._notify_empty, 10)
@@ -70,7 +97,7 @@ class OverrideReportThread(ReportGenerationThread):
                             "override_audit_unknown_overrides": unknown_files,
                             "override_audit_exclude_unchanged": exclude_unchanged,
                             "context_menu": "OverrideAuditReport.sublime-menu"
-                          })
+                          }, sections, pkg_list)
 
     def _output_package(self, result, pkg_info, only_expired, expired_pkgs,
                         unknown_files, exclude_unchanged, ignore_patterns):
@@ -97,6 +124,12 @@ class OverrideReportThread(ReportGenerationThread):
         if expired_overrides:
             expired_pkgs.append(pkg_info.name)
 
+        if self.exporter is not None:
+            self._export_package(pkg_info, pkg_files, normal_overrides,
+                                 expired_overrides, unknown_overrides,
+                                 only_expired)
+            return True
+
         result.append(decorate_pkg_name(pkg_info))
 
         if unknown_overrides:
@@ -109,6 +142,16 @@ class OverrideReportThread(ReportGenerationThread):
 
         return True
 
+    def _section_summary(self, lines):
+        """
+        Return the summary of the section of the report for a package, given
+        the lines in the section.
+        """
+        items = [line for line in lines if line.startswith("  `- ")]
+        return self._page_summary(len(items),
+                                  sum(1 for item in items if item.startswith("  `- [X] ")),
+                                  sum(1 for item in items if item.startswith("  `- [?] ")))
+
     def _output_overrides(self, result, pkg_files, overrides, expired, unknown, only_expired):
         # If there are unknown overrides, we don't say that there are no simple
         # overrides found.
@@ -119,18 +162,45 @@ class OverrideReportThread(ReportGenerationThread):
         if only_expired and not expired:
             return result.append("    <No expired simple overrides found>")
 
-        for item in (expired if only_expired else pkg_files):
-            fmt = "  `- {}"
+        for item, mark in self._report_items(pkg_files, overrides, expired,
+                                             unknown, only_expired):
+            fmt = "  `- {}" if mark is None else "  `- [%s] {}" % mark
+            result.append(fmt.format(item))
+
+    def _report_items(self, pkg_files, overrides, expired, unknown, only_expired):
+        """
+        Yield the overrides that should appear in the report for a package,
+        along with the mark that should be applied to them (if any).
+        """
+        for item in (expired if only_expired else pkg_files or []):
             if item in expired:
-                fmt = "  `- [X] {}"
+                yield item, "X"
             elif item in unknown:
-                fmt = "  `- [?] {}"
-            elif item not in overrides:
+                yield item, "?"
+            elif item in overrides:
                 # If we're filtering unchanged, this item might not be in the
                 # list, but neither are unknown things, so we need to do this
                 # last.
-                continue
-            result.append(fmt.format(item))
+                yield item, None
+
+    def _export_package(self, pkg_info, pkg_files, overrides, expired, unknown,
+                        only_expired):
+        """
+        Export the records for a single package and its overrides.
+        """
+        self.exporter.write("package", package=pkg_info.name,
+                            status=pkg_info.status(detailed=True, metadata=False))
+
+        for item, mark in self._report_items(pkg_files, overrides, expired,
+                                             unknown, only_expired):
+            zipinfo = None if mark == "?" else pkg_info.override_file_zipinfo(item)
+            self.exporter.write("override",
+                                package=pkg_info.name,
+                                override=item,
+                                expired=mark == "X",
+                                unknown=mark == "?",
+                                base_crc=None if zipinfo is None else zipinfo.CRC,
+                                override_crc=pkg_info.unpacked_override_crc(item))
 
     def _empty_msg(self):
         return "No packages with %soverrides found" % (
@@ -150,13 +220,15 @@ class OverrideAuditOverrideReportCommand(sublime_plugin.WindowCommand):
     optional parameter filters this to only show expired results if desired.
     """
     def run(self, force_reuse=False, only_expired=False, ignore_empty=False,
-            exclude_unchanged=False):
+            exclude_unchanged=False, export=None):
         OverrideReportThread(self.window, "Generating Override Report",
                              self.window.active_view(),
                              force_reuse=force_reuse,
                              only_expired=only_expired,
                              ignore_empty=ignore_empty,
-                             exclude_unchanged=exclude_unchanged).start()
+                             exclude_unchanged=exclude_unchanged,
+                             export=export_filename(self.window, export,
+                                                    "override_report")).start()
 
 
 ###----------------------------------------------------------------------------
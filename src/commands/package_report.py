@@ -1,7 +1,7 @@
 import sublime_plugin
 
 from ..core import oa_syntax, decorate_pkg_name
-from ..core import ReportGenerationThread
+from ..core import ReportGenerationThread, export_filename
 from ...lib.packages import PackageList
 
 ###----------------------------------------------------------------------------
@@ -12,7 +12,7 @@ class PackageReportThread(ReportGenerationThread):
     Generate a tabular report of all installed packages and their state.
     """
     def _process(self):
-        pkg_list = PackageList()
+        pkg_list = PackageList(snapshot=self.snapshot)
         pkg_counts = pkg_list.package_counts()
 
         title = f"{len(pkg_list)} Total Packages"
@@ -27,6 +27,9 @@ class PackageReportThread(ReportGenerationThread):
 
         r_sep = "+------------------------------------------+-----+-----+-----+"
 
+        if self.exporter is not None:
+            return self._export(pkg_list, pkg_counts)
+
         packages = {}
         result = [title, t_sep, "", self._generation_time(), stats, r_sep]
         for pkg_name, pkg_info in pkg_list:
@@ -44,7 +47,20 @@ class PackageReportThread(ReportGenerationThread):
                           oa_syntax("OA-PkgReport"), {
                             "override_audit_report_packages": packages,
                             "context_menu": "OverrideAuditReport.sublime-menu"
-                         })
+                         }, pkg_list=pkg_list)
+
+    def _export(self, pkg_list, pkg_counts):
+        """
+        Export the package counts followed by a record for each package.
+        """
+        self.exporter.start(":packages", total=len(pkg_list))
+        self.exporter.write("counts", **dict(zip(
+            ("shipped", "installed", "unpacked", "disabled", "dependencies"),
+            pkg_counts)))
+
+        for pkg_name, pkg_info in pkg_list:
+            self.exporter.write("package", package=pkg_name,
+                                status=pkg_info.status(detailed=False))
 
 
 ###----------------------------------------------------------------------------
@@ -54,10 +70,12 @@ class OverrideAuditPackageReportCommand(sublime_plugin.WindowCommand):
     """
     Generate a tabular report of all installed packages and their state.
     """
-    def run(self, force_reuse=False):
+    def run(self, force_reuse=False, export=None):
         PackageReportThread(self.window, "Generating Package Report",
                             self.window.active_view(),
-                            force_reuse=force_reuse).start()
+                            force_reuse=force_reuse,
+                            export=export_filename(self.window, export,
+                                                   "package_report")).start()
 
 
 ###----------------------------------------------------------------------------
@@ -0,0 +1,100 @@
+import sublime_plugin
+
+from ..core import oa_syntax, decorate_pkg_name
+from ..core import ReportGenerationThread, export_filename
+from ...lib.packages import PackageList, override_candidates, provenance_map
+
+###----------------------------------------------------------------------------
+
+
+class ProvenanceReportThread(ReportGenerationThread):
+    """
+    Generate a report of every resource in every package that is provided by
+    more than one layer (shipped, installed and unpacked), or that is hidden
+    by a complete override, along with which layer Sublime uses for it.
+    """
+    def _process(self):
+        # Only packages that can contain overrides can have a resource in more
+        # than one layer.
+        pkg_list = PackageList(override_candidates(), self.snapshot)
+        provenance = provenance_map(pkg_list)
+
+        by_package = {}
+        for resource, item in provenance.items():
+            if len(item.layers) > 1 or item.winner is None:
+                pkg_name, name = resource.split("/", 2)[1:]
+                by_package.setdefault(pkg_name, []).append((name, item))
+
+        if self.exporter is not None:
+            return self._export(pkg_list, by_package)
+
+        title = "OverrideAudit: Resource Provenance Report"
+        result = [
+            "Resources provided by more than one layer: [S]hipped, [I]nstalled",
+            "and [U]npacked. The letter after the layers is the layer in use, with",
+            "a * if it differs from the layer it hides, or - if the resource is",
+            "hidden by a complete override.\n",
+            self._generation_time()]
+
+        packages = {}
+        for pkg_name, pkg_info in pkg_list:
+            items = by_package.get(pkg_name)
+            if not items:
+                continue
+
+            packages[pkg_name] = pkg_info.status(detailed=True, metadata=False)
+            result.append(decorate_pkg_name(pkg_info))
+            for name, item in sorted(items):
+                winner = "-" if item.winner is None else item.winner.layer[0].upper()
+                result.append("  `- [%s] %s%s %s" % (item.flags(), winner,
+                              "*" if item.is_modified() else " ", name))
+            result.append("")
+
+        if not packages:
+            result.append("No resources are provided by more than one layer")
+
+        self._set_content(title, result, ":provenance",
+                          oa_syntax("OA-ProvenanceReport"), {
+                            "override_audit_report_packages": packages,
+                            "context_menu": "OverrideAuditReport.sublime-menu"
+                          }, pkg_list=pkg_list)
+
+    def _export(self, pkg_list, by_package):
+        """
+        Export a record for each package with resources in more than one
+        layer, followed by a record for each such resource.
+        """
+        self.exporter.start(":provenance")
+        for pkg_name, pkg_info in pkg_list:
+            items = by_package.get(pkg_name)
+            if not items:
+                continue
+
+            self.exporter.write("package", package=pkg_name,
+                                status=pkg_info.status(detailed=True, metadata=False))
+            for name, item in sorted(items):
+                self.exporter.write("resource",
+                                    package=pkg_name,
+                                    resource=name,
+                                    winner=None if item.winner is None else item.winner.layer,
+                                    modified=item.is_modified(),
+                                    layers=[layer._asdict() for layer in item.layers])
+
+
+###----------------------------------------------------------------------------
+
+
+class OverrideAuditProvenanceReportCommand(sublime_plugin.WindowCommand):
+    """
+    Generate a report of all package resources that are provided by more than
+    one layer, and which layer wins.
+    """
+    def run(self, force_reuse=False, export=None):
+        ProvenanceReportThread(self.window, "Generating Provenance Report",
+                               self.window.active_view(),
+                               force_reuse=force_reuse,
+                               export=export_filename(self.window, export,
+                                                      "provenance_report")).start()
+
+
+###----------------------------------------------------------------------------
@@ -21,7 +21,10 @@ class OverrideAuditRefreshReportCommand(ContextHelper,sublime_plugin.TextCommand
         command = {
             ":packages":          "override_audit_package_report",
             ":overrides":         "override_audit_override_report",
-            ":overrides_expired": "override_audit_override_report"
+            ":overrides_expired": "override_audit_override_report",
+            ":search":            "override_audit_search_resources",
+            ":provenance":        "override_audit_provenance_report",
+            ":delta":             "override_audit_delta_report"
         }.get(report_type, "override_audit_diff_report")
         args: Dict[str, Any] = {"force_reuse": True}
 
@@ -32,6 +35,8 @@ class OverrideAuditRefreshReportCommand(ContextHelper,sublime_plugin.TextCommand
             args["package"] = report_type
         elif report_type == ":overrides_expired":
             args["only_expired"] = True
+        elif report_type == ":search":
+            args["query"] = target_view.settings().get("override_audit_search_query")
 
         if window:
             window.focus_view(target_view)
@@ -46,7 +51,10 @@ class OverrideAuditRefreshReportCommand(ContextHelper,sublime_plugin.TextCommand
             ":packages":          "Package Report",
             ":overrides":         "Override Report",
             ":overrides_expired": "Override Report (Expired only)",
-            ":bulk_all":          "Bulk Diff Report"
+            ":bulk_all":          "Bulk Diff Report",
+            ":search":            "Resource Search",
+            ":provenance":        "Provenance Report",
+            ":delta":             "Delta Report"
         }.get(report, "Bulk Diff of '%s'" % report)
 
         return self.caption("Refresh %s" % (report), **kwargs)
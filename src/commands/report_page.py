@@ -0,0 +1,85 @@
+import sublime_plugin
+
+from ..core import ContextHelper, show_report_page, log
+from ...lib.report_cache import report_cache
+
+
+###----------------------------------------------------------------------------
+
+
+class OverrideAuditReportPageCommand(ContextHelper,sublime_plugin.TextCommand):
+    """
+    Switch a paged report between its index and the page for a package. The
+    page displayed is the one given by the page argument if there is one, the
+    package at the location of the context menu in the index, or the index
+    when a package page is displayed. Otherwise, the user is prompted for the
+    page to display.
+    """
+    def run(self, edit, page=None, event=None, **kwargs):
+        page = self._target_page(page, event, **kwargs)
+        if page is None:
+            return self._prompt()
+
+        if not show_report_page(self.view, edit, page):
+            log("Report pages are no longer available; refresh the report",
+                status=True)
+
+    def _target_page(self, page, event, **kwargs):
+        """
+        Return the page that the command will display, or None if the user
+        needs to be prompted for it.
+        """
+        if page is not None:
+            return page
+
+        if self._setting(self.view, "override_audit_report_page"):
+            return ""
+
+        ctx = self.view_context(None, False, event, **kwargs)
+        if ctx.package_only() and ctx.package in self._setting(
+                self.view, "override_audit_report_packages", {}):
+            return ctx.package
+
+        return None
+
+    def _prompt(self):
+        pages = report_cache.pages(self.view.settings().get("override_audit_report_id"))
+        if pages is None:
+            return log("Report pages are no longer available; refresh the report",
+                       status=True)
+
+        names = [""] + list(pages.sections)
+        items = [["Report Index", "%d packages" % len(pages.sections)]]
+        items.extend([name, summary] for name, (summary, _) in pages.sections.items())
+
+        self.view.window().show_quick_panel(
+            items=items,
+            on_select=lambda i: self._pick(names, i))
+
+    def _pick(self, names, index):
+        if index >= 0:
+            self.view.run_command("override_audit_report_page", {"page": names[index]})
+
+    def description(self, page=None, event=None, **kwargs):
+        if not self.view.settings().has("override_audit_report_page"):
+            return self.caption("Open Report Page", **kwargs)
+
+        page = self._target_page(page, event, **kwargs)
+        if page is None:
+            return self.caption("Open Report Page...", **kwargs)
+        if page == "":
+            return self.caption("Back to Report Index", **kwargs)
+
+        return self.caption("Open Report Page for '%s'" % page, **kwargs)
+
+    def is_visible(self, **kwargs):
+        if self.always_visible(**kwargs):
+            return True
+
+        return self.view.settings().has("override_audit_report_page")
+
+    def is_enabled(self, **kwargs):
+        return self.view.settings().has("override_audit_report_page")
+
+
+###----------------------------------------------------------------------------
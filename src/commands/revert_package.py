@@ -0,0 +1,87 @@
+import sublime_plugin
+
+from bisect import bisect
+
+from ..core import revert_override
+from ..core import PackageListCollectionThread, ContextHelper
+
+
+###----------------------------------------------------------------------------
+
+
+class OverrideAuditRevertPackageCommand(ContextHelper,sublime_plugin.TextCommand):
+    """
+    Revert all of the overrides in the given package back to the content of
+    the packed files in one operation. When invoked in a report in which the
+    selection covers the names of overrides in the package, only those
+    overrides are reverted.
+    """
+    def run(self, edit, **kwargs):
+        target = self.view_target(self.view, **kwargs)
+        ctx = self.view_context(target, False, **kwargs)
+
+        overrides = kwargs.get("overrides", None)
+        if overrides is None:
+            overrides = self._selected_overrides(target, ctx.package) or None
+
+        callback = lambda thread: self._loaded(thread, target.window(),
+                                               ctx.package, overrides)
+        PackageListCollectionThread(target.window(), "Collecting Package List",
+                                    callback, name_list=ctx.package).start()
+
+    def _loaded(self, thread, window, package, overrides):
+        pkg_list = thread.pkg_list
+        revert_override(window, pkg_list[package], overrides=overrides)
+
+    def _selected_overrides(self, view, package):
+        """
+        Return a list of the (non-unknown) overrides in the given package whose
+        names are covered by a non-empty selection in the provided report
+        view.
+        """
+        selected = [r for r in view.sel() if not r.empty()]
+        packages = view.find_by_selector("entity.name.package")
+        if not selected or not packages:
+            return []
+
+        p_lines = [view.rowcol(p.begin())[0] for p in packages]
+        overrides = view.find_by_selector(
+            "entity.name.filename.override - entity.name.filename.override.unknown")
+
+        result = []
+        for file_pos in overrides:
+            if not any(r.intersects(file_pos) for r in selected):
+                continue
+
+            pkg_region = packages[bisect(p_lines, view.rowcol(file_pos.begin())[0]) - 1]
+            if view.substr(pkg_region) == package:
+                result.append(view.substr(file_pos))
+
+        return result
+
+    def description(self, **kwargs):
+        ctx = self.view_context(None, False, **kwargs)
+        if ctx.package_only():
+            target = self.view_target(self.view, **kwargs)
+            if self._selected_overrides(target, ctx.package):
+                return self.caption("Revert Selected Overrides in '%s'" % ctx.package, **kwargs)
+
+            return self.caption("Revert All Overrides in '%s'" % ctx.package, **kwargs)
+
+        return self.caption("Revert Overrides in Package", **kwargs)
+
+    def is_visible(self, **kwargs):
+        if self.always_visible(**kwargs):
+            return True
+
+        return self.is_enabled(**kwargs)
+
+    def is_enabled(self, **kwargs):
+        target = self.view_target(self.view, **kwargs)
+        ctx = self.view_context(target, False, **kwargs)
+
+        return (self.package_overrides_possible(target, ctx) and
+                self.package_exists(ctx))
+
+
+###----------------------------------------------------------------------------
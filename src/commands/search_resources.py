@@ -0,0 +1,114 @@
+import sublime_plugin
+
+from time import perf_counter
+
+from ..core import oa_syntax, decorate_pkg_name, log
+from ..core import ReportGenerationThread
+from ...lib.packages import PackageList
+from ...lib.search import resource_index
+
+
+###----------------------------------------------------------------------------
+
+
+# The maximum number of matching lines to include in a search report, and the
+# maximum length of each line shown.
+_MAX_LINES = 1000
+_MAX_LINE_LENGTH = 200
+
+
+###----------------------------------------------------------------------------
+
+
+class ResourceSearchThread(ReportGenerationThread):
+    """
+    Search the text of the resources in all packages, both packed and
+    unpacked, and generate a report of the resources that contain the search
+    text along with the lines that it appears on.
+    """
+    def _process(self):
+        query = self.args["query"]
+        pkg_list = PackageList(snapshot=self.snapshot)
+
+        # The index persists between searches, so only resources that have
+        # changed since the last search need to be indexed here.
+        with resource_index.lock:
+            start = perf_counter()
+            added = resource_index.update(pkg_list)
+            if added:
+                log("Indexed %d package resources in %.2fms", added,
+                    (perf_counter() - start) * 1000)
+
+            matches, truncated = resource_index.search(query, _MAX_LINES)
+
+        title = "Search results for: %s" % query
+        result = [title, "=" * len(title), ""]
+        if truncated:
+            result.append("WARNING: Only the first %d matching lines are shown!\n" %
+                          _MAX_LINES)
+
+        result.append(self._generation_time())
+
+        resources = len(matches)
+        lines = sum(len(match.lines) for match in matches)
+        packages = {match.package: None for match in matches}
+
+        if not matches:
+            result.append("No package resources contain '%s'" % query)
+        else:
+            result.append("%d matching lines in %d resources in %d packages\n" %
+                          (lines, resources, len(packages)))
+
+        pkg_name = None
+        for match in matches:
+            if match.package != pkg_name:
+                if pkg_name is not None:
+                    result.append("")
+
+                pkg_name = match.package
+                pkg_info = pkg_list[pkg_name]
+                packages[pkg_name] = pkg_info.status(detailed=False, metadata=False)
+                result.append(decorate_pkg_name(pkg_info))
+
+            result.append("  `- %s%s" % ("[U] " if match.unpacked else "",
+                                         match.resource))
+            for row, line in match.lines:
+                line = line.strip()
+                if len(line) > _MAX_LINE_LENGTH:
+                    line = line[:_MAX_LINE_LENGTH] + "..."
+                result.append("    %6d: %s" % (row, line))
+
+        result.append("")
+
+        self._set_content("OverrideAudit: Resource Search", result, ":search",
+                          oa_syntax("OA-SearchReport"), {
+                            "override_audit_report_packages": packages,
+                            "override_audit_search_query": query,
+                            "context_menu": "OverrideAuditReport.sublime-menu"
+                          }, pkg_list=pkg_list)
+
+
+###----------------------------------------------------------------------------
+
+
+class OverrideAuditSearchResourcesCommand(sublime_plugin.WindowCommand):
+    """
+    Search the content of all package resources for some text, prompting for
+    the text to search for if it's not provided, and generate a report of the
+    resources that contain it.
+    """
+    last_query = ""
+
+    def run(self, query=None, force_reuse=False):
+        if not query:
+            return self.window.show_input_panel(
+                "Search package resources:", self.last_query,
+                lambda query: self.run(query, force_reuse), None, None)
+
+        OverrideAuditSearchResourcesCommand.last_query = query
+        ResourceSearchThread(self.window, "Searching Package Resources",
+                             self.window.active_view(),
+                             query=query, force_reuse=force_reuse).start()
+
+
+###----------------------------------------------------------------------------
@@ -0,0 +1,97 @@
+import sublime
+import sublime_plugin
+
+from bisect import bisect
+
+from ..core import ContextHelper, PackageListCollectionThread
+from ..core import override_group, large_diffs, diff_override, log
+
+
+###----------------------------------------------------------------------------
+
+
+class OverrideAuditToggleDiffHunkCommand(ContextHelper,sublime_plugin.TextCommand):
+    """
+    Expand or collapse hunks in the diff of a large override, which displays
+    only the header of each hunk until it is expanded. The hunk toggled is the
+    one at the location of the context menu, or the hunks that contain the
+    cursors if there is no event.
+    """
+    def run(self, edit, event=None, **kwargs):
+        diff = large_diffs.get(self.view.id())
+        if diff is None:
+            return self._rediff()
+
+        headers = self.view.find_by_selector("meta.diff.hunk.toggle")
+        starts = [header.begin() for header in headers]
+
+        # Tab context menus provide an event with no location.
+        if event is not None and "x" in event:
+            points = [self.view.window_to_text((event["x"], event["y"]))]
+        else:
+            points = [region.b for region in self.view.sel()]
+
+        hunks = {bisect(starts, self.view.line(point).end()) - 1 for point in points}
+        hunks = sorted((h for h in hunks if 0 <= h < len(headers)), reverse=True)
+
+        # Toggle from the end of the buffer back, so that the changes don't
+        # alter the positions of the remaining hunks.
+        self.view.set_read_only(False)
+        for hunk in hunks:
+            self._toggle(edit, diff, headers, hunk)
+        self.view.set_read_only(True)
+
+    def _toggle(self, edit, diff, headers, hunk):
+        marker = headers[hunk]
+        start = self.view.line(marker).end()
+        if hunk + 1 < len(headers):
+            end = self.view.line(headers[hunk + 1]).begin() - 1
+        else:
+            end = self.view.size()
+
+        if self.view.substr(marker) == "[-]":
+            self.view.erase(edit, sublime.Region(start, end))
+            self.view.replace(edit, marker, "[+]")
+        else:
+            body = "".join("\n        %s" % line.rstrip("\r\n")
+                           for line in diff.hunk_lines(hunk))
+            self.view.insert(edit, start, body)
+            self.view.replace(edit, marker, "[-]")
+
+    def _rediff(self):
+        """
+        The hunks are not kept when the plugin reloads, so diff the override
+        again to display the view again with all hunks collapsed.
+        """
+        package, override, _ = override_group.get(self.view)
+        window = self.view.window()
+
+        log("Diff of %s/%s is out of date; diffing again", package, override,
+            status=True)
+        PackageListCollectionThread(window, "Collecting Package List",
+                                    lambda thread: self._diff(window, thread, package, override),
+                                    name_list=package).start()
+
+    def _diff(self, window, thread, package, override):
+        if package not in thread.pkg_list:
+            return log("Unable to diff; no package '%s'" % package,
+                       status=True)
+
+        diff_override(window, thread.pkg_list[package], override,
+                      diff_only=True, force_reuse=True)
+
+    def description(self, **kwargs):
+        return self.caption("Expand/Collapse Diff Hunk", **kwargs)
+
+    def is_visible(self, **kwargs):
+        if self.always_visible(**kwargs):
+            return True
+
+        return self.view.settings().get("override_audit_large_diff", False)
+
+    def is_enabled(self, **kwargs):
+        return (self.view.settings().get("override_audit_large_diff", False) and
+                override_group.has(self.view))
+
+
+###----------------------------------------------------------------------------
@@ -8,21 +8,29 @@ from datetime import datetime
 from time import time
 from bisect import bisect
 from zipfile import ZipFile
-from tempfile import mkstemp
+import shutil
 import stat
 import os
-import subprocess
 import sys
 import re
 
 
 from ..lib.packages import PackageInfo, PackageList, PackageFileSet
+from ..lib.packages import PackagePreferences
 from ..lib.packages import override_display, check_potential_override
 from ..lib.packages import find_zip_entry, check_potential_override
 from ..lib.packages import NoSuchSublimePackageException
+from ..lib.packages import packed_resource_exists, override_candidates
+from ..lib.packages import glob_matcher, freeze_python_host_versions
+from ..lib.packages import record_override_baselines, forget_override_baselines
 from ..lib.output_view import output_to_view
+from ..lib.diff import OverrideDiffHunks
+from ..lib.export import ReportExporter
+from ..lib.report_cache import report_cache, report_fingerprints, stale_packages
 from ..lib.threads import BackgroundWorkerThread
+from ..lib.scheduler import io_scheduler
 from ..lib.utils import SettingsGroup
+from ..lib.utils import settings_snapshot, refresh_settings_snapshot
 
 
 ###----------------------------------------------------------------------------
@@ -36,6 +44,11 @@ override_group = SettingsGroup("override_audit_package",
                                "override_audit_diff")
 
 
+# The diffs of large overrides that are being displayed one hunk at a time,
+# keyed by the ID of the view that they are displayed in.
+large_diffs = {}
+
+
 ###----------------------------------------------------------------------------
 
 
@@ -48,10 +61,13 @@ def loaded():
     oa_setting.default = {
         "reuse_views": True,
         "clear_existing": True,
+        "report_page_lines": 10000,
         "ignore_overrides_in": [],
         "diff_unchanged": "diff",
         "diff_context_lines": 3,
         "diff_empty_hdr": False,
+        "diff_large_file_size": 524288,
+        "diff_large_file_lines": 10000,
         "save_on_diff": False,
         "confirm_deletion": True,
         "confirm_freshen": True,
@@ -64,6 +80,7 @@ def loaded():
             "^\\.hg/"
         ],
         "mini_diff_underlying": True,
+        "async_io": False,
         # This is currently undocumented and may go away in the future.
         "enable_hover_popup": True,
 
@@ -71,6 +88,33 @@ def loaded():
         "binary_file_patterns": None
     }
 
+    # Settings are read from a snapshot, which is captured again (and compiled
+    # pattern matchers discarded) whenever either of the settings files
+    # changes.
+    refresh_settings_snapshot(oa_setting.default)
+    freeze_python_host_versions()
+    oa_setting.obj.add_on_change("_oa_settings", settings_changed)
+    sublime.load_settings("Preferences.sublime-settings").add_on_change(
+        "_oa_settings", settings_changed)
+
+    # Anything that needs to touch the disk is deferred so that it doesn't
+    # slow down plugin loading.
+    sublime.set_timeout_async(deferred_load)
+
+    AutoReportTrigger()
+    update_io_scheduler()
+
+
+def deferred_load():
+    """
+    Perform the parts of plugin initialization that don't need to happen while
+    the plugin is loading; this is invoked in the async thread.
+    """
+    # Reattach open reports to the report cache, which is loaded from disk.
+    for window in sublime.windows():
+        for view in window.views():
+            restore_report_view(view)
+
     # Restore the diff in any open overrides; this also cleans any views that
     # used to be overrides but no longer aren't (e.g. if the sublime-package
     # file was deleted while the plugin was not loaded).
@@ -78,8 +122,6 @@ def loaded():
         for view in window.views():
             setup_override_minidiff(view)
 
-    AutoReportTrigger()
-
 
 def unloaded():
     """
@@ -87,6 +129,12 @@ def unloaded():
     """
     log("Shutting down")
     AutoReportTrigger.unregister()
+    io_scheduler.stop()
+    clear_extracted_overrides()
+
+    oa_setting.obj.clear_on_change("_oa_settings")
+    sublime.load_settings("Preferences.sublime-settings").clear_on_change(
+        "_oa_settings")
 
 
 def log(message, *args, status=False, dialog=False):
@@ -111,10 +159,9 @@ def oa_syntax(file):
 
 def oa_setting(key):
     """
-    Get an OverrideAudit setting from a cached settings object.
+    Get an OverrideAudit setting from the current settings snapshot.
     """
-    default = oa_setting.default.get(key, None)
-    return oa_setting.obj.get(key, default)
+    return settings_snapshot().get(key)
 
 
 def oa_can_diff_externally():
@@ -145,6 +192,37 @@ def oa_can_diff_externally():
     return False
 
 
+def settings_changed():
+    """
+    Invoked whenever the OverrideAudit or Sublime preferences change, to
+    capture a new settings snapshot and discard anything that was derived from
+    the prior settings.
+    """
+    refresh_settings_snapshot()
+    clear_pattern_matchers()
+    update_io_scheduler()
+
+
+def update_io_scheduler():
+    """
+    Start or stop the shared I/O scheduler to match the async_io setting.
+    """
+    if oa_setting("async_io"):
+        io_scheduler.start()
+    else:
+        io_scheduler.stop()
+
+
+def clear_pattern_matchers():
+    """
+    Discard all cached pattern matchers, so that they will be compiled again
+    from the current settings the next time that they are needed. This is
+    invoked whenever the OverrideAudit or Sublime preferences change.
+    """
+    get_ignore_unknown_patterns.cache = None
+    glob_matcher.cache_clear()
+
+
 def get_ignore_unknown_patterns():
     """
     Fetch the value of the setting that tells us what unknown overrides we
@@ -154,7 +232,12 @@ def get_ignore_unknown_patterns():
     When the setting is a boolean, the result is either an empty list or a list
     with a regular expression that will match everything, depending on the
     state of the boolean.
+
+    The result is cached until the settings change.
     """
+    if getattr(get_ignore_unknown_patterns, "cache", None) is not None:
+        return get_ignore_unknown_patterns.cache[0]
+
     pattern_list = oa_setting("ignore_unknown_overrides")
 
     # Only be case sensitive on Linux where the file system is case sensitive
@@ -162,20 +245,24 @@ def get_ignore_unknown_patterns():
     patterns = []
 
     if isinstance(pattern_list, bool):
-        return [re.compile(r'.')] if pattern_list else []
-
-    # Invalid regex patterns are ignored with a warning
-    for regex in pattern_list:
-        try:
-            patterns.append(re.compile(regex, re_opts))
-        except Exception as e:
-            log("Invalid ignore_unknown_overrides regex '%s': %s",
-                regex, str(e), status=True)
+        patterns = [re.compile(r'.')] if pattern_list else []
 
+    # Invalid regex patterns are ignored with a warning. The patterns are kept
+    # separate, since combining them would renumber their groups and move any
+    # inline flags away from the start of the pattern.
+    else:
+        for regex in pattern_list:
+            try:
+                patterns.append(re.compile(regex, re_opts))
+            except Exception as e:
+                log("Invalid ignore_unknown_overrides regex '%s': %s",
+                    regex, str(e), status=True)
+
+    get_ignore_unknown_patterns.cache = (patterns, )
     return patterns
 
 
-def packages_with_overrides(pkg_list, name_list=None):
+def packages_with_overrides(pkg_list, name_list=None, snapshot=None):
     """
     Collect a list of package names from the given package list for which there
     is at least a single (simple) override file and which is not in the list of
@@ -183,8 +270,11 @@ def packages_with_overrides(pkg_list, name_list=None):
 
     Optionally, if name_list is provided, the list of package names will be
     filtered to only include packages whose name also exists in the name list.
+
+    The list of packages to ignore is taken from the settings snapshot given,
+    or the current settings if there isn't one.
     """
-    ignored = oa_setting("ignore_overrides_in")
+    ignored = (snapshot or settings_snapshot()).get("ignore_overrides_in")
     items = [name for name, pkg in pkg_list if len(pkg.override_files()) > 0
                                                and name not in ignored]
 
@@ -225,6 +315,27 @@ def decorate_pkg_name(pkg_info, name_only=False):
                suffix)
 
 
+def export_filename(window, export, report_name):
+    """
+    Given the value of the export argument to a report command, return back
+    the absolute name of the file that the report should be exported to, or
+    None if the report should not be exported.
+
+    The export argument can be True to export to a file named for the report
+    in the OverrideAudit folder of the User package, or a filename, which may
+    contain the standard window variables such as ${packages}.
+    """
+    if not export:
+        return None
+
+    if export is True:
+        return os.path.join(sublime.packages_path(), "User", "OverrideAudit",
+                            "%s.ndjson" % report_name)
+
+    filename = sublime.expand_variables(export, window.extract_variables())
+    return os.path.abspath(os.path.expanduser(cast(str, filename)))
+
+
 def setup_override_minidiff(view):
     """
     Check the view provided to see if it represents an edit session on a
@@ -234,8 +345,7 @@ def setup_override_minidiff(view):
     Otherwise, it will set up the reference document for this override to track
     the base file.
     """
-    settings = sublime.load_settings("Preferences.sublime-settings")
-    mini_diff = settings.get("mini_diff")
+    mini_diff = settings_snapshot().pref("mini_diff")
 
     mini_diff_underlying = oa_setting("mini_diff_underlying") and mini_diff is True
 
@@ -245,7 +355,27 @@ def setup_override_minidiff(view):
         not os.path.isfile(filename)):
         return
 
-    result = check_potential_override(filename, deep=True, get_content=mini_diff_underlying)
+    # With the scheduler, the lookup is one more job sharing its I/O threads
+    # and the result is applied from the main thread.
+    if io_scheduler.running:
+        io_scheduler.submit(io_scheduler.run_blocking(check_potential_override,
+                                                      filename, True,
+                                                      mini_diff_underlying),
+                            lambda result: _apply_override_minidiff(view, result))
+        return
+
+    _apply_override_minidiff(view, check_potential_override(
+        filename, deep=True, get_content=mini_diff_underlying))
+
+
+def _apply_override_minidiff(view, result):
+    """
+    Apply the result of check_potential_override() for the file in the given
+    view to it; see setup_override_minidiff().
+    """
+    if not view.is_valid():
+        return
+
     if result is not None:
         override_group.apply(view, result[0], result[1], False)
         if result[2] is not None:
@@ -254,6 +384,117 @@ def setup_override_minidiff(view):
         override_group.remove(view)
 
 
+def restore_report_view(view):
+    """
+    Check the view provided to see if it is a report restored from a prior
+    session, and if so reattach the settings for the report from the report
+    cache, restoring the content too if the view came back empty. This does
+    nothing if the view is not a report or the report is no longer cached.
+
+    The report is not generated again; instead the packages in the report are
+    checked in the background, and if any of them have changed since the
+    report was generated, the report is marked as stale.
+    """
+    settings = view.settings()
+    report_id = settings.get("override_audit_report_id")
+    if report_id is None:
+        # A report that came back as plain text can only be found by name.
+        if not view.is_scratch() or settings.has("override_audit_report_type"):
+            return
+
+        report_id = report_cache.find(view.name())
+        if report_id is None:
+            return
+
+    report = report_cache.fetch(report_id)
+    if report is None:
+        return
+
+    # Paged reports restore the page that was displayed, if it's known.
+    page = settings.get("override_audit_report_page", "")
+    if report.get("pages"):
+        settings.set("override_audit_report_page", page)
+
+    if view.size() == 0:
+        content = report["content"]
+        if report.get("pages"):
+            content = report_cache.pages(report_id).text(page)
+
+        view.run_command("append", {"characters": content})
+        view.run_command("move_to", {"to": "bof"})
+
+    if settings.get("syntax") != report["syntax"]:
+        view.assign_syntax(report["syntax"])
+
+    view.set_scratch(True)
+    view.set_read_only(True)
+    settings.set("override_audit_report_id", report_id)
+    settings.set("override_audit_report_type", report["report_type"])
+    for setting, value in report["settings"].items():
+        settings.set(setting, value)
+
+    def check_freshness():
+        stale = stale_packages(report["fingerprints"])
+        if stale:
+            sublime.set_timeout(lambda: mark_report_stale(view, report_id, stale))
+
+    sublime.set_timeout_async(check_freshness)
+
+
+def mark_report_stale(view, report_id, packages):
+    """
+    Mark the report in the given view as being out of date because the given
+    list of packages changed since it was generated. Nothing happens if the
+    view no longer contains the report with the given ID.
+    """
+    if not view.is_valid() or view.settings().get("override_audit_report_id") != report_id:
+        return
+
+    view.settings().set("override_audit_report_stale", packages)
+    view.set_status("override_audit_stale",
+                    "OverrideAudit: Report out of date (%d changed package%s); refresh to update" %
+                    (len(packages), "" if len(packages) == 1 else "s"))
+
+
+def show_report_page(view, edit, page):
+    """
+    Display a page of the paged report in the given view; page is either the
+    name of a package in the report or "" for the index of the report. Any
+    changes made to the page being replaced (such as marks applied to its
+    overrides) are retained.
+
+    Returns False if the report is not paged or is no longer available.
+    """
+    settings = view.settings()
+    pages = report_cache.pages(settings.get("override_audit_report_id"))
+    if pages is None or not settings.has("override_audit_report_page"):
+        return False
+
+    current = settings.get("override_audit_report_page")
+    if current in pages.sections:
+        start = len(pages.page_prefix(current))
+        pages.update(current, view.substr(sublime.Region(start, view.size())))
+        report_cache.pages_changed(settings.get("override_audit_report_id"))
+
+    text = pages.text(page)
+    view.set_read_only(False)
+    view.replace(edit, sublime.Region(0, view.size()), text)
+    view.set_read_only(True)
+    settings.set("override_audit_report_page", page if page in pages.sections else "")
+
+    # Returning to the index lands on the package whose page was displayed.
+    point = 0
+    if page not in pages.sections and current in pages.sections:
+        pkg_line = pages.sections[current][1].split("\n", 1)[0]
+        point = max(text.find("\n%s\n" % pkg_line) + 1, 0)
+
+    view.sel().clear()
+    view.sel().add(sublime.Region(point))
+    view.show_at_center(point)
+
+    return True
+
+
 def open_override(window, pkg_name, override):
     """
     Open the provided override from the given package name.
@@ -281,16 +522,20 @@ def delete_override(pkg_name, override):
         if (confirm is False or
                 sublime.yes_no_cancel_dialog(msg) == sublime.DIALOG_YES):
             send2trash.send2trash(full_name)
+            forget_override_baselines(pkg_name, [override])
             log("Deleted %s", relative_name, status=True)
 
 
-def freshen_override(view, package, override=None):
+def freshen_override(view, package=None, override=None):
     """
-    Touch either the explicitly specified override in the provided package or
-    all expired overrides in the package.
+    Touch either the explicitly specified override in the provided package,
+    all expired overrides in the package or, when no package is given, all
+    expired overrides in all packages.
     """
     if oa_setting("confirm_freshen"):
-        target = "Expired overrides in '%s'" % package
+        target = "All expired overrides in all packages"
+        if package is not None:
+            target = "Expired overrides in '%s'" % package
         if override is not None:
             relative_name = os.path.join(package, override)
             target = override_display(relative_name)
@@ -299,11 +544,29 @@ def freshen_override(view, package, override=None):
         if sublime.yes_no_cancel_dialog(msg) != sublime.DIALOG_YES:
             return
 
-    callback = lambda thread: log(thread.result, status=True)
+    callback = lambda thread: thread.update_report()
     OverrideFreshenThread(view.window(), "Freshening Files", callback,
                        package=package, override=override, view=view).start()
 
 
+def is_large_override(pkg_info, override):
+    """
+    Check if the given override or the packed file that it overrides is larger
+    than the diff_large_file_size setting, in which case it is diffed one hunk
+    at a time. This only requires the size of the files.
+    """
+    entry = pkg_info.override_file_zipinfo(override)
+    size = 0 if entry is None else entry.file_size
+
+    if pkg_info.unpacked_path is not None:
+        try:
+            size = max(size, os.path.getsize(os.path.join(pkg_info.unpacked_path, override)))
+        except OSError:
+            pass
+
+    return size > oa_setting("diff_large_file_size")
+
+
 def diff_override(window, pkg_info, override,
                   diff_only=False, force_reuse=False):
     """
@@ -318,9 +581,25 @@ def diff_override(window, pkg_info, override,
         reuse = oa_setting("reuse_views")
         clear = oa_setting("clear_existing")
 
+    title = "Diff of %s" % override_display(
+        os.path.join(pkg_info.name, override))
+
+    # For a large override, the view is displayed right away since the diff
+    # might take some time; the diff then replaces the content of this view.
+    large = is_large_override(pkg_info, override)
+    placeholder = None
+    if large:
+        placeholder = output_to_view(window, title,
+                                     "Diffing %s/%s; please wait..." % (pkg_info.name, override),
+                                     reuse, clear, oa_syntax("OA-Diff"))
+        reuse, clear = True, True
+
     def _process_diff(thread):
         diff = thread.diff
         if diff is None:
+            if placeholder is not None:
+                placeholder.close()
+
             return log("Unable to diff %s/%s\n\n" +
                         "Error loading file contents of one or both files.\n" +
                         "Check the console for more information",
@@ -330,27 +609,68 @@ def diff_override(window, pkg_info, override,
             log("No changes detected in %s/%s", pkg_info.name, override,
                  status=True)
 
+            if action in ("open", "ignore") and placeholder is not None:
+                placeholder.close()
+
             if action == "open":
                 return open_override(window, pkg_info.name, override)
 
             elif action == "ignore":
                 return
 
-        title = "Diff of %s" % override_display(
-            os.path.join(pkg_info.name, override))
+        elif isinstance(diff, OverrideDiffHunks):
+            return show_diff_hunks(window, title, pkg_info, override, diff,
+                                   reuse, clear, placeholder)
 
         result = diff.result
         prefix = diff.hdr if diff.is_empty and empty_diff_hdr else ""
         content = prefix + "No differences found" if result == "" else result
 
         view = output_to_view(window, title, content, reuse, clear,
-                              "Packages/Diff/Diff.tmLanguage")
+                              "Packages/Diff/Diff.tmLanguage",
+                              current_view=placeholder)
+
+        # A reused view may have previously held a large diff.
+        if placeholder is not None or view.settings().get("override_audit_large_diff", False):
+            view.assign_syntax("Packages/Diff/Diff.tmLanguage")
+            view.settings().erase("override_audit_large_diff")
+            large_diffs.pop(view.id(), None)
 
         override_group.apply(view, pkg_info.name, override, True)
 
     callback = lambda thread: _process_diff(thread)
     OverrideDiffThread(window, "Diffing Override", callback,
-                       pkg_info=pkg_info, override=override).start()
+                       pkg_info=pkg_info, override=override, large=large).start()
+
+
+def show_diff_hunks(window, title, pkg_info, override, diff, reuse, clear,
+                    current_view=None):
+    """
+    Display the diff of a large override one hunk at a time. Initially only
+    the header of each hunk is displayed, along with a count of the lines it
+    changes; the body of a hunk is only generated and inserted into the view
+    when the hunk is expanded by override_audit_toggle_diff_hunk.
+    """
+    content = [
+        "Large override diff: %d hunk%s, %d lines removed and %d lines added" % (
+            len(diff.hunks), "" if len(diff.hunks) == 1 else "s",
+            diff.removed, diff.added),
+        "",
+        decorate_pkg_name(pkg_info),
+        "    %s" % override
+    ]
+    content.extend("        %s" % line for line in diff.hdr.splitlines())
+    content.extend("        %s [+] %d removed, %d added" % (
+        hunk.header(), hunk.removed, hunk.added) for hunk in diff.hunks)
+
+    view = output_to_view(window, title, content, reuse, clear,
+                          oa_syntax("OA-Diff"), current_view=current_view)
+    view.assign_syntax(oa_syntax("OA-Diff"))
+    view.settings().set("override_audit_large_diff", True)
+    view.run_command("move_to", {"to": "bof"})
+
+    large_diffs[view.id()] = diff
+    override_group.apply(view, pkg_info.name, override, True)
 
 
 def filter_unmodified_overrides(pkg_info, overrides):
@@ -361,8 +681,10 @@ def filter_unmodified_overrides(pkg_info, overrides):
     """
     filtered_overrides = PackageFileSet()
     for override in overrides:
-        result = pkg_info.override_diff(override, 1)
-        if result.is_empty:
+        # Binary overrides and those that can't be loaded have no stats, and
+        # are treated as unchanged.
+        stats = pkg_info.override_diff_stats(override)
+        if stats is None or stats == (0, 0):
             log(f"Excluded from report: {pkg_info.name}/{override}")
         else:
             filtered_overrides.add(override)
@@ -407,7 +729,7 @@ def diff_with_sublimerge(base_file, override_file):
     sublime.run_command("new_window")
     window = sublime.active_window()
 
-    window.open_file(base_file).settings().set("_oa_ext_diff_base", base_file)
+    window.open_file(base_file)
     window.open_file(override_file)
 
     window.run_command("sublimerge_diff_views", {
@@ -416,9 +738,20 @@ def diff_with_sublimerge(base_file, override_file):
         })
 
 
-def revert_override(window, pkg_info, override):
+def revert_override(window, pkg_info, override=None, overrides=None):
+    """
+    Revert either the explicitly specified override in the provided package,
+    the given list of overrides in the package or (when neither is given) all
+    of the overrides in the package back to the content of the packed file.
+    """
     if oa_setting("confirm_revert"):
-        target = override_display(os.path.join(pkg_info.name, override))
+        if override is not None:
+            target = override_display(os.path.join(pkg_info.name, override))
+        elif overrides is not None:
+            target = "%d selected overrides in '%s'" % (len(overrides), pkg_info.name)
+        else:
+            target = "All overrides in '%s'" % pkg_info.name
+
         msg = (
             "Are you sure you want to continue?\n\n" +
             "The current content of this override will be permanently lost; " +
@@ -430,7 +763,30 @@ def revert_override(window, pkg_info, override):
 
     callback = lambda thread: log(thread.result, status=True)
     OverrideRevertThread(window, "Reverting File", callback,
-                       pkg_info=pkg_info, override=override).start()
+                       pkg_info=pkg_info, override=override,
+                       overrides=overrides).start()
+
+
+def find_overrides(view):
+    """
+    Given a report view, return a dictionary that maps a tuple of package name
+    and override name to the region of that override in the report, gathered
+    in a single pass over the report.
+    """
+    result = {}
+    if not view.match_selector(0, "text.override-audit"):
+        return result
+
+    packages = view.find_by_selector("entity.name.package")
+    starts = [pkg_pos.begin() for pkg_pos in packages]
+
+    for file_pos in view.find_by_selector("entity.name.filename.override"):
+        index = bisect(starts, file_pos.begin()) - 1
+        if index >= 0:
+            pkg_name = view.substr(packages[index])
+            result[(pkg_name, view.substr(file_pos))] = file_pos
+
+    return result
 
 
 def find_override(view, pkg_name, override):
@@ -463,30 +819,72 @@ def find_override(view, pkg_name, override):
     return None
 
 
+# The folder that base files are extracted into for external diffs; this is
+# private to this plugin instance and only created when first needed.
+_extracted_path = None
+
+
+def extracted_override_path():
+    """
+    Return the folder that base files are extracted into for external diffs,
+    creating it if needed.
+    """
+    from tempfile import mkdtemp
+
+    global _extracted_path
+    if _extracted_path is None or not os.path.isdir(_extracted_path):
+        _extracted_path = mkdtemp(prefix="OverrideAudit-")
+
+    return _extracted_path
+
+
 def extract_packed_override(pkg_info, override):
     """
     Given a package information structure for a package and an override inside
     of that packages, this determines the package file that the base file is
     contained in and extracts it to a temporary file, whose name is returned.
+
+    The file is streamed out of the package as bytes, so binary files and
+    files in any encoding are extracted as is. Extracted files are named for
+    the CRC of their content and are left in place until the plugin unloads,
+    so that diffing against the same base file again does not need to extract
+    it again.
     """
-    override_type, contents = pkg_info.packed_override_contents(override, as_list=False)
-    if override_type is None:
+    from tempfile import mkstemp
+
+    entry = pkg_info.override_file_zipinfo(override)
+    if entry is None:
         return log("Unable to extract %s/%s; unable to locate base file",
                     pkg_info.name, override)
 
+    override_type = "Installed" if pkg_info.installed_path else "Shipped"
     name,ext = os.path.splitext(override)
-    prefix = f"{override_type}_{pkg_info.name}_{name.replace('/', '_')}_"
+    base_name = os.path.join(extracted_override_path(),
+        f"{override_type}_{pkg_info.name}_{name.replace('/', '_')}_{entry.CRC:08x}{ext}")
+
+    if os.path.isfile(base_name):
+        if os.path.getsize(base_name) == entry.file_size:
+            return base_name
 
+        delete_packed_override(base_name)
+
+    tmp_name = None
     try:
-        fd, base_name = mkstemp(prefix=prefix, suffix=ext)
-        os.chmod(base_name, stat.S_IREAD)
-        os.write(fd, contents.encode("utf-8"))
+        fd, tmp_name = mkstemp(dir=extracted_override_path(), suffix=ext)
+        with os.fdopen(fd, "wb") as handle:
+            with ZipFile(pkg_info.package_file()) as zFile:
+                with zFile.open(entry.filename) as member:
+                    shutil.copyfileobj(member, handle, 64 * 1024)
 
-        os.close(fd)
+        os.chmod(tmp_name, stat.S_IREAD)
+        os.replace(tmp_name, base_name)
 
         return base_name
 
     except Exception as err:
+        if tmp_name is not None and os.path.exists(tmp_name):
+            delete_packed_override(tmp_name)
+
         return log("Error creating temporary file for %s/%s: %s",
                    pkg_info.name, override, str(err))
 
@@ -505,6 +903,24 @@ def delete_packed_override(filename):
         log("Error deleting '%s'", filename)
 
 
+def clear_extracted_overrides():
+    """
+    Delete all of the base files that have been extracted for use in external
+    diffs, along with the folder that they were extracted into.
+    """
+    global _extracted_path
+    path, _extracted_path = _extracted_path, None
+
+    if path is not None and os.path.isdir(path):
+        for name in os.listdir(path):
+            delete_packed_override(os.path.join(path, name))
+
+        try:
+            os.rmdir(path)
+        except OSError:
+            log("Error deleting '%s'", path)
+
+
 def setup_new_override_view(view, reposition=True):
     """
     Given a view that represents a potential new override, set it up so that
@@ -521,8 +937,7 @@ def setup_new_override_view(view, reposition=True):
     if view.is_loading():
         return sublime.set_timeout(lambda: setup_new_override_view(view), 10)
 
-    settings = sublime.load_settings("Preferences.sublime-settings")
-    mini_diff = settings.get("mini_diff")
+    mini_diff = settings_snapshot().pref("mini_diff")
 
     # File is left as a scratch buffer until the first modification
     if reposition:
@@ -650,13 +1065,18 @@ class AutoReportTrigger():
 class PackageListCollectionThread(BackgroundWorkerThread):
     """
     Collect the list of packages in a background thread. The collection can
-    optionally filter the list returned to only a set of names given and can
-    also optionally pre-fetch the list of overrides in found packages.
+    optionally filter the list returned to only a set of names given (or only
+    to those packages which can contain simple overrides) and can also
+    optionally pre-fetch the list of overrides in found packages.
     """
     def _process(self):
-        self.pkg_list = PackageList(self.args.get("name_list", None))
+        name_list = self.args.get("name_list", None)
+        if name_list is None and self.args.get("candidates_only", False):
+            name_list = override_candidates(complete=False)
+
+        self.pkg_list = PackageList(name_list, self.snapshot)
         if self.args.get("get_overrides", False) is True:
-            packages_with_overrides(self.pkg_list)
+            packages_with_overrides(self.pkg_list, snapshot=self.snapshot)
 
 
 ###----------------------------------------------------------------------------
@@ -667,7 +1087,7 @@ class OverrideDiffThread(BackgroundWorkerThread):
     Diff a specific package override in a background thread.
     """
     def _process(self):
-        context_lines = oa_setting("diff_context_lines")
+        context_lines = self.snapshot.get("diff_context_lines")
 
         pkg_info = self.args.get("pkg_info", None)
         override = self.args.get("override", None)
@@ -677,12 +1097,17 @@ class OverrideDiffThread(BackgroundWorkerThread):
             return log("diff thread not given a package or override to diff")
 
         # Only need to do this if the user has a specific setting
-        binary_patterns = oa_setting("binary_file_patterns")
+        binary_patterns = self.snapshot.get("binary_file_patterns")
         if binary_patterns is not None:
             pkg_info.set_binary_pattern(binary_patterns)
 
+        # Large overrides are always diffed one hunk at a time; otherwise that
+        # only happens if the files turn out to have too many lines.
+        max_lines = 0 if self.args.get("large", False) else self.snapshot.get("diff_large_file_lines")
+
         self.diff = pkg_info.override_diff(override, context_lines,
-                                           binary_result="<File is binary>")
+                                           binary_result="<File is binary>",
+                                           max_lines=max_lines)
 
 
 ###----------------------------------------------------------------------------
@@ -692,101 +1117,162 @@ class OverrideDiffThread(BackgroundWorkerThread):
 # Currently it will if you explicitly tell it to.
 class OverrideFreshenThread(BackgroundWorkerThread):
     """
-    Touch either the explicitly specified override in the provided package or
-    all expired overrides in the package.
+    Touch either the explicitly specified override in the provided package,
+    all expired overrides in the package, or all expired overrides in every
+    package.
+
+    The times for all overrides are determined from the package file indexes
+    and then applied in one pass; the report that the freshen was invoked
+    from is updated in a single edit once the thread completes; see
+    update_report().
     """
-    def _touch_override(self, view, zFile, pkg_name, override):
-        new_mtime = None
-        now = time()
-        fname = os.path.join(sublime.packages_path(), pkg_name, override)
+    def _gather(self, pkg_info, overrides, now, touches):
+        """
+        Add an entry to the list of touches for each of the given overrides in
+        the package, which gives the override and the times to set on it.
+        """
+        for override in overrides:
+            new_mtime = None
+            entry = pkg_info.override_file_zipinfo(override)
+            if entry is None:
+                log(self._msg(pkg_info.name, override, False))
+                continue
+
+            if entry.timestamp > now:
+                log("Warning: The packaged '%s/%s' file is from the future" ,
+                     pkg_info.name, override)
+                new_mtime = (now, entry.timestamp + 1)
 
-        try:
-            entry = find_zip_entry(zFile, override)
-            zTime = datetime(*entry.date_time).timestamp()
+            fname = os.path.join(sublime.packages_path(), pkg_info.name, override)
+            touches.append((pkg_info.name, override, fname, new_mtime))
 
-            if zTime > now:
-                log("Warning: The packaged '%s/%s' file is from the future" ,
-                     pkg_name, override)
-                new_mtime = (now, zTime + 1)
+    def _touch_all(self, touches):
+        """
+        Apply the given list of touches, returning a list of the package and
+        override names of the files that were freshened.
+        """
+        freshened = []
+        for pkg_name, override, fname, new_mtime in touches:
+            try:
+                os.utime(fname, new_mtime)
+                freshened.append([pkg_name, override])
+            except OSError:
+                log(self._msg(pkg_name, override, False))
 
-            with os.fdopen(os.open(fname, os.O_RDONLY)) as f:
-                os.utime(f.fileno() if os.utime in os.supports_fd else fname,
-                         new_mtime)
+        return freshened
 
-            # TODO: This command could take a list of overrides in the package
-            # and handle them all at once.
-            view.run_command("override_audit_modify_mark", {
-                "package": pkg_name,
-                "override": override
-            })
+    def _record_baselines(self, freshened):
+        """
+        Record the current package entries of the freshened overrides as their
+        baselines, so they're not expired until the package changes again.
+        """
+        by_package = {}
+        for pkg_name, override in freshened:
+            by_package.setdefault(pkg_name, []).append(override)
 
-            return True
-        except:
-            return False
+        for pkg_name, overrides in by_package.items():
+            record_override_baselines(pkg_name, overrides)
 
     def _msg(self, pkg_name, override, success):
         prefix = "Freshened" if success else "Unable to freshen"
         return "%s '%s/%s'" % (prefix, pkg_name, override)
 
-    def _clean_package(self, view, pkg_name):
-        pkg_list = view.settings().get("override_audit_expired_pkgs", [])
-        if pkg_name in pkg_list:
-            pkg_list.remove(pkg_name)
-            view.settings().set("override_audit_expired_pkgs", pkg_list)
+    def _packages(self, package):
+        """
+        Get the list of packages to freshen; either the one named, or all of
+        the packages that could have expired overrides.
+        """
+        if package is None:
+            pkg_list = PackageList(override_candidates(complete=False), self.snapshot)
+            return [pkg_info for _, pkg_info in pkg_list]
 
-    def _single(self, view, zFile, pkg_info, override):
-        result = self._touch_override(view, zFile, pkg_info.name, override)
-        if result and not pkg_info.expired_override_files(simple=True):
-            self._clean_package(view, pkg_info.name)
-        return self._msg(pkg_info.name, override, result)
-
-    def _pkg(self, view, zFile, pkg_info):
-        count = 0
-        pkg_name = pkg_info.name
-        expired_list = pkg_info.expired_override_files(simple=True)
-
-        for expired_name in expired_list:
-            result = self._touch_override(view, zFile, pkg_name, expired_name)
-            log(self._msg(pkg_name, expired_name, result))
-            if result:
-                count += 1
-
-        if count == len(expired_list):
-            prefix = "All"
-            self._clean_package(view, pkg_name)
-        else:
-            prefix = "%d of %d" % (count, len(expired_list))
+        pkg_info = PackageInfo(package, prefs=PackagePreferences(self.snapshot))
+        if not pkg_info.exists():
+            self.result = "Unable to freshen '%s'; no such package" % package
+            return None
+
+        if not pkg_info.package_file():
+            self.result = "Unable to freshen '%s'; no overrides" % package
+            return None
 
-        return "%s expired overrides freshened in '%s'" % (prefix, pkg_name)
+        return [pkg_info]
+
+    def update_report(self):
+        """
+        Display the result of the freshen and update the report that it was
+        invoked from (if any) to remove the expired mark from all of the
+        overrides that were freshened and from the list of expired packages.
+
+        This must be invoked in the main thread.
+        """
+        log(self.result, status=True)
+
+        view = self.args.get("view", None)
+        if view is None or not view.settings().has("override_audit_report_type"):
+            return
+
+        if self.freshened:
+            view.run_command("override_audit_modify_mark", {
+                "overrides": self.freshened
+            })
+
+        pkg_list = view.settings().get("override_audit_expired_pkgs", [])
+        if any(pkg_name in pkg_list for pkg_name in self.cleaned):
+            pkg_list = [p for p in pkg_list if p not in self.cleaned]
+            view.settings().set("override_audit_expired_pkgs", pkg_list)
 
     def _process(self):
         view = self.args.get("view", None)
         package = self.args.get("package", None)
         override = self.args.get("override", None)
 
-        if not view or not package:
+        self.freshened = []
+        self.cleaned = []
+
+        if not view or (override is not None and package is None):
             self.result = "Nothing done; missing parameters"
             return log("freshen thread not given a view or package")
 
-        pkg_info = PackageInfo(package)
-        if not pkg_info.exists():
-            self.result = "Unable to freshen '%s'; no such package" % package
-            return
+        try:
+            packages = self._packages(package)
+            if packages is None:
+                return
 
-        if not pkg_info.package_file():
-            self.result = "Unable to freshen '%s'; no overrides" % package
-            return
+            now = time()
+            touches = []
+            expired = {}
+            for pkg_info in packages:
+                overrides = ([override] if override is not None else
+                             list(pkg_info.expired_override_files(simple=True)))
 
-        try:
-            package_file = pkg_info.package_file()
-            if package_file is None:
-                raise NoSuchSublimePackageException(f'package {pkg_info.name} has no sublime-package file')
+                expired[pkg_info.name] = len(overrides)
+                self._gather(pkg_info, overrides, now, touches)
 
-            with ZipFile(package_file) as zFile:
-                if override is not None:
-                    self.result = self._single(view, zFile, pkg_info, override)
-                else:
-                    self.result = self._pkg(view, zFile, pkg_info)
+            self.freshened = self._touch_all(touches)
+            self._record_baselines(self.freshened)
+
+            counts = dict.fromkeys(expired, 0)
+            for pkg_name, _ in self.freshened:
+                counts[pkg_name] += 1
+
+            if override is not None:
+                pkg_info = packages[0]
+                success = counts[pkg_info.name] == 1
+                if success and not pkg_info.expired_override_files(simple=True):
+                    self.cleaned.append(pkg_info.name)
+
+                self.result = self._msg(pkg_info.name, override, success)
+                return
+
+            self.cleaned = [name for name in expired if counts[name] == expired[name]]
+
+            total = sum(expired.values())
+            prefix = "All" if len(self.freshened) == total else "%d of %d" % (len(self.freshened), total)
+            if package is not None:
+                self.result = "%s expired overrides freshened in '%s'" % (prefix, package)
+            else:
+                self.result = "%s expired overrides freshened in %d packages" % (
+                    prefix, sum(1 for count in expired.values() if count))
 
         except Exception as e:
             self.result = "Error while freshening: %s" % str(e)
@@ -797,16 +1283,33 @@ class OverrideFreshenThread(BackgroundWorkerThread):
 
 class OverrideRevertThread(BackgroundWorkerThread):
     """
-    Revert the explicitly specified override in the provided package back to
-    it's initial unpacked state.
+    Revert either the explicitly specified override in the provided package,
+    a list of overrides in it, or all of its overrides back to their initial
+    unpacked state.
+
+    The content of each override is streamed directly out of the package file
+    (which is only opened once), so binary files are reverted as is, and the
+    reverted file is given the time stamp of the packed file.
     """
+    def _revert(self, zFile, pkg_info, override):
+        entry = pkg_info.override_file_zipinfo(override)
+        if entry is None:
+            raise KeyError("'%s' is not in the package" % override)
+
+        fname = os.path.join(sublime.packages_path(), pkg_info.name, override)
+        with zFile.open(entry.filename) as member, open(fname, "wb") as handle:
+            shutil.copyfileobj(member, handle, 64 * 1024)
+
+        os.utime(fname, (time(), entry.timestamp))
+
     def _process(self):
         pkg_info = self.args.get("pkg_info", None)
         override = self.args.get("override", None)
+        overrides = self.args.get("overrides", None)
 
-        if not pkg_info or not override:
+        if not pkg_info:
             self.result = "Nothing done; missing parameters"
-            return log("revert thread not given a package or override")
+            return log("revert thread not given a package")
 
         if not pkg_info.exists():
             self.result = "Unable to revert '%s'; no such package" % pkg_info.name
@@ -816,14 +1319,32 @@ class OverrideRevertThread(BackgroundWorkerThread):
             self.result = "Unable to revert '%s'; no overrides" % pkg_info.name
             return
 
-        try:
-            fname = os.path.join(sublime.packages_path(), pkg_info.name, override)
-            _, contents = pkg_info.packed_override_contents(override, as_list=False)
-
-            with open(fname, 'wb') as file:
-                file.write(contents.encode("utf-8"))
+        if override is None and overrides is None:
+            overrides = list(pkg_info.override_files())
 
-            self.result = "Reverted '%s/%s'" % (pkg_info.name, override)
+        try:
+            count = 0
+            with ZipFile(pkg_info.package_file()) as zFile:
+                if override is not None:
+                    self._revert(zFile, pkg_info, override)
+                    record_override_baselines(pkg_info.name, [override])
+                    self.result = "Reverted '%s/%s'" % (pkg_info.name, override)
+                    return
+
+                reverted = []
+                for name in overrides:
+                    try:
+                        self._revert(zFile, pkg_info, name)
+                        log("Reverted '%s/%s'", pkg_info.name, name)
+                        reverted.append(name)
+                        count += 1
+                    except Exception as e:
+                        log("Unable to revert '%s/%s': %s", pkg_info.name, name, str(e))
+
+                record_override_baselines(pkg_info.name, reverted)
+
+            prefix = "All" if count == len(overrides) else "%d of %d" % (count, len(overrides))
+            self.result = "%s overrides reverted in '%s'" % (prefix, pkg_info.name)
 
         except Exception as e:
             self.result = "Error while reverting: %s" % str(e)
@@ -841,24 +1362,60 @@ class ReportGenerationThread(BackgroundWorkerThread):
                          lambda thread: self._display_report(thread),
                          **kwargs)
         self.current_view = current_view
+        self.exporter = None
+
+    def run(self):
+        # When exporting, the report streams records to the export file as it
+        # goes instead of generating content for a view.
+        export = self.args.get("export", None)
+        if export is None:
+            return super().run()
+
+        try:
+            with ReportExporter(export) as self.exporter:
+                super().run()
+        except OSError as err:
+            log("Unable to export report to '%s': %s", export, str(err),
+                dialog=True)
 
     def _generation_time(self):
         return datetime.now().strftime("Report Generated: %Y-%m-%d %H:%M:%S\n")
 
     def _display_report(self, thread):
+        if self.exporter is not None:
+            return log("Exported %d report records to %s",
+                       self.exporter.records, self.exporter.filename,
+                       status=True)
+
         # Some reports don't call _set_content if they are empty
         if not hasattr(self, "content"):
             return
 
         force_reuse = self.args.get("force_reuse", False)
 
-        reuse = True if force_reuse else oa_setting("reuse_views")
-        clear = True if force_reuse else oa_setting("clear_existing")
+        reuse = True if force_reuse else self.snapshot.get("reuse_views")
+        clear = True if force_reuse else self.snapshot.get("clear_existing")
 
-        view = output_to_view(self.window, self.caption, self.content,
+        # A paged report starts out displaying its index, and can't share its
+        # view with other content.
+        content = self.content
+        pages = report_cache.pages(self.report_id) if self.paged else None
+        if pages is not None:
+            content = pages.index()
+            clear = True
+
+        view = output_to_view(self.window, self.caption, content,
                               reuse, clear, self.syntax,
                               current_view=self.current_view)
         view.settings().set("override_audit_report_type", self.report_type)
+        view.settings().set("override_audit_report_id", self.report_id)
+        view.settings().erase("override_audit_report_stale")
+        view.erase_status("override_audit_stale")
+
+        if pages is not None:
+            view.settings().set("override_audit_report_page", "")
+        else:
+            view.settings().erase("override_audit_report_page")
 
         if self.settings is not None:
             for setting,value in self.settings.items():
@@ -866,13 +1423,68 @@ class ReportGenerationThread(BackgroundWorkerThread):
 
         view.run_command("move_to", {"to": "bof"})
 
+    def _page_summary(self, overrides, expired, unknown):
+        """
+        Return the summary of the section of a package in a paged report,
+        which is displayed in the index of the report.
+        """
+        summary = "%d override%s" % (overrides, "" if overrides == 1 else "s")
+        details = ["%d %s" % (count, name) for count, name in
+                   ((expired, "expired"), (unknown, "unknown")) if count]
+        if details:
+            summary += " (%s)" % ", ".join(details)
+
+        return summary
+
+    def _page_layout(self, content, sections):
+        """
+        Given the list of items that make up a report and a list of (package,
+        summary, start, end) tuples that give the range of items that make up
+        the section of each package in it, return the layout of the pages of
+        the report (see ReportPages), or None if the report is not long enough
+        to be displayed in pages.
+        """
+        page_lines = self.snapshot.get("report_page_lines")
+        if not page_lines or not sections or len(sections) < 2:
+            return None
+
+        # Items can span lines, so find the line that each one starts on.
+        lines = [0]
+        for item in content:
+            lines.append(lines[-1] + item.count("\n") + 1)
+
+        if lines[-1] <= page_lines:
+            return None
+
+        return {
+            "header": lines[sections[0][2]],
+            "sections": [[pkg_name, summary, lines[start], lines[end]]
+                         for pkg_name, summary, start, end in sections]
+        }
+
     def _set_content(self, caption, content, report_type, syntax,
-                     settings=None):
+                     settings=None, sections=None, pkg_list=None):
+        layout = None
+        if not isinstance(content, str):
+            layout = self._page_layout(content, sections)
+            content = "\n".join(content)
+
         self.caption = caption
         self.content = content
         self.report_type = report_type
         self.syntax = syntax
         self.settings = settings
+        self.paged = layout is not None
+
+        # Cache the report so that its view can be restored in a new session
+        # without having to generate it again; this also holds the pages of a
+        # paged report. The packages are fingerprinted from the list that the
+        # report was generated from, if given.
+        packages = (settings or {}).get("override_audit_report_packages", {})
+        self.report_id = report_cache.store(caption, content, report_type,
+                                            syntax, settings,
+                                            report_fingerprints(list(packages), pkg_list),
+                                            layout)
 
 
 ###----------------------------------------------------------------------------
@@ -884,6 +1496,8 @@ class DiffExternallyThread(BackgroundWorkerThread):
     cleaning up any temporary files.
     """
     def _launch(self, base, override, diff_args):
+        import subprocess
+
         shell_cmd = diff_args.get("shell_cmd")
         env = diff_args.get("env", {})
         working_dir = diff_args.get("working_dir", "")
@@ -996,8 +1610,6 @@ class DiffExternallyThread(BackgroundWorkerThread):
         if result_code:
             log("External diff finished with return code %d", result_code)
 
-        delete_packed_override(base)
-
 
 ###----------------------------------------------------------------------------
 
@@ -1042,10 +1654,60 @@ class ContextHelper():
 
     Finds the appropriate target view and package/override/diff options based
     on where it is used.
+
+    Opening a context menu evaluates the description, visibility and enabled
+    state of every command in it, all of which resolve the same context. The
+    resolved context, the existence checks on it and the view settings that
+    are consulted are memoized and shared by all commands for the duration of
+    a single menu invocation, identified by the view, the location of the
+    event and the arguments of the command. The memoized values are discarded
+    by memo_expire(), which the event listener invokes whenever a command is
+    about to run or has run and when the selection or the active view changes,
+    so that every new menu sees the current state.
     """
     if TYPE_CHECKING:
         view: sublime.View
 
+    # The key of the menu invocation the memoized values belong to and the
+    # values themselves; these are shared by all instances.
+    _memo_key = None
+    _memo_values = {}
+
+    # The command arguments that can alter the context that is resolved.
+    _memo_args = ("pkg_name", "package", "override", "is_diff")
+
+    @classmethod
+    def _memo_reset(cls, key):
+        cls._memo_key = key
+        cls._memo_values = {}
+
+    @classmethod
+    def memo_expire(cls):
+        """
+        Discard all memoized values, so that the next menu invocation resolves
+        its context again.
+        """
+        cls._memo_reset(None)
+
+    def _memoize(self, key, compute):
+        """
+        Return the memoized value with the given key, invoking compute to
+        generate and store it if it's not already known.
+        """
+        values = ContextHelper._memo_values
+        if key not in values:
+            values[key] = compute()
+
+        return values[key]
+
+    def _setting(self, view, key, default=None):
+        """
+        Return the value of the given setting from the provided view; values
+        are memoized so that they are only deserialized once per invocation.
+        """
+        return self._memoize(("setting", view.id(), key),
+                             lambda: view.settings().get(key, default))
+
     def _extract(self, scope, event):
         if event is None:
             return None
@@ -1082,11 +1744,11 @@ class ContextHelper():
 
     def _report_type(self, **kwargs):
         target = self.view_target(self.view, **kwargs)
-        return cast(str, target.settings().get("override_audit_report_type"))
+        return cast(str, self._setting(target, "override_audit_report_type"))
 
     def _pkg_contains_expired(self, pkg_name, **kwargs):
         target = self.view_target(self.view, **kwargs)
-        expired = target.settings().get("override_audit_expired_pkgs", [])
+        expired = self._setting(target, "override_audit_expired_pkgs", [])
         return pkg_name in expired
 
     def view_target(self, view, group=-1, index=-1, **kwargs) -> sublime.View:
@@ -1104,10 +1766,27 @@ class ContextHelper():
 
         If view is none, view_target is invoked to determine it. Additionally,
         expired indicates if the override found needs to be expired or not.
+
+        The result is memoized for all commands evaluated for the same view,
+        event location and arguments until memo_expire() is invoked.
         """
         if view is None:
             view = self.view_target(self.view, **kwargs)
 
+        point = None if event is None else (event.get("x"), event.get("y"))
+        key = (view.id(), point,
+               tuple(kwargs.get(arg) for arg in self._memo_args))
+        if key != ContextHelper._memo_key:
+            ContextHelper._memo_reset(key)
+
+        return self._memoize(("context", expired),
+            lambda: self._resolve_context(view, expired, event, **kwargs))
+
+    def _resolve_context(self, view, expired, event, **kwargs):
+        """
+        Resolve and return the CommandContext tuple for the provided view and
+        event; see view_context().
+        """
         package = None
         override = None
         is_diff = None
@@ -1121,7 +1800,7 @@ class ContextHelper():
             source = "args"
 
         # Favor settings if they exist (only for non-expired)
-        elif override_group.has(view) and expired == False:
+        elif expired == False and override_group.has(view):
             package, override, is_diff = override_group.get(view)
             source = "settings"
 
@@ -1143,7 +1822,7 @@ class ContextHelper():
 
     def caption(self, caption, **kwargs):
         target = self.view_target(self.view, **kwargs)
-        menu = cast(str, target.settings().get("context_menu", ""))
+        menu = cast(str, self._setting(target, "context_menu", ""))
         if "OverrideAudit" in menu:
             return caption
 
@@ -1153,13 +1832,14 @@ class ContextHelper():
         if ctx.has_target():
             relative_name = os.path.join(ctx.package, ctx.override)
             full_name = os.path.join(sublime.packages_path(), relative_name)
-            return os.path.isfile(full_name)
+            return self._memoize(("isfile", full_name),
+                                 lambda: os.path.isfile(full_name))
 
         return False
 
     def override_unknown(self, view, ctx):
         if ctx.has_target():
-            unknowns = view.settings().get("override_audit_unknown_overrides", {})
+            unknowns = self._setting(view, "override_audit_unknown_overrides", {})
             if ctx.package in unknowns:
                 if ctx.override in unknowns[ctx.package]:
                     return True
@@ -1169,13 +1849,14 @@ class ContextHelper():
     def package_exists(self, ctx):
         if ctx.package_only():
             pkg_dir = os.path.join(sublime.packages_path(), ctx.package)
-            return os.path.isdir(pkg_dir)
+            return self._memoize(("isdir", pkg_dir),
+                                 lambda: os.path.isdir(pkg_dir))
 
         return False
 
     def package_overrides_possible(self, view, ctx):
         if ctx.package_only():
-            pkgs = view.settings().get("override_audit_report_packages", {})
+            pkgs = self._setting(view, "override_audit_report_packages", {})
             pkg_info = pkgs.get(ctx.package, {})
             return pkg_info["is_shipped"] or pkg_info["is_installed"]
 
@@ -5,9 +5,9 @@ from bisect import bisect
 import os
 
 from .pkg_popup import show_pkg_popup
-from .core import log
-from .core import delete_packed_override
-from .core import setup_override_minidiff
+from .core import log, ContextHelper
+from .core import check_potential_override, record_override_baselines
+from .core import setup_override_minidiff, large_diffs
 
 
 ###----------------------------------------------------------------------------
@@ -23,16 +23,36 @@ class OverrideAuditEventListener(sublime_plugin.EventListener):
         # Will remove existing settings if the view is no longer an override
         setup_override_minidiff(view)
 
+    def on_close(self, view):
+        # Discard the hunks of a large override diff when its view closes.
+        large_diffs.pop(view.id(), None)
+
     def on_load_async(self, view):
         # Things like PackageResourceViewer trigger on_load before the file
         # actually exists; context items are only allowed once the file is
         # actually saved.
         setup_override_minidiff(view)
 
-    def on_close(self, view):
-        tmp_base = view.settings().get("_oa_ext_diff_base", None)
-        if tmp_base is not None:
-            delete_packed_override(tmp_base)
+    # Memoized command context is only valid for a single menu invocation;
+    # running any command (including the one that opens a context menu or the
+    # command palette) or moving the selection or focus ends it.
+    def on_text_command(self, view, command_name, args):
+        ContextHelper.memo_expire()
+
+    def on_window_command(self, window, command_name, args):
+        ContextHelper.memo_expire()
+
+    def on_post_text_command(self, view, command_name, args):
+        ContextHelper.memo_expire()
+
+    def on_post_window_command(self, window, command_name, args):
+        ContextHelper.memo_expire()
+
+    def on_selection_modified(self, view):
+        ContextHelper.memo_expire()
+
+    def on_activated(self, view):
+        ContextHelper.memo_expire()
 
     def on_hover(self, view, point, hover_zone):
         if hover_zone != sublime.HOVER_TEXT:
@@ -81,7 +101,8 @@ class CreateOverrideEventListener(sublime_plugin.ViewEventListener):
         """
         Before the first save of a new override, try to create the appropriate
         unpacked folder; doing so marked this as no longer a potential new
-        override.
+        override. The packed file the override is created from is recorded as
+        its baseline.
         """
         view_filename = self.view.file_name()
         if view_filename is None:
@@ -92,8 +113,12 @@ class CreateOverrideEventListener(sublime_plugin.ViewEventListener):
             os.makedirs(path, exist_ok=True)
             self.view.settings().erase("_oa_is_new_override")
         except:
-            log("Error creating package directory for new override",
-                dialog=True)
+            return log("Error creating package directory for new override",
+                       dialog=True)
+
+        override = check_potential_override(view_filename)
+        if override is not None:
+            record_override_baselines(override[0], [override[1]])
 
     def on_modified(self):
         """
@@ -1,5 +1,6 @@
 import sublime
 
+from ..lib.packages import PackageList
 from .core import oa_setting
 
 
@@ -421,6 +422,67 @@ def _get_dependant_packages(view, details):
     return dependants
 
 
+# The popup most recently shown in each view, as a tuple of the point, link
+# name and detail flag that it was shown with, and the views with package
+# metadata loads in progress.
+_shown_popups = {}
+_metadata_loads = set()
+
+
+def _metadata_missing(view, details):
+    """
+    Given the status details of a package, return back the names of the
+    packages in the report in the given view whose metadata is needed to
+    display the package but is missing. Reports that don't display metadata
+    (e.g. the Override and Diff reports) don't gather it while they run.
+
+    A dependency needs the metadata of all packages in the report, since its
+    dependants are found from it.
+    """
+    if details.get("is_dependency", False) and "dependants" not in details:
+        packages = view.settings().get("override_audit_report_packages", {})
+        return [name for name, info in packages.items() if "metadata" not in info]
+
+    return [] if "metadata" in details else [details["name"]]
+
+
+def _load_package_metadata(view, names):
+    """
+    Load the metadata and python version of the packages with the given names
+    in the background and cache them back into the report in the given view,
+    then display the popup in the view again if it is still showing the same
+    package.
+    """
+    if view.id() in _metadata_loads:
+        return
+
+    _metadata_loads.add(view.id())
+
+    def load():
+        loaded = {}
+        try:
+            loaded = {name: (pkg_info.metadata, pkg_info.python_version)
+                      for name, pkg_info in PackageList(names)}
+        finally:
+            sublime.set_timeout(lambda: store(loaded), 1)
+
+    def store(loaded):
+        _metadata_loads.discard(view.id())
+
+        packages = view.settings().get("override_audit_report_packages", {})
+        for name, (metadata, python_version) in loaded.items():
+            if name in packages:
+                packages[name].update(metadata=metadata,
+                                      python_version=python_version)
+        view.settings().set("override_audit_report_packages", packages)
+
+        shown = _shown_popups.get(view.id())
+        if shown is not None and view.is_popup_visible():
+            show_pkg_popup(view, *shown)
+
+    sublime.set_timeout_async(load)
+
+
 def _popup_header(details):
     """
     Given the status details of a package, return back the header for the
@@ -437,7 +499,9 @@ def _popup_header(details):
     python_version = (details.get("python_version", "")
                       or "package has no plugins")
 
-    if version == "" and not details.get("is_shipped", False):
+    if "metadata" not in details:
+        version = python_version = "loading..."
+    elif version == "" and not details.get("is_shipped", False):
         version = "unknown version"
 
     name = details.get("name", "Unknown")
@@ -482,6 +546,13 @@ def _metadata(view, details):
     is_dep = details.get("is_dependency", False)
     metadata = details.get("metadata", {})
 
+    if _metadata_missing(view, details):
+        return """
+        <div class="metadata">
+            <div class="description">Loading package metadata...</div>
+        </div>
+        """
+
     if is_dep:
         title = "Dependants"
         dep_list = _get_dependant_packages(view, details)
@@ -654,7 +725,14 @@ def _render_popup(view, link_name, is_detailed):
         link_name = link_name[len("pkg:"):]
 
         pkg_details = packages.get(link_name, None)
-        return None if pkg_details is None else _expand_details(view, pkg_details, is_detailed)
+        if pkg_details is None:
+            return None
+
+        missing = _metadata_missing(view, pkg_details)
+        if missing:
+            _load_package_metadata(view, missing)
+
+        return _expand_details(view, pkg_details, is_detailed)
 
     if link_name.startswith("help:"):
         link_name = link_name[len("help:"):]
@@ -716,6 +794,7 @@ def show_pkg_popup(view, point, link_name, is_detailed):
     if not oa_setting("enable_hover_popup"):
         return
 
+    _shown_popups[view.id()] = (point, link_name, is_detailed)
     body = _render_popup(view, link_name, is_detailed)
     if body is not None:
         view.show_popup(